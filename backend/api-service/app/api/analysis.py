@@ -2,7 +2,8 @@
 Analysis API Endpoints for Senior MHealth
 """
 from fastapi import APIRouter, HTTPException, Depends, File, UploadFile
-from typing import Dict, Any, Optional
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any
 from datetime import datetime
 import logging
 import os
@@ -13,35 +14,28 @@ logger = logging.getLogger(__name__)
 # Try to import Firebase Admin SDK
 try:
     import firebase_admin
-    from firebase_admin import firestore, storage
+    from firebase_admin import storage
 
     if firebase_admin._apps:
-        db = firestore.client()
         bucket = storage.bucket()
         FIREBASE_ENABLED = True
         logger.info("Firebase integration enabled for analysis")
     else:
         FIREBASE_ENABLED = False
-        db = None
         bucket = None
         logger.warning("Firebase not initialized, using mock responses")
 except ImportError:
     FIREBASE_ENABLED = False
-    db = None
     bucket = None
     logger.warning("Firebase Admin SDK not available, using mock responses")
 except Exception as e:
     FIREBASE_ENABLED = False
-    db = None
     bucket = None
     logger.error(f"Firebase initialization error: {e}")
 
-# Import auth verification from users module
-try:
-    from .users import verify_token
-except ImportError:
-    async def verify_token(authorization: str = None) -> Optional[Dict]:
-        return {"uid": "test_user_id", "email": "test@example.com"}
+# Shared auth dependency (cached Firebase ID token verification)
+from ..core.auth import verify_token
+from ..core.database import SERVER_TIMESTAMP, DatabaseManager, get_database_manager
 
 # Router
 router = APIRouter()
@@ -49,7 +43,8 @@ router = APIRouter()
 @router.post("/storage")
 async def analyze_storage(
     data: Dict[str, Any],
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Handle storage-related analysis requests"""
     try:
@@ -59,23 +54,23 @@ async def analyze_storage(
         # Log the request
         logger.info(f"Storage analysis request from user {current_user.get('uid')}: {data}")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Store analysis request in Firestore
             analysis_doc = {
                 "user_id": current_user.get("uid"),
                 "request_data": data,
                 "status": "received",
-                "created_at": firestore.SERVER_TIMESTAMP,
-                "updated_at": firestore.SERVER_TIMESTAMP
+                "created_at": SERVER_TIMESTAMP,
+                "updated_at": SERVER_TIMESTAMP
             }
 
             # Add to analysis_requests collection
-            doc_ref = db.collection("analysis_requests").add(analysis_doc)
+            request_id = await db_manager.add_document("analysis_requests", analysis_doc)
 
             return {
                 "success": True,
                 "message": "Analysis request received",
-                "request_id": doc_ref[1].id,
+                "request_id": request_id,
                 "status": "processing"
             }
         else:
@@ -96,7 +91,8 @@ async def analyze_storage(
 @router.post("/voice")
 async def analyze_voice(
     file: UploadFile = File(...),
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Handle voice file analysis"""
     try:
@@ -109,14 +105,14 @@ async def analyze_voice(
 
         logger.info(f"Voice analysis request from user {current_user.get('uid')}: {file.filename}")
 
-        if FIREBASE_ENABLED and bucket:
+        if FIREBASE_ENABLED and bucket and db_manager.firestore_enabled:
             # Upload file to Firebase Storage
             blob_name = f"voice_analysis/{current_user.get('uid')}/{datetime.utcnow().isoformat()}_{file.filename}"
             blob = bucket.blob(blob_name)
 
             # Upload file content
             contents = await file.read()
-            blob.upload_from_string(contents, content_type=file.content_type)
+            await run_in_threadpool(blob.upload_from_string, contents, content_type=file.content_type)
 
             # Store analysis request in Firestore
             analysis_doc = {
@@ -125,16 +121,16 @@ async def analyze_voice(
                 "file_path": blob_name,
                 "file_size": len(contents),
                 "status": "uploaded",
-                "created_at": firestore.SERVER_TIMESTAMP,
-                "updated_at": firestore.SERVER_TIMESTAMP
+                "created_at": SERVER_TIMESTAMP,
+                "updated_at": SERVER_TIMESTAMP
             }
 
-            doc_ref = db.collection("voice_analysis_requests").add(analysis_doc)
+            request_id = await db_manager.add_document("voice_analysis_requests", analysis_doc)
 
             return {
                 "success": True,
                 "message": "Voice file uploaded for analysis",
-                "request_id": doc_ref[1].id,
+                "request_id": request_id,
                 "file_path": blob_name,
                 "status": "processing"
             }
@@ -157,25 +153,25 @@ async def analyze_voice(
 @router.get("/status/{request_id}")
 async def get_analysis_status(
     request_id: str,
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Get analysis status by request ID"""
     try:
         if not current_user:
             raise HTTPException(status_code=401, detail="Authentication required")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Check analysis_requests collection
-            doc = db.collection("analysis_requests").document(request_id).get()
+            data = await db_manager.get_document(f"analysis_requests/{request_id}")
 
-            if not doc.exists:
+            if data is None:
                 # Check voice_analysis_requests collection
-                doc = db.collection("voice_analysis_requests").document(request_id).get()
+                data = await db_manager.get_document(f"voice_analysis_requests/{request_id}")
 
-            if not doc.exists:
+            if data is None:
                 raise HTTPException(status_code=404, detail="Analysis request not found")
 
-            data = doc.to_dict()
             data["request_id"] = request_id
 
             return {
@@ -203,21 +199,21 @@ async def get_analysis_status(
 @router.get("/results/{request_id}")
 async def get_analysis_results(
     request_id: str,
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Get analysis results by request ID"""
     try:
         if not current_user:
             raise HTTPException(status_code=401, detail="Authentication required")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Check analysis_results collection
-            doc = db.collection("analysis_results").document(request_id).get()
+            data = await db_manager.get_document(f"analysis_results/{request_id}")
 
-            if not doc.exists:
+            if data is None:
                 raise HTTPException(status_code=404, detail="Analysis results not found")
 
-            data = doc.to_dict()
             data["request_id"] = request_id
 
             return {
@@ -1,7 +1,7 @@
 """
 User Management API Endpoints for Senior MHealth
 """
-from fastapi import APIRouter, HTTPException, Header, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, EmailStr
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 # Try to import Firebase Admin SDK
 try:
     import firebase_admin
-    from firebase_admin import credentials, firestore, auth
+    from firebase_admin import credentials
 
     # Initialize Firebase Admin SDK if not already initialized
     if not firebase_admin._apps:
@@ -35,17 +35,17 @@ try:
             firebase_admin.initialize_app()
             logger.info("Firebase Admin SDK initialized with default credentials")
 
-    db = firestore.client()
     FIREBASE_ENABLED = True
     logger.info("Firebase integration enabled")
 except ImportError:
     logger.warning("Firebase Admin SDK not installed. Using mock data.")
     FIREBASE_ENABLED = False
-    db = None
 except Exception as e:
     logger.error(f"Firebase initialization error: {e}")
     FIREBASE_ENABLED = False
-    db = None
+
+from ..core.auth import verify_token
+from ..core.database import DatabaseManager, get_database_manager
 
 # Router
 router = APIRouter()
@@ -82,30 +82,15 @@ class SeniorData(BaseModel):
     relationship: str = "parent"
     health_conditions: Optional[List[str]] = []
 
-# Helper function to verify Firebase Auth token
-async def verify_token(authorization: str = Header(None)) -> Optional[Dict]:
-    """Verify Firebase ID token from Authorization header"""
-    if not authorization or not authorization.startswith("Bearer "):
-        return None
-
-    if not FIREBASE_ENABLED:
-        # Return mock user for testing
-        return {"uid": "test_user_id", "email": "test@example.com"}
-
-    try:
-        id_token = authorization.replace("Bearer ", "")
-        decoded_token = auth.verify_id_token(id_token)
-        return decoded_token
-    except Exception as e:
-        logger.error(f"Token verification error: {e}")
-        return None
-
 # Endpoints
 @router.post("/register")
-async def register_user(registration: UserRegistration):
+async def register_user(
+    registration: UserRegistration,
+    db_manager: DatabaseManager = Depends(get_database_manager)
+):
     """Register a new user after Firebase Auth signup"""
     try:
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Generate user ID (normally comes from Firebase Auth)
             import uuid
             user_id = str(uuid.uuid4())
@@ -131,7 +116,7 @@ async def register_user(registration: UserRegistration):
                 })
 
             # Save to Firestore
-            db.collection("users").document(user_id).set(user_data)
+            await db_manager.set_document(f"users/{user_id}", user_data)
 
             return {
                 "user_id": user_id,
@@ -158,17 +143,20 @@ async def register_user(registration: UserRegistration):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{user_id}")
-async def get_user(user_id: str, current_user: Dict = Depends(verify_token)):
+async def get_user(
+    user_id: str,
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
+):
     """Get user profile"""
     try:
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Get user from Firestore
-            user_doc = db.collection("users").document(user_id).get()
+            user_data = await db_manager.get_document(f"users/{user_id}")
 
-            if not user_doc.exists:
+            if user_data is None:
                 raise HTTPException(status_code=404, detail="User not found")
 
-            user_data = user_doc.to_dict()
             user_data["user_id"] = user_id
             return user_data
         else:
@@ -192,7 +180,8 @@ async def get_user(user_id: str, current_user: Dict = Depends(verify_token)):
 async def update_user(
     user_id: str,
     user_update: Dict[str, Any],
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Update user profile"""
     try:
@@ -200,10 +189,10 @@ async def update_user(
         if current_user and current_user.get("uid") != user_id:
             raise HTTPException(status_code=403, detail="Cannot update other user's profile")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Update Firestore
             user_update["updated_at"] = datetime.utcnow()
-            db.collection("users").document(user_id).update(user_update)
+            await db_manager.update_document(f"users/{user_id}", user_update)
 
             return {
                 "message": "User updated successfully",
@@ -224,20 +213,19 @@ async def update_user(
 async def add_fcm_token(
     user_id: str,
     token_data: FCMToken,
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Add or update FCM token for push notifications"""
     try:
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Get existing user document
-            user_ref = db.collection("users").document(user_id)
-            user_doc = user_ref.get()
+            user_data = await db_manager.get_document(f"users/{user_id}")
 
-            if not user_doc.exists:
+            if user_data is None:
                 raise HTTPException(status_code=404, detail="User not found")
 
             # Get current user data
-            user_data = user_doc.to_dict()
             fcm_tokens = user_data.get("fcm_tokens", [])
 
             # Remove old token from same device if exists
@@ -253,7 +241,7 @@ async def add_fcm_token(
             fcm_tokens.append(fcm_token_entry)
 
             # Update user document
-            user_ref.update({
+            await db_manager.update_document(f"users/{user_id}", {
                 "fcm_tokens": fcm_tokens,
                 "updated_at": datetime.utcnow()
             })
@@ -276,7 +264,8 @@ async def add_fcm_token(
 @router.post("/fcm-token")
 async def add_fcm_token_auth(
     token_data: Dict[str, Any],
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Add FCM token using authenticated user's ID"""
     try:
@@ -285,22 +274,20 @@ async def add_fcm_token_auth(
 
         user_id = current_user.get("uid")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Get existing user document
-            user_ref = db.collection("users").document(user_id)
-            user_doc = user_ref.get()
+            user_data = await db_manager.get_document(f"users/{user_id}")
 
-            if not user_doc.exists:
+            if user_data is None:
                 # Create user document if it doesn't exist
-                user_ref.set({
+                user_data = {
                     "fcm_tokens": [],
                     "created_at": datetime.utcnow(),
                     "updated_at": datetime.utcnow()
-                })
-                user_doc = user_ref.get()
+                }
+                await db_manager.set_document(f"users/{user_id}", user_data)
 
             # Get current tokens
-            user_data = user_doc.to_dict()
             fcm_tokens = user_data.get("fcm_tokens", [])
 
             # Check if token already exists
@@ -315,7 +302,7 @@ async def add_fcm_token_auth(
                 fcm_tokens.append(fcm_token_entry)
 
             # Update user document
-            user_ref.update({
+            await db_manager.update_document(f"users/{user_id}", {
                 "fcm_tokens": fcm_tokens,
                 "updated_at": datetime.utcnow()
             })
@@ -341,11 +328,12 @@ async def add_fcm_token_auth(
 async def add_senior(
     caregiver_id: str,
     senior_data: SeniorData,
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Add a senior to caregiver's profile"""
     try:
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             import uuid
             senior_id = str(uuid.uuid4())
 
@@ -363,19 +351,17 @@ async def add_senior(
             }
 
             # Save to Firestore - use nested collection under user
-            db.collection("users").document(caregiver_id).collection("seniors").document(senior_id).set(senior_doc)
+            await db_manager.set_document(f"users/{caregiver_id}/seniors/{senior_id}", senior_doc)
 
             # Get current user document
-            caregiver_ref = db.collection("users").document(caregiver_id)
-            caregiver_doc = caregiver_ref.get()
+            caregiver_data = await db_manager.get_document(f"users/{caregiver_id}")
 
-            if caregiver_doc.exists:
-                caregiver_data = caregiver_doc.to_dict()
+            if caregiver_data is not None:
                 senior_ids = caregiver_data.get("senior_ids", [])
                 if senior_id not in senior_ids:
                     senior_ids.append(senior_id)
                     # Update caregiver's senior list
-                    caregiver_ref.update({
+                    await db_manager.update_document(f"users/{caregiver_id}", {
                         "senior_ids": senior_ids,
                         "updated_at": datetime.utcnow()
                     })
@@ -401,7 +387,8 @@ async def add_senior(
 @router.get("/{user_id}/seniors")
 async def get_seniors(
     user_id: str,
-    current_user: Dict = Depends(verify_token)
+    current_user: Dict = Depends(verify_token),
+    db_manager: DatabaseManager = Depends(get_database_manager)
 ):
     """Get all seniors for a caregiver"""
     try:
@@ -410,22 +397,18 @@ async def get_seniors(
         logger.info(f"Current user from token: {current_user}")
         logger.info(f"Firebase enabled: {FIREBASE_ENABLED}")
 
-        if FIREBASE_ENABLED and db:
+        if db_manager.firestore_enabled:
             # Query seniors nested collection under user
             seniors_path = f"users/{user_id}/seniors"
             logger.info(f"Querying Firestore path: {seniors_path}")
 
-            seniors_query = db.collection("users").document(user_id).collection("seniors")
-            seniors_docs = seniors_query.stream()
-
             seniors = []
             doc_count = 0
-            for doc in seniors_docs:
+            for senior_id, senior_data in await db_manager.list_documents(seniors_path):
                 doc_count += 1
-                senior_data = doc.to_dict()
-                senior_data["senior_id"] = doc.id
+                senior_data["senior_id"] = senior_id
                 seniors.append(senior_data)
-                logger.info(f"Found senior {doc_count}: {doc.id} - {senior_data.get('name', 'NO_NAME')}")
+                logger.info(f"Found senior {doc_count}: {senior_id} - {senior_data.get('name', 'NO_NAME')}")
 
             logger.info(f"Total seniors found: {doc_count}")
 
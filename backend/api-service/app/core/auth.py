@@ -0,0 +1,314 @@
+"""
+Firebase ID 토큰 검증 및 인증 의존성
+제5강: Cloud Run과 FastAPI로 확장된 백엔드 구현
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Header
+from fastapi.concurrency import run_in_threadpool
+
+from .config import settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Firebase ID 토큰 서명용 Google 공개 인증서
+FIREBASE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+)
+FIREBASE_ISSUER_PREFIX = "https://securetoken.google.com/"
+
+# 인증서 갱신 설정 (초)
+CERT_REFRESH_MARGIN = 300
+CERT_MIN_REFRESH_INTERVAL = 60
+CERT_DEFAULT_MAX_AGE = 3600
+
+
+def _firebase_app():
+    """초기화된 Firebase 앱 반환 (없으면 None)"""
+    try:
+        import firebase_admin
+    except ImportError:
+        return None
+    if not firebase_admin._apps:
+        return None
+    return firebase_admin.get_app()
+
+
+class PublicCertCache:
+    """Google 공개 인증서 캐시 (Cache-Control max-age 기준 만료)"""
+
+    def __init__(self, url: str = FIREBASE_CERTS_URL):
+        self.url = url
+        self.certs: Dict[str, str] = {}
+        self.expires_at = 0.0
+        self.fetched_at = 0.0
+        self.fetches = 0
+        self._lock = threading.Lock()
+        self._request = None
+
+    @property
+    def refresh_due_at(self) -> float:
+        """백그라운드 갱신 시각 (만료 CERT_REFRESH_MARGIN초 전)"""
+        return self.expires_at - CERT_REFRESH_MARGIN
+
+    def get(self, force_refresh: bool = False) -> Dict[str, str]:
+        """인증서 반환 (만료되었거나 force_refresh면 동기 조회)"""
+        if force_refresh or not self.certs or time.time() >= self.expires_at:
+            self.refresh(force=force_refresh)
+        return self.certs
+
+    def refresh(self, force: bool = False):
+        """
+        인증서를 다시 받아 교체 (동시 호출은 하나만 조회)
+
+        Args:
+            force: 갱신 시각 전이라도 조회 (단, CERT_MIN_REFRESH_INTERVAL초에 한 번)
+        """
+        with self._lock:
+            # 대기하는 동안 다른 스레드가 갱신했으면 생략
+            now = time.time()
+            if self.certs:
+                if force and now - self.fetched_at < CERT_MIN_REFRESH_INTERVAL:
+                    return
+                if not force and now < self.refresh_due_at:
+                    return
+
+            if self._request is None:
+                from google.auth.transport import requests as google_requests
+                self._request = google_requests.Request()
+
+            response = self._request(self.url, method="GET")
+            if response.status != 200:
+                raise ValueError(f"Failed to fetch public certificates: HTTP {response.status}")
+
+            data = response.data.decode("utf-8") if isinstance(response.data, bytes) else response.data
+            self.certs = json.loads(data)
+            self.fetched_at = time.time()
+            self.expires_at = self.fetched_at + self._max_age(response.headers)
+            self.fetches += 1
+            logger.info(f"Refreshed {len(self.certs)} Firebase public certificates")
+
+    @staticmethod
+    def _max_age(headers) -> int:
+        cache_control = headers.get("cache-control") or headers.get("Cache-Control") or ""
+        match = re.search(r"max-age=(\d+)", cache_control)
+        return int(match.group(1)) if match else CERT_DEFAULT_MAX_AGE
+
+
+class TokenCache:
+    """검증된 토큰 클레임 LRU 캐시 (키: 토큰 SHA-256, 만료: 토큰 exp)"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(id_token: str) -> str:
+        return hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or time.time() >= entry[1]:
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def put(self, key: str, claims: Dict[str, Any], expires_at: float):
+        if expires_at <= time.time():
+            return
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FirebaseTokenVerifier:
+    """
+    캐시 기반 Firebase ID 토큰 검증기
+
+    같은 토큰은 exp까지(폐기 확인 시에는 revocation_check_seconds까지) 캐시된
+    클레임을 재사용하고, 서명 검증에 쓰는 공개 인증서는 만료 전에
+    백그라운드에서 갱신하여 요청 경로에서 인증서 조회가 일어나지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        check_revoked: bool = False,
+        revocation_check_seconds: int = 300,
+        cache_size: int = 10000
+    ):
+        """
+        Args:
+            project_id: Firebase 프로젝트 ID (기본값: Firebase 앱의 프로젝트)
+            check_revoked: 토큰 폐기/사용자 비활성화 확인 여부
+            revocation_check_seconds: 폐기 확인 결과를 재사용할 최대 시간
+            cache_size: 캐시할 최대 토큰 수
+        """
+        self.project_id = project_id
+        self.check_revoked = check_revoked
+        self.revocation_check_seconds = revocation_check_seconds
+        self.cache = TokenCache(cache_size)
+        self.certs = PublicCertCache()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _project_id(self) -> str:
+        if not self.project_id:
+            app = _firebase_app()
+            self.project_id = app.project_id if app is not None else None
+        if not self.project_id:
+            raise ValueError("Firebase project ID is not configured")
+        return self.project_id
+
+    def _decode(self, id_token: str) -> Dict[str, Any]:
+        """서명, 만료, audience, issuer, subject 검증 (Firebase Admin SDK와 동일한 조건)"""
+        from google.auth import jwt
+
+        header = jwt.decode_header(id_token)
+        if header.get("alg") != "RS256":
+            raise ValueError("ID token has incorrect algorithm")
+        kid = header.get("kid")
+        if not kid:
+            raise ValueError("ID token has no 'kid' claim")
+
+        certs = self.certs.get()
+        if kid not in certs:
+            # 키 교체 직후 - 인증서를 다시 받아 확인
+            certs = self.certs.get(force_refresh=True)
+            if kid not in certs:
+                raise ValueError("ID token was signed by an unknown key")
+
+        project_id = self._project_id()
+        claims = jwt.decode(id_token, certs={kid: certs[kid]}, audience=project_id)
+
+        if claims.get("iss") != FIREBASE_ISSUER_PREFIX + project_id:
+            raise ValueError("ID token has incorrect issuer")
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise ValueError("ID token has invalid subject")
+
+        claims["uid"] = subject
+        return claims
+
+    def _verify_sync(self, id_token: str) -> Dict[str, Any]:
+        """토큰 검증 (블로킹 - 스레드 풀에서 실행)"""
+        from firebase_admin import auth
+
+        if os.getenv("FIREBASE_AUTH_EMULATOR_HOST"):
+            # 에뮬레이터 토큰은 서명이 없으므로 SDK 검증 사용
+            return auth.verify_id_token(id_token, check_revoked=self.check_revoked)
+
+        claims = self._decode(id_token)
+        if self.check_revoked:
+            user = auth.get_user(claims["uid"])
+            if user.disabled:
+                raise ValueError("User account is disabled")
+            valid_after = user.tokens_valid_after_timestamp
+            if valid_after and claims["iat"] * 1000 < valid_after:
+                raise ValueError("ID token has been revoked")
+        return claims
+
+    async def verify(self, id_token: str) -> Dict[str, Any]:
+        """
+        토큰 검증 (캐시 우선)
+
+        Raises:
+            ValueError 등: 검증 실패
+        """
+        key = TokenCache.key(id_token)
+        claims = self.cache.get(key)
+        if claims is not None:
+            return claims
+
+        claims = await run_in_threadpool(self._verify_sync, id_token)
+
+        expires_at = float(claims.get("exp", 0))
+        if self.check_revoked:
+            expires_at = min(expires_at, time.time() + self.revocation_check_seconds)
+        self.cache.put(key, claims, expires_at)
+        return claims
+
+    async def _refresh_loop(self):
+        """인증서 만료 전에 미리 갱신"""
+        while True:
+            try:
+                await run_in_threadpool(self.certs.refresh)
+                delay = max(CERT_MIN_REFRESH_INTERVAL, self.certs.refresh_due_at - time.time())
+            except Exception as e:
+                logger.warning(f"Firebase public certificate refresh failed: {e}")
+                delay = CERT_MIN_REFRESH_INTERVAL
+            await asyncio.sleep(delay)
+
+    def start(self):
+        """백그라운드 인증서 갱신 시작 (이벤트 루프 안에서 호출)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 인증서 갱신 중지"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """토큰 캐시 및 인증서 상태"""
+        return {
+            **self.cache.stats,
+            "cached_tokens": len(self.cache),
+            "check_revoked": self.check_revoked,
+            "cert_fetches": self.certs.fetches,
+            "cert_expires_in": max(0.0, self.certs.expires_at - time.time())
+        }
+
+
+# 전역 토큰 검증기 인스턴스
+token_verifier = FirebaseTokenVerifier(
+    project_id=settings.firebase_project_id,
+    check_revoked=settings.auth_check_revoked,
+    revocation_check_seconds=settings.auth_revocation_check_seconds,
+    cache_size=settings.auth_token_cache_size
+)
+
+def get_token_verifier() -> FirebaseTokenVerifier:
+    """의존성 주입을 위한 토큰 검증기 반환"""
+    return token_verifier
+
+
+async def verify_token(authorization: str = Header(None)) -> Optional[Dict]:
+    """Authorization 헤더의 Firebase ID 토큰 검증 (실패 시 None)"""
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+
+    if _firebase_app() is None:
+        # Return mock user for testing
+        return {"uid": "test_user_id", "email": "test@example.com"}
+
+    try:
+        id_token = authorization.replace("Bearer ", "")
+        return await token_verifier.verify(id_token)
+    except Exception as e:
+        logger.error(f"Token verification error: {e}")
+        return None
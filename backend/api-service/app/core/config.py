@@ -11,6 +11,27 @@ class Settings:
     port = int(os.getenv("PORT", 8080))
     environment = os.getenv("ENVIRONMENT", "development")
 
+    # Logging
+    log_level = os.getenv("LOG_LEVEL", "INFO")
+    log_format = os.getenv("LOG_FORMAT", "text")
+
+    # Google Cloud
+    google_cloud_project = os.getenv("GOOGLE_CLOUD_PROJECT")
+    storage_bucket_name = os.getenv("STORAGE_BUCKET_NAME")
+
+    # Firestore data access
+    firestore_timeout = float(os.getenv("FIRESTORE_TIMEOUT", 10))
+    firestore_slow_call_ms = float(os.getenv("FIRESTORE_SLOW_CALL_MS", 500))
+
+    # Authentication
+    firebase_project_id = os.getenv("FIREBASE_PROJECT_ID")
+    auth_check_revoked = os.getenv("AUTH_CHECK_REVOKED", "false").lower() == "true"
+    auth_revocation_check_seconds = int(os.getenv("AUTH_REVOCATION_CHECK_SECONDS", 300))
+    auth_token_cache_size = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 10000))
+
+    # Health reports
+    report_generation_enabled = os.getenv("REPORT_GENERATION_ENABLED", "true").lower() == "true"
+
     @property
     def is_production(self):
         return self.environment == "production"
@@ -3,8 +3,11 @@
 제5강: Cloud Run과 FastAPI로 확장된 백엔드 구현
 """
 
-from typing import Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 # Optional Google Cloud imports (for production)
@@ -22,14 +25,58 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# 서버 타임스탬프 센티널 (Google Cloud 미설치 시 None)
+SERVER_TIMESTAMP = firestore.SERVER_TIMESTAMP if GOOGLE_CLOUD_AVAILABLE else None
+
+
+class FirestoreCallMetrics:
+    """Firestore 호출 종류별 소요 시간 통계"""
+
+    def __init__(self, window: int = 1000, slow_call_ms: float = 500.0):
+        self.window = window
+        self.slow_call_ms = slow_call_ms
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.durations_ms: Dict[str, Deque[float]] = {}
+
+    def record(self, operation: str, elapsed_ms: float, error: bool = False):
+        self.counts[operation] = self.counts.get(operation, 0) + 1
+        if error:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+        self.durations_ms.setdefault(operation, deque(maxlen=self.window)).append(elapsed_ms)
+
+        if elapsed_ms >= self.slow_call_ms:
+            logger.warning(f"Slow Firestore call: {operation} took {elapsed_ms:.1f}ms")
+
+    def summary(self) -> Dict[str, Any]:
+        """호출 종류별 횟수, 오류 수, 평균/p95/p99/최대 소요 시간 (ms)"""
+        result = {}
+        for operation, durations in self.durations_ms.items():
+            ordered = sorted(durations)
+            result[operation] = {
+                "count": self.counts.get(operation, 0),
+                "errors": self.errors.get(operation, 0),
+                "avg_ms": sum(ordered) / len(ordered),
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+                "max_ms": ordered[-1]
+            }
+        return result
+
+
 class DatabaseManager:
     """데이터베이스 연결 및 관리 클래스"""
-    
+
     def __init__(self):
         self.db = None
+        self.async_db = None
+        # 클라이언트 생성에 실패하면 요청마다 재시도하지 않음
+        self._async_client_failed = False
         self.storage_client = None
         self.bucket_name = settings.storage_bucket_name or "senior-mhealth-storage"
-        
+        self.call_timeout = settings.firestore_timeout
+        self.metrics = FirestoreCallMetrics(slow_call_ms=settings.firestore_slow_call_ms)
+
         # Google Cloud 서비스 초기화
         if GOOGLE_CLOUD_AVAILABLE and settings.google_cloud_project:
             try:
@@ -44,24 +91,155 @@ class DatabaseManager:
         else:
             logger.info("Using mock database services (Google Cloud not available or not configured)")
 
+    def _create_async_client(self):
+        """비동기 Firestore 클라이언트 생성 (Firebase 앱이 있으면 같은 자격 증명 사용)"""
+        try:
+            import firebase_admin
+            from firebase_admin import firestore_async
+
+            if firebase_admin._apps:
+                return firestore_async.client()
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"Firebase async Firestore client initialization failed: {e}")
+
+        if GOOGLE_CLOUD_AVAILABLE and settings.google_cloud_project:
+            try:
+                return firestore.AsyncClient(project=settings.google_cloud_project)
+            except Exception as e:
+                logger.warning(f"Async Firestore client initialization failed: {e}")
+        return None
+
+    def get_async_firestore_client(self):
+        """프로세스 전체에서 공유하는 비동기 Firestore 클라이언트 반환 (없으면 None)"""
+        if self.async_db is None and not self._async_client_failed:
+            self.async_db = self._create_async_client()
+            if self.async_db is not None:
+                logger.info("Async Firestore client initialized")
+            else:
+                self._async_client_failed = True
+                logger.info("Async Firestore client unavailable, using mock responses")
+        return self.async_db
+
+    @property
+    def firestore_enabled(self) -> bool:
+        """비동기 Firestore 사용 가능 여부 (False면 라우터는 mock 응답)"""
+        return self.get_async_firestore_client() is not None
+
+    def _async_client(self):
+        client = self.get_async_firestore_client()
+        if client is None:
+            raise RuntimeError("Firestore client not initialized. Check Google Cloud configuration.")
+        return client
+
+    @asynccontextmanager
+    async def _timed(self, operation: str):
+        """호출 소요 시간을 metrics에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.metrics.record(operation, (time.perf_counter() - started) * 1000, error=True)
+            raise
+        self.metrics.record(operation, (time.perf_counter() - started) * 1000)
+
+    async def get_document(self, path: str) -> Optional[Dict[str, Any]]:
+        """문서 조회 (예: "users/{user_id}"), 없으면 None"""
+        async with self._timed("get"):
+            snapshot = await self._async_client().document(path).get(timeout=self.call_timeout)
+        return snapshot.to_dict() if snapshot.exists else None
+
+    async def list_documents(
+        self,
+        collection_path: str,
+        filters: Sequence[Tuple[str, str, Any]] = (),
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        컬렉션 조회
+
+        Args:
+            collection_path: 컬렉션 경로 (예: "users/{user_id}/seniors")
+            filters: (필드, 연산자, 값) 조건 목록
+            order_by: 정렬 필드
+            descending: 내림차순 정렬 여부
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            (문서 ID, 문서 데이터) 목록
+        """
+        query = self._async_client().collection(collection_path)
+        for field, op, value in filters:
+            query = query.where(field, op, value)
+        if order_by:
+            direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+            query = query.order_by(order_by, direction=direction)
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+        async with self._timed("list"):
+            return [(doc.id, doc.to_dict()) async for doc in query.stream(timeout=self.call_timeout)]
+
+    async def set_document(self, path: str, data: Dict[str, Any], merge: bool = False):
+        """문서 생성 또는 덮어쓰기"""
+        async with self._timed("set"):
+            await self._async_client().document(path).set(data, merge=merge, timeout=self.call_timeout)
+
+    async def update_document(self, path: str, data: Dict[str, Any]):
+        """기존 문서 필드 갱신 (문서가 없으면 NotFound)"""
+        async with self._timed("update"):
+            await self._async_client().document(path).update(data, timeout=self.call_timeout)
+
+    async def add_document(self, collection_path: str, data: Dict[str, Any]) -> str:
+        """자동 ID로 문서 추가 후 문서 ID 반환"""
+        async with self._timed("add"):
+            _, doc_ref = await self._async_client().collection(collection_path).add(
+                data, timeout=self.call_timeout
+            )
+        return doc_ref.id
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Firestore 호출 통계"""
+        return self.metrics.summary()
+
+    async def close(self):
+        """비동기 클라이언트 연결 종료 (앱 종료 시 호출)"""
+        if self.async_db is not None:
+            try:
+                # 공유 gRPC 채널 종료
+                await self.async_db._firestore_api.transport.close()
+            except Exception as e:
+                logger.warning(f"Async Firestore client close failed: {e}")
+            self.async_db = None
+        self._async_client_failed = False
+
     async def health_check(self) -> dict:
         """데이터베이스 연결 상태 확인"""
         try:
-            if self.db:
+            if self.firestore_enabled:
                 # Firestore 연결 테스트
-                test_doc = self.db.collection("_health_check").document("test")
-                test_doc.set({"timestamp": datetime.utcnow(), "status": "ok"})
-                
+                await self.set_document(
+                    "_health_check/test", {"timestamp": datetime.utcnow(), "status": "ok"}
+                )
+
                 return {
                     "firestore": "connected",
                     "storage": "connected" if self.storage_client else "not_configured",
                     "project": settings.google_cloud_project,
-                    "bucket": self.bucket_name
+                    "bucket": self.bucket_name,
+                    "metrics": self.get_metrics()
                 }
             else:
                 return {
                     "firestore": "mock_mode",
-                    "storage": "mock_mode", 
+                    "storage": "mock_mode",
                     "project": None,
                     "bucket": self.bucket_name
                 }
@@ -95,4 +273,4 @@ db_manager = DatabaseManager()
 
 def get_database_manager() -> DatabaseManager:
     """의존성 주입을 위한 데이터베이스 매니저 반환"""
-    return db_manager
\ No newline at end of file
+    return db_manager
@@ -53,6 +53,20 @@ try:
 except ImportError:
     pass  # Routes not available
 
+@app.on_event("startup")
+async def start_token_verifier():
+    """Fetch Firebase public certs in the background before the first request needs them"""
+    from app.core.auth import get_token_verifier
+    get_token_verifier().start()
+
+@app.on_event("shutdown")
+async def close_database():
+    """Close the shared async Firestore client"""
+    from app.core.auth import get_token_verifier
+    from app.core.database import get_database_manager
+    await get_token_verifier().stop()
+    await get_database_manager().close()
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8080))
@@ -96,8 +96,8 @@ class HealthReportService:
     async def _get_analyses_for_period(self, senior_id: str, period: str) -> List[dict]:
         """기간별 분석 데이터 조회"""
         # Firestore에서 분석 데이터 조회
-        analyses_ref = self.db.collection("analyses")
-        query = analyses_ref.where("senior_id", "==", senior_id)
+        if not self.db_manager.firestore_enabled:
+            return []
         
         # 기간에 따른 필터링
         if period == "weekly":
@@ -109,10 +109,11 @@ class HealthReportService:
         else:
             start_date = datetime.now() - timedelta(days=30)
         
-        query = query.where("created_at", ">=", start_date)
-        
-        docs = query.stream()
-        return [doc.to_dict() for doc in docs]
+        docs = await self.db_manager.list_documents(
+            "analyses",
+            filters=[("senior_id", "==", senior_id), ("created_at", ">=", start_date)]
+        )
+        return [data for _, data in docs]
     
     def _calculate_summary(self, analyses: List[dict]) -> dict:
         """분석 데이터 요약 계산"""
@@ -251,10 +252,8 @@ class HealthReportService:
     async def _save_to_firestore(self, report_id: str, report_data: dict):
         """Firestore에 리포트 저장"""
         try:
-            if self.db_manager.is_production_mode():
-                db = self.db_manager.get_firestore_client()
-                doc_ref = db.collection("health_reports").document(report_id)
-                doc_ref.set(report_data)
+            if self.db_manager.firestore_enabled:
+                await self.db_manager.set_document(f"health_reports/{report_id}", report_data)
                 logger.info(f"리포트 저장 완료: {report_id}")
             else:
                 # 개발 모드에서는 로그만 남김
@@ -266,13 +265,10 @@ class HealthReportService:
     async def get_report_status(self, report_id: str) -> Optional[dict]:
         """리포트 상태 조회"""
         try:
-            if self.db_manager.is_production_mode():
-                db = self.db_manager.get_firestore_client()
-                doc_ref = db.collection("health_reports").document(report_id)
-                doc = doc_ref.get()
+            if self.db_manager.firestore_enabled:
+                data = await self.db_manager.get_document(f"health_reports/{report_id}")
                 
-                if doc.exists:
-                    data = doc.to_dict()
+                if data is not None:
                     return {
                         "report_id": report_id,
                         "status": "completed" if data.get("generated_at") else "processing",
@@ -304,18 +300,20 @@ class HealthReportService:
     ) -> List[dict]:
         """시니어 리포트 히스토리 조회"""
         try:
-            if self.db_manager.is_production_mode():
-                db = self.db_manager.get_firestore_client()
-                query = db.collection("health_reports").where("senior_id", "==", senior_id)
-                
+            if self.db_manager.firestore_enabled:
+                filters = [("senior_id", "==", senior_id)]
                 if period:
-                    query = query.where("period", "==", period.value)
+                    filters.append(("period", "==", period.value))
                 
-                query = query.order_by("generated_at", direction=firestore.Query.DESCENDING)
-                query = query.limit(limit).offset(offset)
-                
-                docs = query.stream()
-                return [doc.to_dict() for doc in docs]
+                docs = await self.db_manager.list_documents(
+                    "health_reports",
+                    filters=filters,
+                    order_by="generated_at",
+                    descending=True,
+                    limit=limit,
+                    offset=offset
+                )
+                return [data for _, data in docs]
             else:
                 # Mock 데이터 반환
                 mock_reports = []
@@ -350,10 +348,8 @@ class HealthReportService:
                 "completed_count": 0
             }
             
-            if self.db_manager.is_production_mode():
-                db = self.db_manager.get_firestore_client()
-                doc_ref = db.collection("batch_analyses").document(batch_id)
-                doc_ref.set(batch_data)
+            if self.db_manager.firestore_enabled:
+                await self.db_manager.set_document(f"batch_analyses/{batch_id}", batch_data)
             
             return BatchAnalysisResponse(
                 batch_id=batch_id,
@@ -385,10 +381,8 @@ class HealthReportService:
                     results.append(result)
                     
                     # 진행률 업데이트
-                    if self.db_manager.is_production_mode():
-                        db = self.db_manager.get_firestore_client()
-                        doc_ref = db.collection("batch_analyses").document(batch_id)
-                        doc_ref.update({
+                    if self.db_manager.firestore_enabled:
+                        await self.db_manager.update_document(f"batch_analyses/{batch_id}", {
                             "completed_count": len(results),
                             "results": results
                         })
@@ -405,10 +399,8 @@ class HealthReportService:
                     })
             
             # 완료 상태로 업데이트
-            if self.db_manager.is_production_mode():
-                db = self.db_manager.get_firestore_client()
-                doc_ref = db.collection("batch_analyses").document(batch_id)
-                doc_ref.update({
+            if self.db_manager.firestore_enabled:
+                await self.db_manager.update_document(f"batch_analyses/{batch_id}", {
                     "status": "completed",
                     "completed_at": datetime.utcnow(),
                     "results": results
@@ -419,11 +411,9 @@ class HealthReportService:
         except Exception as e:
             logger.error(f"배치 분석 처리 실패: {e}")
             
-            if self.db_manager.is_production_mode():
+            if self.db_manager.firestore_enabled:
                 try:
-                    db = self.db_manager.get_firestore_client()
-                    doc_ref = db.collection("batch_analyses").document(batch_id)
-                    doc_ref.update({
+                    await self.db_manager.update_document(f"batch_analyses/{batch_id}", {
                         "status": "failed",
                         "error": str(e),
                         "completed_at": datetime.utcnow()
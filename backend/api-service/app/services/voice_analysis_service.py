@@ -33,6 +33,7 @@ except ImportError:
     httpx = None
 
 from ..core.config import settings
+from ..core.database import get_database_manager
 from ..core.logging import get_logger
 from ..models.voice_analysis import VoiceAnalysisRequest, VoiceAnalysisResponse
 
@@ -44,6 +45,7 @@ class VoiceAnalysisService:
     
     def __init__(self):
         self.enabled = settings.voice_analysis_enabled
+        self.db_manager = get_database_manager()
         self.executor = ThreadPoolExecutor(max_workers=2)
         
         # Google Cloud 서비스 초기화
@@ -307,15 +309,18 @@ class VoiceAnalysisService:
     
     async def _get_user_info(self, user_id: Optional[str], senior_id: Optional[str]) -> Dict:
         """사용자 정보 조회"""
-        if not self.firestore_client or not user_id or not senior_id:
+        if not self.db_manager.firestore_enabled or not user_id or not senior_id:
             return {"mock": True}
         
         try:
-            # 시니어 정보 조회
-            senior_doc = self.firestore_client.collection('users').document(user_id).collection('seniors').document(senior_id).get()
+            # 시니어/사용자 정보 동시 조회
+            senior_data, user_data = await asyncio.gather(
+                self.db_manager.get_document(f"users/{user_id}/seniors/{senior_id}"),
+                self.db_manager.get_document(f"users/{user_id}")
+            )
+            
             senior_info = {}
-            if senior_doc.exists:
-                senior_data = senior_doc.to_dict()
+            if senior_data is not None:
                 senior_info = {
                     'age': senior_data.get('age'),
                     'gender': senior_data.get('gender'),
@@ -323,11 +328,8 @@ class VoiceAnalysisService:
                     'relationship': senior_data.get('relationship')
                 }
             
-            # 사용자 정보 조회
-            user_doc = self.firestore_client.collection('users').document(user_id).get()
             user_info = {}
-            if user_doc.exists:
-                user_data = user_doc.to_dict()
+            if user_data is not None:
                 user_info = {
                     'age': user_data.get('age'),
                     'gender': user_data.get('gender'),
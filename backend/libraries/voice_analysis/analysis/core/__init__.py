@@ -3,6 +3,7 @@
 """
 
 from .voice_analysis import VoiceAnalyzer, VoiceFeatures
+from .feature_plan import FeaturePlan
 from .text_analysis import TextAnalyzer
 from .sincnet_analysis import SincNetAnalyzer
 from .indicators import IndicatorCalculator, MentalHealthIndicators
@@ -11,6 +12,7 @@ from .comprehensive_interpreter import ComprehensiveInterpreter
 __all__ = [
     'VoiceAnalyzer',
     'VoiceFeatures',
+    'FeaturePlan',
     'TextAnalyzer',
     'SincNetAnalyzer',
     'IndicatorCalculator',
@@ -0,0 +1,80 @@
+"""
+음성 특징 추출 계획 (Feature Plan)
+하나의 파형에 대해 STFT와 음성 활동(VAD) 구간을 한 번만 계산하고
+모든 파생 특징에서 재사용하기 위한 공유 중간 결과 캐시
+"""
+
+import logging
+from functools import cached_property
+from typing import Any, Callable, Dict
+
+import librosa
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FeaturePlan:
+    """
+    파형 단위 공유 스펙트로그램/VAD 캐시
+
+    기본 STFT는 ``hop_length`` 간격(기본 512)으로 한 번만 계산합니다.
+    ``center=True`` 인 STFT에서 ``hop_length * coarse_factor`` 간격의 프레임은
+    기본 STFT의 ``coarse_factor`` 번째 열과 정확히 일치하므로, 더 큰 홉을 쓰는
+    피치/MFCC/스펙트럴 특징은 열 간격 추출로 동일한 값을 얻습니다.
+    """
+
+    def __init__(self, y: np.ndarray, sr: int, n_fft: int = 2048,
+                 hop_length: int = 512, coarse_factor: int = 4,
+                 top_db: float = 20):
+        self.y = y
+        self.sr = sr
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.coarse_factor = coarse_factor
+        self.top_db = top_db
+        self._memo: Dict[str, Any] = {}
+
+    @property
+    def coarse_hop_length(self) -> int:
+        """피치/MFCC/스펙트럴 특징에 사용하는 홉 길이"""
+        return self.hop_length * self.coarse_factor
+
+    @property
+    def duration(self) -> float:
+        """파형 길이 (초)"""
+        return len(self.y) / self.sr
+
+    @cached_property
+    def magnitude(self) -> np.ndarray:
+        """기본 홉 간격의 진폭 스펙트로그램 (파형당 1회 계산)"""
+        return np.abs(librosa.stft(self.y, n_fft=self.n_fft, hop_length=self.hop_length))
+
+    @cached_property
+    def coarse_magnitude(self) -> np.ndarray:
+        """큰 홉 간격의 진폭 스펙트로그램 (기본 STFT에서 열 간격 추출)"""
+        return np.ascontiguousarray(self.magnitude[:, ::self.coarse_factor])
+
+    @cached_property
+    def coarse_mel_db(self) -> np.ndarray:
+        """MFCC 계산용 로그 멜 스펙트로그램"""
+        mel = librosa.feature.melspectrogram(
+            S=self.coarse_magnitude ** 2, sr=self.sr, n_fft=self.n_fft
+        )
+        return librosa.power_to_db(mel)
+
+    @cached_property
+    def speech_intervals(self) -> np.ndarray:
+        """음성 활동 구간 (파형당 1회 계산)"""
+        return librosa.effects.split(self.y, top_db=self.top_db)
+
+    @cached_property
+    def speech_time(self) -> float:
+        """음성 활동 구간의 총 길이 (초)"""
+        return sum((end - start) for start, end in self.speech_intervals) / self.sr
+
+    def memoize(self, key: str, compute: Callable[[], Any]) -> Any:
+        """동일 파형에 대해 한 번만 계산할 스칼라 특징 캐시"""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
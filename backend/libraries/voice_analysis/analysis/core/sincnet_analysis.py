@@ -20,14 +20,16 @@ class SincNetAnalyzer:
         self.models = {}
         self.sample_rate = 16000
         
-        # 모델 매니저 사용
+        self._real_analyzer = None
+        
+        # 프로세스 전역 모델 레지스트리 사용 (모델은 프로세스당 1회 로드)
         try:
-            from ..sincnet.model_manager import get_model_manager
-            self.model_manager = get_model_manager()
-            logger.info("SincNet 모델 매니저 초기화")
+            from ..sincnet.model_registry import get_model_registry
+            self.registry = get_model_registry()
+            logger.info("SincNet 모델 레지스트리 사용")
         except Exception as e:
-            logger.warning(f"모델 매니저 초기화 실패, 로컬 경로 사용: {e}")
-            self.model_manager = None
+            logger.warning(f"모델 레지스트리 초기화 실패, 로컬 경로 사용: {e}")
+            self.registry = None
             # 폴백: 로컬 경로
             base_path = Path(__file__).parent.parent / 'sincnet' / 'models'
             self.dep_model_path = base_path / 'dep_model_10500_raw.pkl'
@@ -41,31 +43,17 @@ class SincNetAnalyzer:
         try:
             models_loaded = []
             
-            if self.model_manager:
-                # Firebase Storage에서 모델 로드
-                logger.info("Firebase Storage에서 모델 로드 시작")
+            if self.registry:
+                # 레지스트리 워밍업 (이미 로드된 모델은 재사용)
+                for model_type, loaded in self.registry.warm_up().items():
+                    if loaded:
+                        self.models[model_type] = self.registry.get(model_type)
+                        models_loaded.append(model_type)
+                    else:
+                        logger.warning(f"{model_type} 모델 로드 실패")
                 
-                # 우울증 모델
-                dep_model = self.model_manager.load_model('depression')
-                if dep_model:
-                    self.models['depression'] = dep_model
-                    models_loaded.append('depression')
-                    logger.info("우울증 모델 로드 성공")
-                else:
-                    logger.warning("우울증 모델 로드 실패")
-                
-                # 불면증 모델
-                insom_model = self.model_manager.load_model('insomnia')
-                if insom_model:
-                    self.models['insomnia'] = insom_model
-                    models_loaded.append('insomnia')
-                    logger.info("불면증 모델 로드 성공")
-                else:
-                    logger.warning("불면증 모델 로드 실패")
-                    
-                # 모델 정보 로깅
-                model_info = self.model_manager.get_model_info()
-                logger.info(f"모델 정보: {model_info}")
+                # 모델 정보 로깅 (로드 시간, 상주 크기)
+                logger.info(f"모델 정보: {self.registry.get_info()}")
                 
             else:
                 # 로컬 파일에서 로드 (폴백)
@@ -101,15 +89,35 @@ class SincNetAnalyzer:
         Returns:
             우울증 및 불면증 분석 결과
         """
+        return self._analyze(audio_path=audio_path)
+    
+    def analyze_waveform(self, audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+        """
+        이미 디코딩된 파형 분석 (임시 파일 없이 메모리에서 처리)
+        
+        Args:
+            audio: 모노 파형
+            sample_rate: 파형 샘플레이트
+            
+        Returns:
+            우울증 및 불면증 분석 결과
+        """
+        return self._analyze(waveform=(audio, sample_rate))
+    
+    def _analyze(self, audio_path: Optional[str] = None,
+                 waveform: Optional[Tuple[np.ndarray, int]] = None) -> Dict[str, Any]:
+        """파일 경로 또는 파형 분석 공통 로직"""
         
         try:
-            # OriginalSincNetAnalyzer 사용
+            # OriginalSincNetAnalyzer 사용 (레지스트리의 공유 모델 사용)
             try:
-                from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
-                real_analyzer = OriginalSincNetAnalyzer()
+                real_analyzer = self._get_real_analyzer()
                 
                 # 실제 모델로 분석
-                result = real_analyzer.analyze_audio(audio_path)
+                if waveform is not None:
+                    result = real_analyzer.analyze_waveform(*waveform)
+                else:
+                    result = real_analyzer.analyze_audio(audio_path)
                 
                 if result and not result.get('error'):
                     # 실제 모델 결과 사용
@@ -129,7 +137,10 @@ class SincNetAnalyzer:
             
             # 폴백: 기존 방식
             # 오디오 로드 및 전처리
-            audio_data = self._preprocess_audio(audio_path)
+            if waveform is not None:
+                audio_data = self._preprocess_waveform(*waveform)
+            else:
+                audio_data = self._preprocess_audio(audio_path)
             
             if self.model is None:
                 # 모델이 없는 경우 분석 불가
@@ -169,12 +180,37 @@ class SincNetAnalyzer:
                 'insomnia_probability': 0.5
             }
     
+    def _get_real_analyzer(self):
+        """공유 모델을 사용하는 OriginalSincNetAnalyzer (인스턴스당 1회 생성)"""
+        if self._real_analyzer is None:
+            from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
+            self._real_analyzer = OriginalSincNetAnalyzer(registry=self.registry)
+        return self._real_analyzer
+    
+    def reload_models(self) -> Dict[str, bool]:
+        """새 체크포인트 배포 후 모델 핫 리로드"""
+        if self.registry is None:
+            return {}
+        results = self.registry.reload()
+        self._real_analyzer = None
+        self.models = {}
+        self._load_model()
+        return results
+    
     def _preprocess_audio(self, audio_path: str) -> np.ndarray:
         """오디오 전처리"""
         
         # 오디오 로드
         y, sr = librosa.load(audio_path, sr=self.sample_rate)
         
+        return self._preprocess_waveform(y, sr)
+    
+    def _preprocess_waveform(self, y: np.ndarray, sr: int) -> np.ndarray:
+        """디코딩된 파형 전처리 (정규화 및 무음 제거)"""
+        
+        if sr != self.sample_rate:
+            y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+        
         # 정규화
         y = y / (np.max(np.abs(y)) + 1e-10)
         
@@ -231,16 +267,8 @@ class SincNetAnalyzer:
         except Exception as e:
             logger.error(f"실제 모델 추론 실패: {e}")
         
-        # 폴백: OriginalSincNetAnalyzer 직접 사용
+        # 폴백: 파일 경로 없이 특징만으로는 실제 모델을 쓸 수 없으므로 기본값 반환
         try:
-            from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
-            real_analyzer = OriginalSincNetAnalyzer()
-            
-            # 오디오 파일 경로를 직접 전달
-            # features 딕셔너리에서 파일 경로를 찾거나 임시 파일 사용
-            import tempfile
-            import soundfile as sf
-            
             # 간단한 기본값 반환
             return {
                 'depression': 0.4,
@@ -10,6 +10,8 @@ import logging
 from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from .feature_plan import FeaturePlan
+
 # Suppress librosa deprecation warnings
 warnings.filterwarnings('ignore', message='.*__audioread_load.*')
 warnings.filterwarnings('ignore', category=FutureWarning, module='librosa')
@@ -75,27 +77,116 @@ class VoiceAnalyzer:
             logger.info(f"Large 모드: 청킹 방식 사용 ({file_size_mb:.1f}MB)")
             return self._analyze_large_file(audio_path, file_size_mb)
     
+    def analyze_waveform(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+        """
+        이미 디코딩된 파형 분석 (길이에 따른 적응형 처리)
+        
+        파일 경로 기반 analyze()와 같은 전략을 사용하되, 파일 크기 대신
+        길이 기준으로 분기합니다 (약 1MB ≈ 1분 통화 녹음).
+        
+        Args:
+            y: 모노 파형
+            sr: 샘플레이트
+            
+        Returns:
+            분석된 음성 특징 딕셔너리
+        """
+        try:
+            if sr != self.sample_rate:
+                y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+                sr = self.sample_rate
+            
+            duration = len(y) / sr
+            logger.info(f"음성 분석 시작 (메모리 파형): {duration:.1f}초")
+            
+            if duration <= 60:
+                logger.info("Quick 모드: 전체 분석 수행")
+                return self._analyze_full_waveform(y, sr)
+            elif duration <= 180:
+                logger.info("Medium 모드: 최적화된 분석 수행")
+                y_fast = librosa.resample(y, orig_sr=sr, target_sr=8000)
+                return {
+                    'status': 'success',
+                    'features': self._extract_optimized_features(y_fast, 8000, duration),
+                    'sample_rate': 8000,
+                    'duration': duration,
+                    'analysis_method': 'optimized'
+                }
+            else:
+                logger.info(f"Large 모드: 청킹 방식 사용 ({duration:.1f}초)")
+                return self._analyze_chunked_waveform(y, sr)
+                
+        except Exception as e:
+            logger.error(f"음성 분석 실패: {e}")
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
+    
+    def _analyze_full_waveform(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+        """파형 전체 분석 (특징 추출 + 시니어 특화 분석)"""
+        # 공유 STFT/VAD 계획 (특징 추출과 시니어 특화 분석에서 재사용)
+        plan = FeaturePlan(y, sr, n_fft=self.frame_length, hop_length=self.hop_length)
+        
+        # 음성 특징 추출
+        features = self._extract_features(y, sr, plan)
+        
+        # 시니어 특화 분석
+        senior_features = self._analyze_senior_specific(y, sr, plan)
+        features.update(senior_features)
+        
+        return {
+            'status': 'success',
+            'features': features,
+            'sample_rate': sr,
+            'duration': len(y) / sr,
+            'analysis_method': 'full'
+        }
+    
+    def _analyze_chunked_waveform(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+        """긴 파형 청킹 분석 (_analyze_large_file과 동일한 청크 전략)"""
+        total_duration = len(y) / sr
+        
+        # 길이에 따른 적응형 청크 설정 (메모리 최적화)
+        if total_duration < 300:
+            chunk_duration = 10.0
+        elif total_duration < 600:
+            chunk_duration = 5.0
+        else:
+            chunk_duration = 3.0
+        overlap = 0.5
+        
+        chunk_features = []
+        current_offset = 0.0
+        while current_offset < total_duration:
+            start = int(current_offset * sr)
+            end = int(min(current_offset + chunk_duration, total_duration) * sr)
+            y_chunk = y[start:end]
+            if len(y_chunk) > 0:
+                chunk_features.append(self._extract_features(y_chunk, sr))
+            current_offset += (chunk_duration - overlap)
+        
+        if not chunk_features:
+            raise ValueError("청크 분석 실패")
+        
+        return {
+            'status': 'success',
+            'duration': total_duration,
+            'sample_rate': sr,
+            'features': self._aggregate_chunk_features(chunk_features),
+            'analysis_method': 'chunked',
+            'chunk_count': len(chunk_features)
+        }
+    
     def _analyze_small_file(self, audio_path: str, file_size_mb: float) -> Dict[str, Any]:
         """작은 파일 분석 (1분 이하) - 전체 분석"""
         try:
             # 오디오 로드
             y, sr = librosa.load(audio_path, sr=self.sample_rate)
             
-            # 음성 특징 추출
-            features = self._extract_features(y, sr)
-            
-            # 시니어 특화 분석
-            senior_features = self._analyze_senior_specific(y, sr)
-            features.update(senior_features)
-            
-            return {
-                'status': 'success',
-                'features': features,
-                'sample_rate': sr,
-                'duration': len(y) / sr,
-                'analysis_method': 'full',
-                'file_size_mb': file_size_mb
-            }
+            result = self._analyze_full_waveform(y, sr)
+            result['file_size_mb'] = file_size_mb
+            return result
             
         except Exception as e:
             logger.error(f"음성 분석 실패: {e}")
@@ -114,60 +205,7 @@ class VoiceAnalyzer:
             # 다운샘플링으로 빠른 로드 (16kHz -> 8kHz)
             y, sr = librosa.load(audio_path, sr=8000)
             
-            # 빠른 피치 추출 (더 큰 홉 길이)
-            hop_length = self.hop_length * 8  # 더 큰 홉으로 빠르게
-            pitches, magnitudes = librosa.piptrack(
-                y=y, sr=sr, 
-                hop_length=hop_length,
-                fmin=50, fmax=400
-            )
-            
-            # 피치 통계
-            max_indices = np.argmax(magnitudes, axis=0)
-            pitch_values = pitches[max_indices, np.arange(pitches.shape[1])]
-            pitch_values = pitch_values[pitch_values > 0]
-            
-            # 에너지 계산
-            energy = librosa.feature.rms(y=y, hop_length=hop_length)[0]
-            
-            # 간소화된 MFCC (더 적은 계수)
-            mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=6, hop_length=hop_length)
-            
-            # 기본 스펙트럴 특징
-            spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length)[0]
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr, hop_length=hop_length)[0]
-            zcr = librosa.feature.zero_crossing_rate(y, hop_length=hop_length)[0]
-            
-            # 빠른 발화 속도 계산 (음성 활동 비율)
-            intervals = librosa.effects.split(y, top_db=25)
-            speech_time = sum((end - start) for start, end in intervals) / sr
-            pause_ratio = 1 - (speech_time / duration) if duration > 0 else 0
-            
-            # 간소화된 발화 속도 추정 (음절 수 기반)
-            syllable_count = 0
-            for interval in intervals:
-                interval_duration = (interval[1] - interval[0]) / sr
-                syllable_count += interval_duration / 0.2  # 한국어 평균 음절 길이
-            speaking_rate = syllable_count / duration if duration > 0 else 0
-            
-            # 피치 값 검증
-            if len(pitch_values) == 0:
-                logger.warning("Medium 모드: 피치 추출 실패 - 무음/노이즈 구간으로 추정")
-            
-            features = {
-                'pitch_mean': float(np.mean(pitch_values)) if len(pitch_values) > 0 else 0.0,
-                'pitch_std': float(np.std(pitch_values)) if len(pitch_values) > 0 else 0.0,
-                'energy_mean': float(np.mean(energy)),
-                'energy_std': float(np.std(energy)),
-                'mfcc_mean': np.mean(mfccs, axis=1).tolist(),
-                'mfcc_std': np.std(mfccs, axis=1).tolist(),
-                'spectral_centroid_mean': float(np.mean(spectral_centroids)),
-                'spectral_rolloff_mean': float(np.mean(spectral_rolloff)),
-                'zcr_mean': float(np.mean(zcr)),
-                'speaking_rate': float(speaking_rate),
-                'pause_ratio': float(pause_ratio),
-                # 간소화 분석에서는 복잡한 특징 생략 (키는 제거)
-            }
+            features = self._extract_optimized_features(y, sr, duration)
             
             return {
                 'status': 'success',
@@ -182,14 +220,86 @@ class VoiceAnalyzer:
             logger.error(f"중간 파일 분석 실패: {e}")
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_features(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
-        """기본 음성 특징 추출 (최적화된 버전)"""
+    def _extract_optimized_features(self, y: np.ndarray, sr: int, duration: float) -> Dict[str, Any]:
+        """간소화된 특징 추출 (Medium 모드, 다운샘플링된 파형, 단일 STFT 공유)"""
+        # 더 큰 홉으로 빠르게 - 이 홉 간격의 STFT 한 번을 피치/MFCC/스펙트럴 특징이 공유
+        hop_length = self.hop_length * 8
+        plan = FeaturePlan(y, sr, n_fft=self.frame_length, hop_length=hop_length,
+                           coarse_factor=1, top_db=25)
+        
+        # 빠른 피치 추출
+        pitches, magnitudes = librosa.piptrack(
+            S=plan.coarse_magnitude, sr=sr,
+            n_fft=plan.n_fft,
+            hop_length=hop_length,
+            fmin=50, fmax=400
+        )
+        
+        # 피치 통계
+        max_indices = np.argmax(magnitudes, axis=0)
+        pitch_values = pitches[max_indices, np.arange(pitches.shape[1])]
+        pitch_values = pitch_values[pitch_values > 0]
+        
+        # 에너지 계산 (시간 영역 RMS, STFT 불필요)
+        energy = librosa.feature.rms(y=y, hop_length=hop_length)[0]
+        
+        # 간소화된 MFCC (더 적은 계수, 공유 멜 스펙트로그램 사용)
+        mfccs = librosa.feature.mfcc(S=plan.coarse_mel_db, n_mfcc=6)
+        
+        # 기본 스펙트럴 특징 (공유 스펙트로그램 사용)
+        spectral_centroids = librosa.feature.spectral_centroid(
+            S=plan.coarse_magnitude, sr=sr, n_fft=plan.n_fft, hop_length=hop_length
+        )[0]
+        spectral_rolloff = librosa.feature.spectral_rolloff(
+            S=plan.coarse_magnitude, sr=sr, n_fft=plan.n_fft, hop_length=hop_length
+        )[0]
+        zcr = librosa.feature.zero_crossing_rate(y, hop_length=hop_length)[0]
+        
+        # 빠른 발화 속도 계산 (음성 활동 비율)
+        intervals = plan.speech_intervals
+        speech_time = plan.speech_time
+        pause_ratio = 1 - (speech_time / duration) if duration > 0 else 0
+        
+        # 간소화된 발화 속도 추정 (음절 수 기반)
+        syllable_count = 0
+        for interval in intervals:
+            interval_duration = (interval[1] - interval[0]) / sr
+            syllable_count += interval_duration / 0.2  # 한국어 평균 음절 길이
+        speaking_rate = syllable_count / duration if duration > 0 else 0
+        
+        # 피치 값 검증
+        if len(pitch_values) == 0:
+            logger.warning("Medium 모드: 피치 추출 실패 - 무음/노이즈 구간으로 추정")
+        
+        features = {
+            'pitch_mean': float(np.mean(pitch_values)) if len(pitch_values) > 0 else 0.0,
+            'pitch_std': float(np.std(pitch_values)) if len(pitch_values) > 0 else 0.0,
+            'energy_mean': float(np.mean(energy)),
+            'energy_std': float(np.std(energy)),
+            'mfcc_mean': np.mean(mfccs, axis=1).tolist(),
+            'mfcc_std': np.std(mfccs, axis=1).tolist(),
+            'spectral_centroid_mean': float(np.mean(spectral_centroids)),
+            'spectral_rolloff_mean': float(np.mean(spectral_rolloff)),
+            'zcr_mean': float(np.mean(zcr)),
+            'speaking_rate': float(speaking_rate),
+            'pause_ratio': float(pause_ratio),
+            # 간소화 분석에서는 복잡한 특징 생략 (키는 제거)
+        }
+        
+        return features
+    
+    def _extract_features(self, y: np.ndarray, sr: int,
+                          plan: Optional[FeaturePlan] = None) -> Dict[str, Any]:
+        """기본 음성 특징 추출 (최적화된 버전, 단일 STFT 공유)"""
+        if plan is None:
+            plan = FeaturePlan(y, sr, n_fft=self.frame_length, hop_length=self.hop_length)
         
         # 피치 추출 (최적화: 더 적은 프레임으로 빠르게)
-        # piptrack 대신 더 빠른 방법 사용
-        hop_length = self.hop_length * 4  # 더 큰 홉 길이로 빠르게
+        # 더 큰 홉 길이의 스펙트로그램은 공유 STFT에서 열 간격 추출로 얻음
+        hop_length = plan.coarse_hop_length
         pitches, magnitudes = librosa.piptrack(
-            y=y, sr=sr, 
+            S=plan.coarse_magnitude, sr=sr,
+            n_fft=plan.n_fft,
             hop_length=hop_length,
             fmin=50,  # 최소 주파수 제한
             fmax=400  # 최대 주파수 제한 (음성 범위)
@@ -209,39 +319,38 @@ class VoiceAnalyzer:
             pitch_mean = np.mean(pitch_values)
             pitch_std = np.std(pitch_values)
         
-        # 에너지 계산
+        # 에너지 계산 (시간 영역 RMS, STFT 불필요)
         energy = librosa.feature.rms(y=y)[0]
         energy_mean = np.mean(energy)
         energy_std = np.std(energy)
         
-        # MFCC 추출 (최적화: 더 적은 계수)
+        # MFCC 추출 (최적화: 더 적은 계수, 공유 멜 스펙트로그램 사용)
         mfccs = librosa.feature.mfcc(
-            y=y, sr=sr, 
-            n_mfcc=8,  # 13에서 8로 줄임
-            hop_length=hop_length  # 동일한 홉 길이 사용
+            S=plan.coarse_mel_db,
+            n_mfcc=8  # 13에서 8로 줄임
         )
         mfcc_mean = np.mean(mfccs, axis=1)
         mfcc_std = np.std(mfccs, axis=1)
         
-        # 스펙트럴 특징 (최적화: 동일한 홉 길이)
+        # 스펙트럴 특징 (공유 스펙트로그램 사용)
         spectral_centroids = librosa.feature.spectral_centroid(
-            y=y, sr=sr, hop_length=hop_length
+            S=plan.coarse_magnitude, sr=sr, n_fft=plan.n_fft, hop_length=hop_length
         )[0]
         spectral_rolloff = librosa.feature.spectral_rolloff(
-            y=y, sr=sr, hop_length=hop_length
+            S=plan.coarse_magnitude, sr=sr, n_fft=plan.n_fft, hop_length=hop_length
         )[0]
         
         # Zero Crossing Rate (음성 품질 지표)
         zcr = librosa.feature.zero_crossing_rate(y)[0]
         
         # 발화 속도 계산 (청크에서도 필요)
-        speaking_rate = self._calculate_speaking_rate(y, sr)
+        speaking_rate = self._calculate_speaking_rate(y, sr, plan)
         
         # 휴지 비율 계산 (청크에서도 필요)
-        pause_ratio = self._calculate_pause_ratio(y, sr)
+        pause_ratio = self._calculate_pause_ratio(y, sr, plan)
         
         # 음성 명료도 (청크에서도 필요)
-        voice_clarity = self._analyze_voice_clarity(y, sr)
+        voice_clarity = self._analyze_voice_clarity(y, sr, plan)
         
         return {
             'pitch_mean': float(pitch_mean),
@@ -258,20 +367,23 @@ class VoiceAnalyzer:
             'voice_quality': float(voice_clarity)
         }
     
-    def _analyze_senior_specific(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_senior_specific(self, y: np.ndarray, sr: int,
+                                 plan: Optional[FeaturePlan] = None) -> Dict[str, Any]:
         """시니어 특화 음성 분석"""
+        if plan is None:
+            plan = FeaturePlan(y, sr, n_fft=self.frame_length, hop_length=self.hop_length)
         
         # 음성 떨림 (tremor) 분석
         tremor_features = self._analyze_tremor(y, sr)
         
-        # 발화 속도 분석
-        speaking_rate = self._calculate_speaking_rate(y, sr)
+        # 발화 속도 분석 (공유 VAD 구간 재사용)
+        speaking_rate = self._calculate_speaking_rate(y, sr, plan)
         
-        # 휴지(pause) 비율 계산
-        pause_ratio = self._calculate_pause_ratio(y, sr)
+        # 휴지(pause) 비율 계산 (공유 VAD 구간 재사용)
+        pause_ratio = self._calculate_pause_ratio(y, sr, plan)
         
-        # 음성 명료도 분석
-        clarity_score = self._analyze_voice_clarity(y, sr)
+        # 음성 명료도 분석 (_extract_features에서 계산한 값 재사용)
+        clarity_score = self._analyze_voice_clarity(y, sr, plan)
         
         return {
             'tremor_amplitude': tremor_features.get('amplitude', 0),
@@ -317,11 +429,15 @@ class VoiceAnalyzer:
             # 떨림 분석 실패 시 기본값 반환 (완전 실패보다 나음)
             return {'frequency': 0.0, 'amplitude': 0.0}
     
-    def _calculate_speaking_rate(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_speaking_rate(self, y: np.ndarray, sr: int,
+                                 plan: Optional[FeaturePlan] = None) -> float:
         """발화 속도 계산"""
         try:
             # 음성 활동 구간 검출
-            intervals = librosa.effects.split(y, top_db=20)
+            if plan is not None:
+                intervals = plan.speech_intervals
+            else:
+                intervals = librosa.effects.split(y, top_db=20)
             
             # 음절 수 추정 (한국어 기준)
             syllable_count = 0
@@ -338,14 +454,16 @@ class VoiceAnalyzer:
             logger.warning(f"발화 속도 계산 실패: {e}")
             return 0.0  # 실패 시 0 반환
     
-    def _calculate_pause_ratio(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_pause_ratio(self, y: np.ndarray, sr: int,
+                               plan: Optional[FeaturePlan] = None) -> float:
         """휴지 비율 계산"""
         try:
-            # 음성 활동 구간 검출
-            intervals = librosa.effects.split(y, top_db=20)
-            
-            # 총 음성 시간 계산
-            speech_time = sum((end - start) for start, end in intervals) / sr
+            # 총 음성 시간 계산 (음성 활동 구간 기준)
+            if plan is not None:
+                speech_time = plan.speech_time
+            else:
+                intervals = librosa.effects.split(y, top_db=20)
+                speech_time = sum((end - start) for start, end in intervals) / sr
             total_time = len(y) / sr
             
             # 휴지 비율
@@ -356,11 +474,22 @@ class VoiceAnalyzer:
             logger.warning(f"휴지 비율 계산 실패: {e}")
             return 0.0  # 실패 시 0 반환
     
-    def _analyze_voice_clarity(self, y: np.ndarray, sr: int) -> float:
-        """음성 명료도 분석"""
+    def _analyze_voice_clarity(self, y: np.ndarray, sr: int,
+                               plan: Optional[FeaturePlan] = None) -> float:
+        """음성 명료도 분석 (plan이 주어지면 파형당 1회만 계산)"""
+        if plan is not None:
+            return plan.memoize(
+                'voice_clarity',
+                lambda: self._compute_voice_clarity(y, sr, plan.magnitude)
+            )
+        return self._compute_voice_clarity(y, sr)
+    
+    def _compute_voice_clarity(self, y: np.ndarray, sr: int,
+                               magnitude: Optional[np.ndarray] = None) -> float:
+        """음성 명료도 점수 계산"""
         try:
             # 스펙트럴 엔트로피 (낮을수록 명료)
-            spectral_entropy = self._calculate_spectral_entropy(y, sr)
+            spectral_entropy = self._calculate_spectral_entropy(y, sr, magnitude)
             
             # Harmonics-to-Noise Ratio (HNR)
             hnr = self._calculate_hnr(y, sr)
@@ -374,12 +503,13 @@ class VoiceAnalyzer:
             logger.warning(f"명료도 분석 실패: {e}")
             return 0.5  # 실패 시 중간값 반환
     
-    def _calculate_spectral_entropy(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_spectral_entropy(self, y: np.ndarray, sr: int,
+                                    magnitude: Optional[np.ndarray] = None) -> float:
         """스펙트럴 엔트로피 계산"""
         try:
-            # STFT
-            D = librosa.stft(y)
-            magnitude = np.abs(D)
+            # STFT (공유 스펙트로그램이 있으면 재사용)
+            if magnitude is None:
+                magnitude = np.abs(librosa.stft(y))
             
             # 정규화
             magnitude_norm = magnitude / np.sum(magnitude, axis=0, keepdims=True)
@@ -0,0 +1,226 @@
+"""
+파이프라인 실행기 관리 모듈
+파이프라인 수명 동안 유지되는 프로세스 풀(GIL 제약 CPU 작업)과
+스레드 풀(I/O 및 경량 작업)을 관리
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 분석기 (워커 초기화 시 1회 생성)
+_worker_analyzers: Dict[str, Any] = {}
+
+# 기본 프로세스 풀 크기 상한 (워커마다 SincNet 모델을 따로 로드하므로 코어 수만큼 늘리지 않음)
+MAX_DEFAULT_PROCESS_WORKERS = 4
+
+
+def default_process_workers() -> int:
+    """기본 프로세스 풀 크기 (PIPELINE_PROCESS_WORKERS 환경 변수, 없으면 min(4, 코어 수))"""
+    configured = os.getenv('PIPELINE_PROCESS_WORKERS')
+    if configured:
+        return max(1, int(configured))
+    return min(MAX_DEFAULT_PROCESS_WORKERS, os.cpu_count() or 2)
+
+
+def _get_worker_analyzer(name: str) -> Any:
+    """워커 로컬 분석기 반환 (없으면 생성)"""
+    analyzer = _worker_analyzers.get(name)
+    if analyzer is None:
+        if name == 'voice':
+            from ..core.voice_analysis import VoiceAnalyzer
+            analyzer = VoiceAnalyzer()
+        elif name == 'sincnet':
+            from ..core.sincnet_analysis import SincNetAnalyzer
+            analyzer = SincNetAnalyzer()
+        else:
+            raise ValueError(f"알 수 없는 분석기: {name}")
+        _worker_analyzers[name] = analyzer
+    return analyzer
+
+
+def _init_worker(warmup: bool, use_sincnet: bool, torch_threads: Optional[int]) -> None:
+    """워커 프로세스 초기화 (스레드 수 제한 및 모델 워밍업)"""
+    if torch_threads:
+        try:
+            import torch
+            torch.set_num_threads(torch_threads)
+        except ImportError:
+            pass
+
+    if not warmup:
+        return
+
+    try:
+        _get_worker_analyzer('voice')
+        if use_sincnet:
+            _get_worker_analyzer('sincnet')
+        logger.info(f"워커 워밍업 완료 (pid={os.getpid()})")
+    except Exception as e:
+        logger.warning(f"워커 워밍업 실패 (pid={os.getpid()}): {e}")
+
+
+def run_voice_analysis(audio_path: str) -> Dict[str, Any]:
+    """워커에서 음성 특징 분석 실행"""
+    return _get_worker_analyzer('voice').analyze(audio_path)
+
+
+def run_sincnet_analysis(audio_path: str) -> Dict[str, Any]:
+    """워커에서 SincNet 분석 실행"""
+    return _get_worker_analyzer('sincnet').analyze(audio_path)
+
+
+def run_voice_waveform_analysis(samples: Any, sample_rate: int) -> Dict[str, Any]:
+    """워커에서 디코딩된 파형의 음성 특징 분석 실행"""
+    return _get_worker_analyzer('voice').analyze_waveform(samples, sample_rate)
+
+
+def run_sincnet_waveform_analysis(samples: Any, sample_rate: int) -> Dict[str, Any]:
+    """워커에서 디코딩된 파형의 SincNet 분석 실행"""
+    return _get_worker_analyzer('sincnet').analyze_waveform(samples, sample_rate)
+
+
+class PipelineExecutors:
+    """
+    파이프라인 실행기 서브시스템
+
+    - 프로세스 풀: librosa/numpy/SincNet 등 GIL을 점유하는 특징 추출 작업
+    - 스레드 풀: 동기 I/O 호출과 지표 계산 등 경량 작업
+
+    풀은 첫 사용 시 생성되어 ``shutdown()`` 호출 전까지 재사용됩니다.
+    프로세스 풀을 사용할 수 없는 환경에서는 스레드 풀로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        use_processes: bool = True,
+        warmup: bool = True,
+        use_sincnet: bool = True,
+        torch_threads: Optional[int] = 1,
+        start_method: str = 'spawn'
+    ):
+        """
+        Args:
+            process_workers: 프로세스 풀 크기 (기본값: default_process_workers())
+            thread_workers: 스레드 풀 크기 (기본값: 코어 수 * 4, 최대 32)
+            use_processes: False면 CPU 작업도 스레드 풀에서 실행
+            warmup: 워커 시작 시 분석기/모델 미리 로드
+            use_sincnet: 워밍업 시 SincNet 모델 포함 여부
+            torch_threads: 워커별 torch intra-op 스레드 수
+            start_method: 워커 프로세스 시작 방식 (torch와 fork 충돌 방지를 위해 spawn)
+        """
+        cpu_count = os.cpu_count() or 2
+        self.process_workers = process_workers or default_process_workers()
+        self.thread_workers = thread_workers or min(32, cpu_count * 4)
+        self.use_processes = use_processes
+        self.warmup = warmup
+        self.use_sincnet = use_sincnet
+        self.torch_threads = torch_threads
+        self.start_method = start_method
+
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """I/O 및 경량 작업용 스레드 풀"""
+        self._check_open()
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix='pipeline-io'
+            )
+        return self._thread_pool
+
+    @property
+    def cpu_pool(self) -> Executor:
+        """GIL 제약 CPU 작업용 풀 (프로세스 풀 사용 불가 시 스레드 풀)"""
+        self._check_open()
+        if not self.use_processes:
+            return self.thread_pool
+        if self._process_pool is None:
+            try:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    initargs=(self.warmup, self.use_sincnet, self.torch_threads)
+                )
+                logger.info(f"프로세스 풀 시작: {self.process_workers}개 워커")
+            except (OSError, ValueError, NotImplementedError) as e:
+                logger.warning(f"프로세스 풀 생성 실패, 스레드 풀 사용: {e}")
+                self.use_processes = False
+                return self.thread_pool
+        return self._process_pool
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("PipelineExecutors가 이미 종료되었습니다")
+
+    def start(self) -> None:
+        """풀을 미리 생성하고 워커 워밍업 시작"""
+        self.thread_pool
+        pool = self.cpu_pool
+        if isinstance(pool, ProcessPoolExecutor) and self.warmup:
+            # 모든 워커가 기동되어 initializer가 실행되도록 빈 작업 제출
+            for _ in range(self.process_workers):
+                pool.submit(os.getpid)
+
+    async def run_cpu(self, func: Callable, *args: Any,
+                      local_func: Optional[Callable] = None) -> Any:
+        """
+        CPU 집약적인 함수 실행 (프로세스 풀)
+
+        프로세스 풀에서는 ``func``와 인자가 피클 가능해야 하므로
+        모듈 수준 함수(``run_voice_analysis`` 등)를 사용합니다.
+        스레드 풀로 대체된 경우 ``local_func``가 있으면 대신 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self.cpu_pool
+        if pool is self._thread_pool and local_func is not None:
+            func = local_func
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # 워커 비정상 종료 시 풀을 재생성하고 1회 재시도
+            logger.error("프로세스 풀 손상 감지 - 풀 재생성 후 재시도")
+            # 다른 단계가 이미 새 풀을 만들었다면 그 풀은 유지
+            if self._process_pool is pool:
+                self._process_pool = None
+            pool.shutdown(wait=False)
+            return await loop.run_in_executor(self.cpu_pool, func, *args)
+
+    async def run_io(self, func: Callable, *args: Any) -> Any:
+        """동기 I/O 또는 경량 작업 실행 (스레드 풀)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """모든 풀 종료"""
+        self._closed = True
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+        logger.info("파이프라인 실행기 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행기 설정/상태 반환"""
+        return {
+            'process_workers': self.process_workers if self.use_processes else 0,
+            'thread_workers': self.thread_workers,
+            'process_pool_active': self._process_pool is not None,
+            'thread_pool_active': self._thread_pool is not None,
+            'closed': self._closed
+        }
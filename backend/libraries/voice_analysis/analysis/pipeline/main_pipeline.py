@@ -6,7 +6,9 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import os
+import time
+from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 import traceback
@@ -21,9 +23,19 @@ from ..core import (
 from ..core.comprehensive_interpreter import ComprehensiveInterpreter
 from ..utils.api_connectors import GoogleCloudSpeechConnector
 from ..utils.firestore_connector import FirestoreConnector
+from ..utils.audio_asset import AudioAsset
 from .speaker_identifier import SpeakerIdentifier
 from .report_generator import ReportGenerator
+from .executors import (
+    PipelineExecutors,
+    run_voice_analysis,
+    run_sincnet_analysis,
+    run_voice_waveform_analysis,
+    run_sincnet_waveform_analysis
+)
+from .stage_graph import StageGraph
 from ..timeseries.trend_analyzer import TrendAnalyzer
+from ..timeseries.trend_store import TrendStore
 from ..mental_health.optimized_weight_calculator import (
     OptimizedWeightCalculator,
     DataQuality,
@@ -66,6 +78,29 @@ class SeniorMentalHealthPipeline:
         # RAG 옵션 (기본값: False)
         self.config.setdefault('use_rag', False)
 
+        # 동시 실행 제한 (일괄 분석 및 단계별 세마포어)
+        self.config.setdefault('batch_concurrency', 4)        # 동시에 진행할 분석 수
+        self.config.setdefault('stt_concurrency', 8)          # 동시 STT 요청 수
+        self.config.setdefault('llm_concurrency', 8)          # 동시 LLM 요청 수
+        self.config.setdefault('cpu_concurrency', os.cpu_count() or 2)  # 동시 CPU 특징 추출 수
+        # STT 결과 캐시 사용 여부 (False면 항상 STT 재실행)
+        self.config.setdefault('use_stt_cache', True)
+        self._stage_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stage_semaphore_loop = None
+
+        # 장기 실행 풀 (CPU 특징 추출용 프로세스 풀 + I/O용 스레드 풀)
+        self.config.setdefault('use_process_pool', True)
+        self.config.setdefault('cpu_process_workers', None)  # None: default_process_workers()
+        self.config.setdefault('io_thread_workers', None)
+        self.config.setdefault('warmup_workers', True)
+        self.executors = PipelineExecutors(
+            process_workers=self.config['cpu_process_workers'],
+            thread_workers=self.config['io_thread_workers'],
+            use_processes=self.config['use_process_pool'],
+            warmup=self.config['warmup_workers'],
+            use_sincnet=self.config['use_sincnet']
+        )
+
         # 가중치 초기화
         self.weights = self.default_weights.copy()
         
@@ -155,9 +190,45 @@ class SeniorMentalHealthPipeline:
         except:
             self.firestore_connector = None
             logger.warning("Firestore 커넥터 초기화 실패 - 시계열 분석 제한됨")
+
+        # 시니어별 증분 추세 상태 (Firestore가 있으면 요약 문서, 없으면 로컬 SQLite)
+        try:
+            self.trend_store = TrendStore.from_env(
+                db=self.firestore_connector.db if self.firestore_connector else None
+            )
+        except Exception as e:
+            self.trend_store = None
+            logger.warning(f"추세 저장소 초기화 실패 - 과거 기록 조회로 시계열 분석: {e}")
         
         # 결과 캐시
         self.cache = {}
+    
+    def _stage_semaphore(self, stage: str) -> asyncio.Semaphore:
+        """
+        단계별 동시 실행 세마포어 반환 ('stt', 'llm', 'cpu')
+        
+        세마포어는 현재 실행 중인 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        """
+        loop = asyncio.get_running_loop()
+        if self._stage_semaphore_loop is not loop:
+            self._stage_semaphores = {}
+            self._stage_semaphore_loop = loop
+        if stage not in self._stage_semaphores:
+            limit = self.config.get(f'{stage}_concurrency') or 1
+            self._stage_semaphores[stage] = asyncio.Semaphore(max(1, int(limit)))
+        return self._stage_semaphores[stage]
+    
+    async def _run_blocking(self, func, *args):
+        """동기 함수를 파이프라인 공용 스레드 풀에서 실행"""
+        return await self.executors.run_io(func, *args)
+    
+    def warm_up(self):
+        """실행기 풀을 미리 생성하고 워커 모델 로드 시작"""
+        self.executors.start()
+    
+    def close(self):
+        """실행기 풀 종료 (파이프라인 사용 종료 시 호출)"""
+        self.executors.shutdown()
         
     async def analyze(
         self,
@@ -185,11 +256,21 @@ class SeniorMentalHealthPipeline:
             'timestamp': start_time.isoformat(),
             'audio_path': audio_path
         }
+        # 단계별 소요 시간 (ms) - metadata.processing.stageTimings로 기록
+        stage_timings: Dict[str, float] = {}
+        result['stage_timings'] = stage_timings
         
         try:
+            # 오디오 1회 디코딩 (STT 업로드, 화자 구간 추출, 특징 분석에서 공유)
+            audio_asset = await self._load_audio_asset(audio_path)
+            senior_waveform = None
+            
             # Phase 1: STT 및 화자 식별 (먼저 수행)
             logger.info("Phase 1: 음성-텍스트 변환 및 화자 식별")
-            stt_result = await self._perform_stt(audio_path)
+            stt_started = time.perf_counter()
+            async with self._stage_semaphore('stt'):
+                stt_result = await self._perform_stt(audio_path, audio_asset)
+            stage_timings['stt'] = (time.perf_counter() - stt_started) * 1000
             
             senior_audio_path = audio_path  # 기본값은 원본 파일
             
@@ -236,8 +317,11 @@ class SeniorMentalHealthPipeline:
                 extraction_result = self._extract_senior_audio_segments(
                     audio_path,
                     stt_result['segments'],
-                    speaker_result
+                    speaker_result,
+                    asset=audio_asset
                 )
+                # 메모리 파형은 결과 문서에 저장하지 않음
+                senior_waveform = extraction_result.pop('waveform', None)
                 senior_audio_path = extraction_result['audio_path']
                 result['senior_audio_extraction'] = extraction_result
                 
@@ -259,52 +343,88 @@ class SeniorMentalHealthPipeline:
                 }
                 logger.warning("STT 실패, 원본 파일로 음성 분석 진행")
             
-            # Phase 2: 음성 분석 (시니어 음성으로)
-            logger.info("Phase 2: 음성 특징 추출 시작")
-            voice_features = await self._analyze_voice(senior_audio_path)
-            logger.info(f"Phase 2 완료: 음성 분석 상태 = {voice_features.get('status', 'unknown')}")
-            if voice_features.get('status') == 'error':
-                logger.error(f"음성 분석 오류: {voice_features.get('error')}")
-            result['voice_analysis'] = voice_features
+            # 분석 대상 파형: 시니어 구간 (추출 실패 시 원본 전체), 디코딩 실패 시 파일 경로 사용
+            if senior_waveform is not None:
+                analysis_waveform = senior_waveform
+            elif audio_asset is not None and senior_audio_path == audio_path:
+                analysis_waveform = audio_asset.samples
+            else:
+                analysis_waveform = None
+            analysis_sample_rate = AudioAsset.CANONICAL_SAMPLE_RATE
+            
+            # Phase 2-4: 음성/텍스트/SincNet 분석은 모두 Phase 1 결과에만 의존하므로
+            # 단계 DAG로 구성하여 동시에 실행
+            async def voice_stage(_deps: Dict[str, Any]) -> Dict[str, Any]:
+                # Phase 2: 음성 분석 (시니어 음성으로)
+                logger.info("Phase 2: 음성 특징 추출 시작")
+                voice_result = await self._analyze_voice(
+                    senior_audio_path,
+                    waveform=analysis_waveform,
+                    sample_rate=analysis_sample_rate
+                )
+                logger.info(f"Phase 2 완료: 음성 분석 상태 = {voice_result.get('status', 'unknown')}")
+                if voice_result.get('status') == 'error':
+                    logger.error(f"음성 분석 오류: {voice_result.get('error')}")
+                return voice_result
             
-            # Phase 3: 텍스트 분석
-            if result.get('transcription'):
+            async def text_stage(_deps: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                # Phase 3: 텍스트 분석
+                if not result.get('transcription'):
+                    return None
                 logger.info("Phase 3: 텍스트 분석")
                 # 분석에 사용될 텍스트 확인
                 text_for_analysis = result['transcription']
                 logger.info(f"텍스트 분석 입력: {len(text_for_analysis)}자")
                 logger.info(f"분석 텍스트 미리보기: {text_for_analysis[:300]}...")
                 
-                text_analysis = await self.text_analyzer.analyze(
-                    text_for_analysis,
-                    context=user_info
-                )
-                result['text_analysis'] = text_analysis
-            else:
-                result['text_analysis'] = None
+                async with self._stage_semaphore('llm'):
+                    return await self.text_analyzer.analyze(
+                        text_for_analysis,
+                        context=user_info
+                    )
             
-            # Phase 4: SincNet 분석 (시니어 음성으로)
-            if self.config.get('use_sincnet', False):
+            async def sincnet_stage(_deps: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                # Phase 4: SincNet 분석 (시니어 음성으로)
+                if not self.config.get('use_sincnet', False):
+                    return None
                 logger.info("Phase 4: SincNet 딥러닝 분석 (시니어 음성)")
                 try:
-                    # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-                    import asyncio
-                    from concurrent.futures import ThreadPoolExecutor
-                    
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        sincnet_result = await loop.run_in_executor(
-                            executor,
-                            self.sincnet_analyzer.analyze,
-                            senior_audio_path
-                        )
+                    # CPU 집약적인 동기 함수를 실행기 풀에서 실행
+                    async with self._stage_semaphore('cpu'):
+                        if analysis_waveform is not None:
+                            sincnet_result = await self.executors.run_cpu(
+                                run_sincnet_waveform_analysis,
+                                analysis_waveform,
+                                analysis_sample_rate,
+                                local_func=self.sincnet_analyzer.analyze_waveform
+                            )
+                        else:
+                            sincnet_result = await self.executors.run_cpu(
+                                run_sincnet_analysis,
+                                senior_audio_path,
+                                local_func=self.sincnet_analyzer.analyze
+                            )
                     logger.info(f"Phase 4 완료: SincNet 분석 상태 = {sincnet_result.get('status', 'unknown')}")
-                    result['sincnet_analysis'] = sincnet_result
+                    return sincnet_result
                 except Exception as e:
                     logger.error(f"SincNet 분석 실패: {e}")
-                    result['sincnet_analysis'] = {'status': 'error', 'error': str(e)}
-            else:
-                result['sincnet_analysis'] = None
+                    return {'status': 'error', 'error': str(e)}
+            
+            stage_graph = (
+                StageGraph()
+                .add_stage('voice_analysis', voice_stage)
+                .add_stage('text_analysis', text_stage)
+                .add_stage('sincnet_analysis', sincnet_stage)
+            )
+            try:
+                stage_results = await stage_graph.run()
+            finally:
+                stage_timings.update(stage_graph.timings)
+            
+            voice_features = stage_results['voice_analysis']
+            result['voice_analysis'] = voice_features
+            result['text_analysis'] = stage_results['text_analysis']
+            result['sincnet_analysis'] = stage_results['sincnet_analysis']
             
             # Phase 5: 5대 지표 계산 (적응형 가중치 적용)
             logger.info("Phase 5: 정신건강 지표 계산")
@@ -359,14 +479,9 @@ class SeniorMentalHealthPipeline:
 
                     logger.info(f"적응형 가중치 적용: {result['adaptive_weights']}")
 
-                # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    indicators = await loop.run_in_executor(
-                        executor,
+                # CPU 집약적인 동기 함수를 실행기 풀에서 실행
+                async with self._stage_semaphore('cpu'):
+                    indicators = await self._run_blocking(
                         lambda: self.indicator_calculator.calculate(
                             voice_features=voice_features.get('features'),
                             text_analysis=result.get('text_analysis'),
@@ -379,9 +494,8 @@ class SeniorMentalHealthPipeline:
                 
                 # Phase 6: 위험도 평가
                 logger.info("Phase 6: 위험도 평가")
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    risk_assessment = await loop.run_in_executor(
-                        executor,
+                async with self._stage_semaphore('cpu'):
+                    risk_assessment = await self._run_blocking(
                         self.indicator_calculator.calculate_risk_scores,
                         indicators
                     )
@@ -396,30 +510,45 @@ class SeniorMentalHealthPipeline:
             
             # Phase 7: 시계열 분석
             logger.info("Phase 7: 시계열 추세 분석")
+            current_record = {
+                'analysis_timestamp': start_time.isoformat(),
+                'indicators': indicators.to_dict() if indicators else None
+            }
+            trend_state = None
             if user_id and self.firestore_connector:
-                # GCP 운영 환경: Firestore에서 과거 기록 조회
-                logger.info("Firestore에서 과거 분석 기록 조회")
-                firestore_history = self.firestore_connector.get_user_analysis_history(user_id, days_back=30)
-                
-                if len(firestore_history) >= 2:  # 최소 2개 이상의 기록 필요
+                # GCP 운영 환경: 시니어별 추세 요약 문서 조회 (없을 때만 과거 기록으로 구축)
+                if self.trend_store:
+                    try:
+                        trend_state = await self._run_blocking(
+                            self.trend_store.load,
+                            user_id,
+                            lambda: self.firestore_connector.get_user_analysis_history(
+                                user_id, days_back=30, indicators_only=True
+                            )
+                        )
+                    except Exception as e:
+                        logger.warning(f"추세 상태 조회 실패 - 과거 기록 조회로 대체: {e}")
+
+                if trend_state is not None:
+                    trend_history = trend_state.to_history(days_back=30)
+                else:
+                    logger.info("Firestore에서 과거 분석 기록 조회")
+                    trend_history = self.firestore_connector.get_user_analysis_history(
+                        user_id, days_back=30, indicators_only=True
+                    )
+
+                if len(trend_history) >= 2:  # 최소 2개 이상의 기록 필요
                     # 현재 결과 추가
-                    current_record = {
-                        'analysis_timestamp': start_time.isoformat(),
-                        'indicators': indicators.to_dict() if indicators else None
-                    }
-                    firestore_history.append(current_record)
+                    trend_history.append(current_record)
                     
-                    # 동기 함수를 별도 스레드에서 실행
-                    import asyncio
-                    from concurrent.futures import ThreadPoolExecutor
-                    
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        trend_result = await loop.run_in_executor(
-                            executor,
+                    # 동기 함수를 공용 스레드 풀에서 실행
+                    async with self._stage_semaphore('cpu'):
+                        trend_result = await self._run_blocking(
                             self.trend_analyzer.analyze_trends,
-                            firestore_history
+                            trend_history
                         )
+                    if trend_state is not None and trend_result:
+                        trend_result['running_statistics'] = trend_state.statistics()
                     logger.info("Phase 7 완료: 시계열 분석 성공")
                     result['trend_analysis'] = trend_result
                 else:
@@ -435,14 +564,9 @@ class SeniorMentalHealthPipeline:
                     'indicators': indicators.to_dict() if indicators else None
                 })
                 
-                # 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-                
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    trend_result = await loop.run_in_executor(
-                        executor,
+                # 동기 함수를 공용 스레드 풀에서 실행
+                async with self._stage_semaphore('cpu'):
+                    trend_result = await self._run_blocking(
                         self.trend_analyzer.analyze_trends,
                         history
                     )
@@ -463,20 +587,16 @@ class SeniorMentalHealthPipeline:
             }
             
             # AI 종합 해석 수행
-            interpretation = await self.comprehensive_interpreter.interpret(comprehensive_analysis)
+            async with self._stage_semaphore('llm'):
+                interpretation = await self.comprehensive_interpreter.interpret(comprehensive_analysis)
             result['comprehensive_interpretation'] = interpretation
             
             # Phase 9: 리포트 생성
             logger.info("Phase 9: 종합 리포트 생성")
             try:
-                # 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-                
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    report = await loop.run_in_executor(
-                        executor,
+                # 동기 함수를 공용 스레드 풀에서 실행
+                async with self._stage_semaphore('cpu'):
+                    report = await self._run_blocking(
                         self.report_generator.generate,
                         indicators,
                         risk_assessment,
@@ -516,6 +636,11 @@ class SeniorMentalHealthPipeline:
                     audio_path=audio_path
                 )
                 result['saved_to_firestore'] = save_success
+
+                # 저장된 결과만 추세 상태에 반영 (요약 문서 1개 갱신)
+                # 상태 조회가 실패했으면 건너뜀 - 다음 분석의 조회에서 과거 기록으로 구축
+                if save_success and self.trend_store and indicators and trend_state is not None:
+                    await self._run_blocking(self.trend_store.record, user_id, current_record)
             
             logger.info(f"분석 완료: {processing_time:.2f}초 소요")
             
@@ -540,31 +665,53 @@ class SeniorMentalHealthPipeline:
         
         return result
     
-    async def _analyze_voice(self, audio_path: str) -> Dict[str, Any]:
-        """음성 분석 실행 (타임아웃 관리 추가)"""
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
+    async def _load_audio_asset(self, audio_path: str) -> Optional[AudioAsset]:
+        """오디오를 한 번 디코딩한 공유 자산 생성 (실패 시 None - 파일 경로 기반 처리)"""
+        try:
+            asset = AudioAsset.from_file(audio_path)
+            # 디코딩은 이벤트 루프 밖에서 수행
+            await self._run_blocking(lambda: asset.samples)
+            return asset
+        except Exception as e:
+            logger.warning(f"오디오 사전 디코딩 실패, 파일 경로 기반으로 처리: {e}")
+            return None
+    
+    async def _analyze_voice(
+        self,
+        audio_path: str,
+        waveform: Optional[Any] = None,
+        sample_rate: int = AudioAsset.CANONICAL_SAMPLE_RATE
+    ) -> Dict[str, Any]:
+        """음성 분석 실행 (타임아웃 관리 추가, 파형이 있으면 파일 재로드 없이 분석)"""
         from pathlib import Path
         
         try:
-            # 파일 크기에 따른 동적 타임아웃 설정
-            file_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
+            # 파일 크기에 따른 동적 타임아웃 설정 (파형은 1분 ≈ 1MB로 환산)
+            if waveform is not None:
+                file_size_mb = len(waveform) / sample_rate / 60
+            else:
+                file_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
             
             # 타임아웃 계산: 기본 60초 + MB당 20초 (최대 4분)
             timeout_seconds = min(60 + (file_size_mb * 20), 240)
             logger.info(f"음성 분석 타임아웃 설정: {timeout_seconds}초 (파일: {file_size_mb:.1f}MB)")
             
-            # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = loop.run_in_executor(
-                    executor,
-                    self.voice_analyzer.analyze,
-                    audio_path
-                )
-                
-                # 타임아웃 적용
-                result = await asyncio.wait_for(future, timeout=timeout_seconds)
+            # CPU 집약적인 동기 함수를 프로세스 풀에서 실행 (대기 시간은 타임아웃에서 제외)
+            async with self._stage_semaphore('cpu'):
+                if waveform is not None:
+                    analysis = self.executors.run_cpu(
+                        run_voice_waveform_analysis,
+                        waveform,
+                        sample_rate,
+                        local_func=self.voice_analyzer.analyze_waveform
+                    )
+                else:
+                    analysis = self.executors.run_cpu(
+                        run_voice_analysis,
+                        audio_path,
+                        local_func=self.voice_analyzer.analyze
+                    )
+                result = await asyncio.wait_for(analysis, timeout=timeout_seconds)
                 
             return result
             
@@ -587,12 +734,15 @@ class SeniorMentalHealthPipeline:
     
     # 비상 분석 함수 제거 - 실패 시 바로 에러 발생
     
-    async def _perform_stt(self, audio_path: str) -> Dict[str, Any]:
+    async def _perform_stt(self, audio_path: str,
+                           asset: Optional[AudioAsset] = None) -> Dict[str, Any]:
         """STT 실행"""
         try:
             # Google Cloud STT 사용
             if self.stt_connector:
-                result = await self.stt_connector.transcribe_with_diarization(audio_path)
+                result = await self.stt_connector.transcribe_with_diarization(
+                    audio_path, asset=asset, use_cache=self.config['use_stt_cache']
+                )
                 return result
             else:
                 logger.error("STT 커넥터가 초기화되지 않았습니다. Google Cloud 인증을 확인하세요.")
@@ -638,9 +788,15 @@ class SeniorMentalHealthPipeline:
         self,
         audio_path: str,
         segments: List[Dict],
-        speaker_info: Dict
+        speaker_info: Dict,
+        asset: Optional[AudioAsset] = None
     ) -> Dict[str, Any]:
-        """시니어 화자의 음성 구간만 추출하여 임시 파일로 저장"""
+        """
+        시니어 화자의 음성 구간만 추출
+        
+        asset이 있으면 디코딩된 버퍼에서 구간을 잘라 'waveform' 키로 반환하고
+        (임시 파일 없음), 없으면 원본을 로드하여 임시 WAV 파일로 저장합니다.
+        """
         import librosa
         import soundfile as sf
         import tempfile
@@ -683,8 +839,11 @@ class SeniorMentalHealthPipeline:
         logger.info(f"화자 ID 변환: AI='{senior_speaker_id}' -> STT={senior_speaker_numeric}")
         
         try:
-            # 원본 오디오 로드
-            y, sr = librosa.load(audio_path, sr=None)
+            # 원본 오디오 (디코딩된 공유 버퍼가 있으면 재사용)
+            if asset is not None:
+                y, sr = asset.samples, asset.sample_rate
+            else:
+                y, sr = librosa.load(audio_path, sr=None)
             
             # 시니어 음성 구간 수집
             senior_segments = []
@@ -741,6 +900,22 @@ class SeniorMentalHealthPipeline:
             senior_audio = np.concatenate(senior_segments)
             total_duration = len(senior_audio) / sr
             
+            if asset is not None:
+                # 메모리 파형으로 바로 전달 (임시 WAV 쓰기/재로드 없음)
+                logger.info(f"시니어 음성 구간 추출 완료 (메모리): {len(senior_segments)}개 구간, {total_duration:.2f}초")
+                return {
+                    'status': 'success',
+                    'audio_path': audio_path,
+                    'waveform': senior_audio,
+                    'message': f'시니어 음성 구간 추출 성공: {len(senior_segments)}개 구간',
+                    'segments_extracted': len(senior_segments),
+                    'total_duration': total_duration,
+                    'using_original': False,
+                    'temp_file_created': False,
+                    'original_file_duration': len(y) / sr,
+                    'extraction_ratio': total_duration / (len(y) / sr)
+                }
+            
             # 임시 파일에 저장
             temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
             temp_path = temp_file.name
@@ -776,40 +951,70 @@ class SeniorMentalHealthPipeline:
     
     async def batch_analyze(
         self,
-        audio_files: List[str],
-        user_info: Optional[Dict] = None
+        audio_files: List[Union[str, Dict[str, Any]]],
+        user_info: Optional[Dict] = None,
+        max_concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        여러 오디오 파일 일괄 분석
+        여러 오디오 파일 일괄 분석 (사용자 간 병렬, 사용자 내 순차)
+        
+        같은 사용자의 녹음은 입력 순서대로 처리하여 시계열 history를 이어가고,
+        서로 다른 사용자의 녹음은 동시에 처리합니다. STT/LLM/CPU 단계는
+        각 단계별 세마포어로 추가 제한됩니다.
         
         Args:
-            audio_files: 오디오 파일 경로 리스트
-            user_info: 사용자 정보
+            audio_files: 오디오 파일 경로 또는
+                {'audio_path', 'user_id', 'user_info'} 딕셔너리 리스트
+            user_info: 기본 사용자 정보 (항목에 user_info가 없을 때 사용)
+            max_concurrency: 동시에 진행할 최대 분석 수
+                (기본값: config['batch_concurrency'])
             
         Returns:
-            분석 결과 리스트
+            입력 순서와 동일한 순서의 분석 결과 리스트
         """
         
-        results = []
-        history = []
+        limit = max_concurrency or self.config.get('batch_concurrency', 1)
+        batch_semaphore = asyncio.Semaphore(max(1, int(limit)))
         
-        for audio_path in audio_files:
-            logger.info(f"분석 중: {audio_path}")
-            
-            result = await self.analyze(
-                audio_path=audio_path,
-                user_info=user_info,
-                history=history if history else None
-            )
-            
-            results.append(result)
+        # 사용자별 작업 묶기 (사용자 내 입력 순서 유지)
+        jobs_by_user: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = {}
+        for index, item in enumerate(audio_files):
+            job = item if isinstance(item, dict) else {'audio_path': item}
+            jobs_by_user.setdefault(job.get('user_id'), []).append((index, job))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(audio_files)
+        
+        async def run_user_chain(user_id: Optional[str], jobs: List[Tuple[int, Dict[str, Any]]]):
+            history: List[Dict] = []
             
-            # 성공한 결과를 기록에 추가
-            if result['status'] == 'success':
-                history.append({
-                    'timestamp': result['timestamp'],
-                    'indicators': result['indicators']
-                })
+            for index, job in jobs:
+                audio_path = job['audio_path']
+                async with batch_semaphore:
+                    logger.info(f"분석 중: {audio_path}")
+                    try:
+                        result = await self.analyze(
+                            audio_path=audio_path,
+                            user_id=user_id,
+                            user_info=job.get('user_info', user_info),
+                            # analyze가 현재 결과를 덧붙이므로 복사본 전달
+                            history=list(history) if history else None
+                        )
+                    except Exception as e:
+                        logger.error(f"일괄 분석 실패 ({audio_path}): {e}")
+                        result = {'status': 'error', 'error': str(e), 'audio_path': audio_path}
+                
+                results[index] = result
+                
+                # 성공한 결과를 같은 사용자의 기록에 추가
+                if result.get('status') == 'completed':
+                    history.append({
+                        'analysis_timestamp': result.get('createdAt'),
+                        'indicators': result.get('legacy', {}).get('indicators')
+                    })
+        
+        await asyncio.gather(*(
+            run_user_chain(user_id, jobs) for user_id, jobs in jobs_by_user.items()
+        ))
         
         return results
     
@@ -935,6 +1140,7 @@ class SeniorMentalHealthPipeline:
         metadata = {
             'processing': {
                 'totalTime': 0,  # 나중에 업데이트됨
+                'stageTimings': result.get('stage_timings', {}),
                 'pipelineVersion': '2.0.0',
                 'timestamps': {
                     'started': start_time.isoformat(),
@@ -0,0 +1,96 @@
+"""
+파이프라인 단계 의존성 그래프 (DAG)
+의존성이 없는 단계들을 asyncio.gather로 동시에 실행하고 단계별 소요 시간을 기록
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 단계 함수: 선행 단계 결과 딕셔너리를 받아 결과를 반환하는 코루틴 함수
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class StageGraph:
+    """
+    비동기 단계 DAG 실행기
+
+    각 단계는 선행 단계가 모두 끝나는 즉시 시작되므로,
+    서로 독립적인 단계들의 총 소요 시간은 가장 긴 분기 수준으로 줄어듭니다.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Tuple[StageFunc, Tuple[str, ...]]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add_stage(self, name: str, func: StageFunc,
+                  depends_on: Iterable[str] = ()) -> 'StageGraph':
+        """
+        단계 등록
+
+        Args:
+            name: 단계 이름
+            func: 선행 단계 결과({단계 이름: 결과})를 인자로 받는 코루틴 함수
+            depends_on: 선행 단계 이름 목록
+        """
+        if name in self._stages:
+            raise ValueError(f"이미 등록된 단계: {name}")
+        self._stages[name] = (func, tuple(depends_on))
+        return self
+
+    def _topological_order(self) -> List[str]:
+        """등록 순서를 유지하는 위상 정렬 (순환/누락 의존성 검사)"""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1: 방문 중, 2: 완료
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if name not in self._stages:
+                raise ValueError(f"정의되지 않은 선행 단계: {name} (경로: {' -> '.join(path)})")
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"단계 의존성 순환: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in self._stages[name][1]:
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self._stages:
+            visit(name, ())
+        return order
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 단계 실행
+
+        Returns:
+            {단계 이름: 결과} 딕셔너리. 한 단계라도 예외를 던지면
+            나머지 단계를 취소하고 예외를 다시 발생시킵니다.
+        """
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def run_stage(name: str) -> Any:
+            func, deps = self._stages[name]
+            dep_results = await asyncio.gather(*(tasks[dep] for dep in deps))
+            started = time.perf_counter()
+            try:
+                return await func(dict(zip(deps, dep_results)))
+            finally:
+                self.timings[name] = (time.perf_counter() - started) * 1000  # ms
+
+        for name in self._topological_order():
+            tasks[name] = asyncio.ensure_future(run_stage(name))
+
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return dict(zip(tasks.keys(), results))
@@ -4,11 +4,14 @@ Provides depression and insomnia analysis using original SincNet architecture
 """
 
 from .original_sincnet_analyzer import OriginalSincNetAnalyzer
+from .model_registry import SincNetModelRegistry, get_model_registry
 
 # Main interface - use the original (working) analyzer
 SincNetAnalyzer = OriginalSincNetAnalyzer
 
 __all__ = [
     'SincNetAnalyzer',
-    'OriginalSincNetAnalyzer'
+    'OriginalSincNetAnalyzer',
+    'SincNetModelRegistry',
+    'get_model_registry'
 ]
\ No newline at end of file
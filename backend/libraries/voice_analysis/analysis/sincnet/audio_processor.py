@@ -208,6 +208,11 @@ class AudioProcessor:
         """
         모델 입력을 위한 오디오 준비
         
+        윈도우는 하나의 연속 버퍼 위의 스트라이드 뷰(Tensor.unfold)로 만들어지므로
+        오버랩 비율과 무관하게 원본 샘플 이상의 메모리를 쓰지 않습니다.
+        반환 텐서는 읽기 전용 뷰로 취급해야 하며, 연속 메모리가 필요하면
+        마이크로 배치 단위로 ``.contiguous()``를 호출합니다.
+        
         Args:
             audio: 오디오 배열
             window_size: 모델이 요구하는 윈도우 크기
@@ -215,7 +220,19 @@ class AudioProcessor:
             pad_mode: 패딩 모드 ('constant', 'reflect', 'replicate')
             
         Returns:
-            [n_windows, 1, window_size] 형태의 텐서
+            [n_windows, 1, window_size] 형태의 텐서 (스트라이드 뷰)
+        """
+        return self.sliding_windows(audio, window_size, stride, pad_mode).unsqueeze(1)
+    
+    def sliding_windows(self, audio: np.ndarray,
+                        window_size: int,
+                        stride: Optional[int] = None,
+                        pad_mode: str = 'constant') -> torch.Tensor:
+        """
+        복사 없는 슬라이딩 윈도우
+        
+        Returns:
+            [n_windows, window_size] 형태의 스트라이드 뷰
         """
         if len(audio) == 0:
             raise ValueError("빈 오디오 배열")
@@ -234,24 +251,11 @@ class AudioProcessor:
             else:
                 raise ValueError(f"Unknown pad_mode: {pad_mode}")
         
-        # 슬라이딩 윈도우 생성
-        windows = []
-        for i in range(0, len(audio) - window_size + 1, stride):
-            window = audio[i:i + window_size]
-            windows.append(window)
+        # float32 연속 버퍼 1개 (이미 float32면 복사 없음)
+        buffer = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
         
-        if not windows:
-            # 하나의 윈도우만 생성
-            windows = [audio[:window_size]]
-        
-        # 텐서 변환
-        windows_array = np.stack(windows)
-        tensor = torch.from_numpy(windows_array).float()
-        
-        # [n_windows, 1, window_size] 형태로
-        tensor = tensor.unsqueeze(1)
-        
-        return tensor
+        # 윈도우 시작 위치: 0, stride, 2*stride, ... (len - window_size 이하)
+        return buffer.unfold(0, window_size, stride)
     
     def process_any_audio(self, audio_path: Union[str, Path],
                          model_window_size: int = 2937,
@@ -273,6 +277,31 @@ class AudioProcessor:
         if audio is None:
             return None, {'error': '오디오 로드 실패', 'path': str(audio_path)}
         
+        return self.process_waveform(audio, sr, model_window_size, overlap,
+                                     source=str(audio_path))
+    
+    def process_waveform(self, audio: np.ndarray, sr: int,
+                         model_window_size: int = 2937,
+                         overlap: float = 0.5,
+                         source: str = '<memory>') -> Tuple[Optional[torch.Tensor], dict]:
+        """
+        이미 디코딩된 파형을 모델 입력으로 변환
+        
+        Args:
+            audio: 모노 파형
+            sr: 파형 샘플레이트 (16kHz가 아니면 리샘플링)
+            model_window_size: 모델 입력 크기
+            overlap: 윈도우 오버랩 비율 (0~1)
+            source: 로그/결과용 원본 식별자
+            
+        Returns:
+            (tensor, info_dict) or (None, error_dict)
+        """
+        audio_path = source
+        if sr != self.TARGET_SAMPLE_RATE:
+            audio = self._resample(audio, sr, self.TARGET_SAMPLE_RATE)
+            sr = self.TARGET_SAMPLE_RATE
+        
         # 스트라이드 계산
         stride = int(model_window_size * (1 - overlap))
         
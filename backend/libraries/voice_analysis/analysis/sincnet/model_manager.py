@@ -144,6 +144,10 @@ class SincNetModelManager:
         
         return loaded_models
     
+    def release_model(self, model_type: str):
+        """특정 체크포인트만 메모리 캐시에서 제거 (모델 파일은 그대로 유지)"""
+        self.models.pop(model_type, None)
+    
     def clear_memory_cache(self):
         """메모리 캐시만 클리어 (모델 파일은 그대로 유지)"""
         self.models.clear()
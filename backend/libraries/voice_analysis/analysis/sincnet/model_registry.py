@@ -0,0 +1,257 @@
+"""
+SincNet 모델 레지스트리
+프로세스당 SincNet 변형(우울증/불면증)을 한 번만 구성하여
+스레드 간에 읽기 전용으로 공유 (지연 로드, 워밍업, 핫 리로드 지원)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import torch
+
+from .original_sincnet_model import OriginalSincNetModel
+from .model_manager import SincNetModelManager, get_model_manager
+
+logger = logging.getLogger(__name__)
+
+# 원본 .cfg 파일 기준 모델 구성 (두 모델 모두 동일한 구조)
+_BASE_CONFIG = {
+    # Windowing - 200ms windows at 16kHz
+    'input_dim': 3200,  # 200ms * 16kHz / 1000
+    'fs': 16000,
+
+    # CNN - 3 layers [80, 60, 60] filters
+    'cnn_N_filt': [80, 60, 60],
+    'cnn_len_filt': [251, 5, 5],
+    'cnn_max_pool_len': [3, 3, 3],
+    'cnn_use_laynorm_inp': True,
+    'cnn_use_batchnorm_inp': False,
+    'cnn_use_laynorm': [True, True, True],
+    'cnn_use_batchnorm': [False, False, False],
+    'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+    'cnn_drop': [0.0, 0.0, 0.0],
+
+    # DNN - 3 layers of 2048 neurons
+    'fc_lay': [2048, 2048, 2048],
+    'fc_drop': [0.0, 0.0, 0.0],
+    'fc_use_laynorm_inp': True,
+    'fc_use_batchnorm_inp': False,
+    'fc_use_batchnorm': [True, True, True],
+    'fc_use_laynorm': [False, False, False],
+    'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+
+    # Classifier - 2-class output
+    'class_lay': 2,
+    'class_drop': 0.0,
+    'class_use_laynorm_inp': False,
+    'class_use_batchnorm_inp': False,
+    'class_use_batchnorm': False,
+    'class_use_laynorm': False,
+    'class_act': 'softmax'
+}
+
+MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
+    'depression': dict(_BASE_CONFIG),
+    'insomnia': dict(_BASE_CONFIG)
+}
+
+
+@dataclass
+class RegisteredModel:
+    """레지스트리에 로드된 모델 정보"""
+    model: OriginalSincNetModel
+    load_time_ms: float
+    size_bytes: int
+    loaded_at: datetime
+    checkpoint_mtime: Optional[float]
+
+
+def _model_size_bytes(model: torch.nn.Module) -> int:
+    """파라미터와 버퍼의 메모리 상주 크기 (바이트)"""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class SincNetModelRegistry:
+    """
+    프로세스 전역 SincNet 모델 레지스트리
+
+    모델은 첫 요청 시(또는 ``warm_up()`` 시) 한 번만 구성되어 eval 모드,
+    gradient 비활성 상태로 공유되므로 여러 스레드가 동시에 추론해도 안전합니다.
+    ``reload()``는 새 모델을 완전히 구성한 뒤 교체하므로, 진행 중인 추론은
+    이전 모델 참조로 끝까지 수행됩니다.
+    """
+
+    MODEL_TYPES = ('depression', 'insomnia')
+
+    def __init__(self, model_manager: Optional[SincNetModelManager] = None,
+                 retry_interval: float = 300.0):
+        """
+        Args:
+            model_manager: 체크포인트 다운로드/로드 관리자 (기본값: 싱글톤)
+            retry_interval: 로드 실패 후 재시도까지 대기 시간 (초)
+        """
+        self._model_manager = model_manager
+        self.retry_interval = retry_interval
+
+        self._entries: Dict[str, RegisteredModel] = {}
+        self._failures: Dict[str, float] = {}
+        self._locks = {model_type: threading.Lock() for model_type in self.MODEL_TYPES}
+
+    @property
+    def model_manager(self) -> SincNetModelManager:
+        if self._model_manager is None:
+            self._model_manager = get_model_manager()
+        return self._model_manager
+
+    def get(self, model_type: str) -> Optional[OriginalSincNetModel]:
+        """
+        모델 반환 (없으면 로드)
+
+        Returns:
+            공유 모델 (로드 실패 시 None)
+        """
+        entry = self._entries.get(model_type)
+        if entry is not None:
+            return entry.model
+
+        if model_type not in self._locks:
+            raise ValueError(f"알 수 없는 SincNet 모델: {model_type}")
+
+        with self._locks[model_type]:
+            entry = self._entries.get(model_type)
+            if entry is None:
+                failed_at = self._failures.get(model_type)
+                if failed_at is not None and time.monotonic() - failed_at < self.retry_interval:
+                    return None
+                entry = self._load(model_type, force_reload=False)
+        return entry.model if entry is not None else None
+
+    def warm_up(self, model_types: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """시작 시 모델 미리 로드"""
+        return {
+            model_type: self.get(model_type) is not None
+            for model_type in (model_types or self.MODEL_TYPES)
+        }
+
+    def reload(self, model_type: Optional[str] = None) -> Dict[str, bool]:
+        """
+        체크포인트를 다시 읽어 모델 교체 (새 체크포인트 배포 시 호출)
+
+        Args:
+            model_type: 다시 로드할 모델 (None이면 전체)
+        """
+        model_types = [model_type] if model_type else list(self.MODEL_TYPES)
+        results = {}
+        for name in model_types:
+            with self._locks[name]:
+                results[name] = self._load(name, force_reload=True) is not None
+        return results
+
+    def reload_if_changed(self) -> Dict[str, bool]:
+        """로컬 체크포인트 파일이 바뀐 모델만 다시 로드"""
+        reloaded = {}
+        for model_type, entry in list(self._entries.items()):
+            if self._checkpoint_mtime(model_type) != entry.checkpoint_mtime:
+                logger.info(f"SincNet 체크포인트 변경 감지: {model_type}")
+                reloaded.update(self.reload(model_type))
+        return reloaded
+
+    def is_loaded(self, model_type: str) -> bool:
+        return model_type in self._entries
+
+    def _checkpoint_mtime(self, model_type: str) -> Optional[float]:
+        path = self.model_manager.cache_dir / self.model_manager.model_files[model_type]
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _load(self, model_type: str, force_reload: bool) -> Optional[RegisteredModel]:
+        """체크포인트 로드 후 모델 구성 (모델별 잠금 보유 상태에서 호출)"""
+        started = time.perf_counter()
+        logger.info(f"SincNet 모델 로드 시작: {model_type}")
+
+        try:
+            checkpoint = self.model_manager.load_model(model_type, force_reload=force_reload)
+            if checkpoint is None:
+                raise RuntimeError(f"{model_type} 체크포인트 로드 실패")
+
+            model = OriginalSincNetModel(MODEL_CONFIGS[model_type])
+            _load_weights_from_checkpoint(model, checkpoint, model_type)
+            model.eval()
+            model.requires_grad_(False)
+        except Exception as e:
+            logger.error(f"SincNet 모델 로드 실패 ({model_type}): {e}")
+            self._failures[model_type] = time.monotonic()
+            # 리로드 실패 시 기존 모델은 그대로 유지
+            return None
+        finally:
+            # 체크포인트 텐서는 모델에 복사되었으므로 관리자 메모리 캐시에서 해제
+            self.model_manager.release_model(model_type)
+
+        entry = RegisteredModel(
+            model=model,
+            load_time_ms=(time.perf_counter() - started) * 1000,
+            size_bytes=_model_size_bytes(model),
+            loaded_at=datetime.now(),
+            checkpoint_mtime=self._checkpoint_mtime(model_type)
+        )
+        self._entries[model_type] = entry
+        self._failures.pop(model_type, None)
+        logger.info(
+            f"SincNet 모델 로드 완료: {model_type} "
+            f"({entry.load_time_ms:.0f}ms, {entry.size_bytes / 1024 / 1024:.1f} MB)"
+        )
+        return entry
+
+    def get_info(self) -> Dict[str, Any]:
+        """모델별 로드 상태, 로드 시간, 상주 크기"""
+        info = {}
+        for model_type in self.MODEL_TYPES:
+            entry = self._entries.get(model_type)
+            if entry is None:
+                info[model_type] = {'loaded': False}
+                continue
+            info[model_type] = {
+                'loaded': True,
+                'load_time_ms': round(entry.load_time_ms, 1),
+                'size_mb': round(entry.size_bytes / 1024 / 1024, 2),
+                'loaded_at': entry.loaded_at.isoformat()
+            }
+        return info
+
+
+def _load_weights_from_checkpoint(model: OriginalSincNetModel,
+                                  checkpoint: Dict, model_type: str) -> None:
+    """원본 체크포인트의 파라미터 딕셔너리를 모델 구조에 로드"""
+    cnn_params = checkpoint.get('CNN_model_par', {})
+    dnn1_params = checkpoint.get('DNN1_model_par', {})
+    dnn2_params = checkpoint.get('DNN2_model_par', {})
+
+    if not cnn_params or not dnn1_params or not dnn2_params:
+        raise ValueError(f"{model_type} 체크포인트에 파라미터 딕셔너리가 없습니다")
+
+    # 체크포인트 파라미터 이름은 모델 구조와 동일 (DNN1 = 본체 DNN, DNN2 = 분류기)
+    model.cnn.load_state_dict(dict(cnn_params), strict=False)
+    model.dnn.load_state_dict(dict(dnn1_params), strict=False)
+    model.classifier.load_state_dict(dict(dnn2_params), strict=False)
+
+
+# 싱글톤 인스턴스
+_model_registry = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> SincNetModelRegistry:
+    """모델 레지스트리 싱글톤 반환"""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = SincNetModelRegistry()
+    return _model_registry
@@ -4,15 +4,18 @@ Based on the original SincNet implementation with proper model reconstruction
 """
 
 import logging
+import time
 import torch
 import numpy as np
 from pathlib import Path
 from typing import Dict, Optional, Union, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 
 from .original_sincnet_model import OriginalSincNetModel, create_config_from_cfg
 from .audio_processor import AudioProcessor
-from .model_manager import get_model_manager
+from .model_registry import MODEL_CONFIGS, SincNetModelRegistry, get_model_registry
+from .window_stats import WindowStats
 
 logger = logging.getLogger(__name__)
 
@@ -20,216 +23,52 @@ logger = logging.getLogger(__name__)
 class OriginalSincNetAnalyzer:
     """SincNet Analyzer using the original authentic architecture"""
     
-    def __init__(self):
+    def __init__(self, registry: Optional[SincNetModelRegistry] = None,
+                 micro_batch_size: int = 256,
+                 max_window_outputs: Optional[int] = 100,
+                 parallel_models: bool = True):
+        """
+        Args:
+            registry: Shared model registry (defaults to the process-wide one)
+            micro_batch_size: Windows per forward pass; bounds peak activation memory
+            max_window_outputs: Per-window scores kept in the result, evenly
+                downsampled (0 keeps none, None keeps every window plus raw logits)
+            parallel_models: Run the depression and insomnia models concurrently
+                over the same windowed input
+        """
         self.logger = logging.getLogger(__name__)
+        self.micro_batch_size = micro_batch_size
+        self.max_window_outputs = max_window_outputs
+        self.parallel_models = parallel_models
+        self._model_pool: Optional[ThreadPoolExecutor] = None
         
         # Configuration for both models (from original .cfg files)
-        self.model_configs = {
-            'depression': {
-                # Windowing - 200ms windows at 16kHz
-                'input_dim': 3200,  # 200ms * 16kHz / 1000
-                'fs': 16000,
-                
-                # CNN - 3 layers [80, 60, 60] filters
-                'cnn_N_filt': [80, 60, 60],
-                'cnn_len_filt': [251, 5, 5],
-                'cnn_max_pool_len': [3, 3, 3],
-                'cnn_use_laynorm_inp': True,
-                'cnn_use_batchnorm_inp': False,
-                'cnn_use_laynorm': [True, True, True],
-                'cnn_use_batchnorm': [False, False, False],
-                'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'cnn_drop': [0.0, 0.0, 0.0],
-                
-                # DNN - 3 layers of 2048 neurons
-                'fc_lay': [2048, 2048, 2048],
-                'fc_drop': [0.0, 0.0, 0.0],
-                'fc_use_laynorm_inp': True,
-                'fc_use_batchnorm_inp': False,
-                'fc_use_batchnorm': [True, True, True],
-                'fc_use_laynorm': [False, False, False],
-                'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                
-                # Classifier - 2-class output
-                'class_lay': 2,
-                'class_drop': 0.0,
-                'class_use_laynorm_inp': False,
-                'class_use_batchnorm_inp': False,
-                'class_use_batchnorm': False,
-                'class_use_laynorm': False,
-                'class_act': 'softmax'
-            },
-            'insomnia': {
-                # Same configuration as depression (both use same architecture)
-                'input_dim': 3200,
-                'fs': 16000,
-                'cnn_N_filt': [80, 60, 60],
-                'cnn_len_filt': [251, 5, 5],
-                'cnn_max_pool_len': [3, 3, 3],
-                'cnn_use_laynorm_inp': True,
-                'cnn_use_batchnorm_inp': False,
-                'cnn_use_laynorm': [True, True, True],
-                'cnn_use_batchnorm': [False, False, False],
-                'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'cnn_drop': [0.0, 0.0, 0.0],
-                'fc_lay': [2048, 2048, 2048],
-                'fc_drop': [0.0, 0.0, 0.0],
-                'fc_use_laynorm_inp': True,
-                'fc_use_batchnorm_inp': False,
-                'fc_use_batchnorm': [True, True, True],
-                'fc_use_laynorm': [False, False, False],
-                'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'class_lay': 2,
-                'class_drop': 0.0,
-                'class_use_laynorm_inp': False,
-                'class_use_batchnorm_inp': False,
-                'class_use_batchnorm': False,
-                'class_use_laynorm': False,
-                'class_act': 'softmax'
-            }
-        }
+        self.model_configs = MODEL_CONFIGS
         
         # Audio processor with correct window size
         self.audio_processor = AudioProcessor()
         
-        # Model manager for loading checkpoints
-        self.model_manager = get_model_manager()
+        # Process-wide registry: each model is built once and shared read-only
+        self.registry = registry or get_model_registry()
         
         # Models and loaded states
         self.models = {}
         self.model_loaded = {}
         
-        # Load both models
+        # Fetch both models (loaded lazily by the registry on first use)
         self._load_all_models()
     
     def _load_all_models(self):
-        """Load both depression and insomnia models with original architecture"""
-        
-        model_types = ['depression', 'insomnia']
+        """Fetch depression and insomnia models from the shared registry"""
         
-        for model_type in model_types:
-            try:
-                self.logger.info(f"Loading {model_type} model with original SincNet architecture...")
-                
-                # Load checkpoint from model manager
-                checkpoint = self.model_manager.load_model(model_type)
-                if checkpoint is None:
-                    self.logger.error(f"Failed to load {model_type} checkpoint")
-                    self.model_loaded[model_type] = False
-                    continue
-                
-                # Create model with original architecture
-                config = self.model_configs[model_type]
-                model = OriginalSincNetModel(config)
-                
-                # Load weights from checkpoint
-                success = self._load_weights_from_checkpoint(model, checkpoint, model_type)
-                
-                if success:
-                    model.eval()
-                    self.models[model_type] = model
-                    self.model_loaded[model_type] = True
-                    self.logger.info(f"✓ {model_type} model loaded successfully")
-                    
-                    # Log architecture details
-                    self.logger.info(f"  CNN: {config['cnn_N_filt']} filters, {config['cnn_len_filt']} kernel sizes")
-                    self.logger.info(f"  DNN: {config['fc_lay']} neurons")
-                    self.logger.info(f"  Input: {config['input_dim']} samples (200ms at {config['fs']}Hz)")
-                else:
-                    self.model_loaded[model_type] = False
-                    self.logger.error(f"Failed to load weights for {model_type}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error loading {model_type} model: {str(e)}")
+        for model_type in ['depression', 'insomnia']:
+            model = self.registry.get(model_type)
+            if model is not None:
+                self.models[model_type] = model
+                self.model_loaded[model_type] = True
+            else:
                 self.model_loaded[model_type] = False
-    
-    def _load_weights_from_checkpoint(self, model: OriginalSincNetModel, 
-                                    checkpoint: Dict, model_type: str) -> bool:
-        """Load weights from checkpoint into the original model architecture"""
-        try:
-            # Get the parameter dictionaries from checkpoint
-            cnn_params = checkpoint.get('CNN_model_par', {})
-            dnn1_params = checkpoint.get('DNN1_model_par', {})
-            dnn2_params = checkpoint.get('DNN2_model_par', {})
-            
-            if not cnn_params or not dnn1_params or not dnn2_params:
-                self.logger.error(f"Missing parameter dictionaries in {model_type} checkpoint")
-                return False
-            
-            # Load CNN parameters
-            self._load_cnn_weights(model.cnn, cnn_params)
-            
-            # Load DNN parameters (DNN1 = main DNN, DNN2 = classifier)
-            self._load_dnn_weights(model.dnn, dnn1_params, 'DNN1')
-            self._load_dnn_weights(model.classifier, dnn2_params, 'DNN2')
-            
-            self.logger.info(f"Successfully loaded all weights for {model_type}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error loading weights for {model_type}: {str(e)}")
-            return False
-    
-    def _load_cnn_weights(self, cnn_model, cnn_params):
-        """Load CNN weights including SincConv parameters"""
-        try:
-            state_dict = {}
-            
-            for param_name, param_tensor in cnn_params.items():
-                # Map parameter names from checkpoint to model
-                if param_name.startswith('conv.0.'):
-                    # SincConv layer (first layer)
-                    mapped_name = param_name.replace('conv.0.', 'conv.0.')
-                elif param_name.startswith('conv.1.') or param_name.startswith('conv.2.'):
-                    # Regular conv layers
-                    mapped_name = param_name
-                elif param_name.startswith('ln'):
-                    # Layer normalization
-                    mapped_name = param_name
-                elif param_name.startswith('bn'):
-                    # Batch normalization
-                    mapped_name = param_name
-                else:
-                    mapped_name = param_name
-                
-                state_dict[mapped_name] = param_tensor
-            
-            # Load the state dict
-            cnn_model.load_state_dict(state_dict, strict=False)
-            self.logger.debug("CNN weights loaded successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Error loading CNN weights: {str(e)}")
-            raise
-    
-    def _load_dnn_weights(self, dnn_model, dnn_params, layer_name):
-        """Load DNN weights with proper mapping"""
-        try:
-            state_dict = {}
-            
-            for param_name, param_tensor in dnn_params.items():
-                # Map parameter names
-                if param_name.startswith('wx.'):
-                    # Linear layer weights
-                    mapped_name = param_name
-                elif param_name.startswith('ln'):
-                    # Layer normalization
-                    mapped_name = param_name
-                elif param_name.startswith('bn'):
-                    # Batch normalization
-                    mapped_name = param_name
-                else:
-                    mapped_name = param_name
-                
-                state_dict[mapped_name] = param_tensor
-            
-            # Load the state dict
-            dnn_model.load_state_dict(state_dict, strict=False)
-            self.logger.debug(f"{layer_name} weights loaded successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Error loading {layer_name} weights: {str(e)}")
-            raise
+                self.logger.error(f"Failed to load {model_type} model")
     
     def analyze_audio(self, audio_path: Union[str, Path]) -> Dict:
         """
@@ -252,71 +91,146 @@ class OriginalSincNetAnalyzer:
                 overlap=0.5
             )
             
-            if audio_windows is None:
-                raise RuntimeError("Audio processing failed")
-            
-            # Apply proper normalization (zero mean, unit variance)
-            # This is critical for SincNet
-            audio_windows = self._normalize_audio(audio_windows)
+            return self._analyze_windows(audio_windows, audio_info, audio_path)
             
-            self.logger.info(f"Processing {len(audio_windows)} windows of 3200 samples each")
-            self.logger.info(f"Audio stats: mean={audio_windows.mean():.6f}, std={audio_windows.std():.6f}")
-            self.logger.info(f"Audio range: [{audio_windows.min():.6f}, {audio_windows.max():.6f}]")
+        except Exception as e:
+            self.logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+            return {
+                'error': str(e),
+                'analysis_failed': True,
+                'audio_path': str(audio_path)
+            }
+    
+    def analyze_waveform(self, audio: np.ndarray, sample_rate: int,
+                         source: str = '<memory>') -> Dict:
+        """
+        Analyze an already-decoded mono waveform (no file round trip)
+        
+        Args:
+            audio: Mono waveform
+            sample_rate: Waveform sample rate (resampled to 16kHz if needed)
+            source: Identifier reported as audio_path in the result
             
-            # Run inference on all loaded models
-            results = {}
+        Returns:
+            Analysis results with depression and insomnia scores
+        """
+        try:
+            if not any(self.model_loaded.values()):
+                raise RuntimeError("No models loaded successfully")
             
-            for model_type in ['depression', 'insomnia']:
-                if self.model_loaded[model_type]:
-                    try:
-                        result = self._run_model_inference(
-                            self.models[model_type], 
-                            audio_windows, 
-                            model_type,
-                            audio_info
-                        )
-                        results[model_type] = result
-                        
-                    except Exception as e:
-                        self.logger.error(f"Inference failed for {model_type}: {str(e)}")
-                        results[model_type] = {'error': str(e)}
-                else:
-                    self.logger.warning(f"{model_type} model not loaded")
-                    results[model_type] = {'error': 'Model not loaded'}
+            audio_windows, audio_info = self.audio_processor.process_waveform(
+                audio,
+                sample_rate,
+                model_window_size=3200,  # 200ms at 16kHz
+                overlap=0.5,
+                source=source
+            )
             
-            # Generate final result
-            return self._generate_final_result(results, audio_path)
+            return self._analyze_windows(audio_windows, audio_info, source)
             
         except Exception as e:
             self.logger.error(f"Analysis failed: {str(e)}", exc_info=True)
             return {
                 'error': str(e),
                 'analysis_failed': True,
-                'audio_path': str(audio_path)
+                'audio_path': source
             }
     
-    def _normalize_audio(self, audio_tensor: torch.Tensor) -> torch.Tensor:
-        """
-        Apply proper normalization for SincNet
-        Zero mean and unit variance normalization
-        """
-        # Calculate mean and std across all dimensions
-        mean = audio_tensor.mean()
-        std = audio_tensor.std()
+    def _analyze_windows(self, audio_windows: Optional[torch.Tensor], audio_info: Dict,
+                         audio_path: Union[str, Path]) -> Dict:
+        """Run all loaded models over prepared windows"""
+        if audio_windows is None:
+            raise RuntimeError("Audio processing failed")
+        
+        # Proper normalization (zero mean, unit variance) is critical for SincNet.
+        # Statistics come from the whole recording; each micro-batch is normalized
+        # on the fly so no normalized copy of the full window tensor is made.
+        norm_mean, norm_std = self._normalization_stats(audio_windows)
         
-        # Apply normalization with epsilon for stability
-        normalized = (audio_tensor - mean) / (std + 1e-8)
+        self.logger.info(f"Processing {len(audio_windows)} windows of 3200 samples each "
+                         f"(micro-batch {self.micro_batch_size})")
+        self.logger.info(f"Audio stats: mean={norm_mean:.6f}, std={norm_std:.6f}")
         
-        self.logger.debug(f"Normalization: mean={mean:.6f}, std={std:.6f}")
-        self.logger.debug(f"After norm: mean={normalized.mean():.6f}, std={normalized.std():.6f}")
+        # Run inference on all loaded models (re-fetched so hot reloads take effect)
+        self._load_all_models()
+        model_types = ['depression', 'insomnia']
+        loaded_types = [m for m in model_types if self.model_loaded[m]]
+        
+        # Both models share the same windowed input; torch releases the GIL inside
+        # its kernels, so the heads overlap when dispatched on separate threads
+        if self.parallel_models and len(loaded_types) > 1:
+            pool = self._get_model_pool()
+            futures = {
+                model_type: pool.submit(self._timed_model_inference, model_type,
+                                        audio_windows, audio_info, norm_mean, norm_std)
+                for model_type in loaded_types
+            }
+            outcomes = {model_type: future.result() for model_type, future in futures.items()}
+        else:
+            outcomes = {
+                model_type: self._timed_model_inference(model_type, audio_windows,
+                                                        audio_info, norm_mean, norm_std)
+                for model_type in loaded_types
+            }
         
-        return normalized
+        results = {}
+        model_timings = {}
+        for model_type in model_types:
+            if model_type in outcomes:
+                results[model_type], model_timings[model_type] = outcomes[model_type]
+            else:
+                self.logger.warning(f"{model_type} model not loaded")
+                results[model_type] = {'error': 'Model not loaded'}
+        
+        # Generate final result
+        final_result = self._generate_final_result(results, audio_path)
+        final_result['model_timings_ms'] = model_timings
+        final_result['parallel_models'] = self.parallel_models and len(loaded_types) > 1
+        return final_result
+    
+    def _get_model_pool(self) -> ThreadPoolExecutor:
+        """Worker threads for concurrent model heads (created on first use)"""
+        if self._model_pool is None:
+            self._model_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sincnet-model')
+        return self._model_pool
+    
+    def _timed_model_inference(self, model_type: str, audio_windows: torch.Tensor,
+                               audio_info: Dict, norm_mean: float,
+                               norm_std: float) -> Tuple[Dict, float]:
+        """Run one model and return (result, elapsed milliseconds)"""
+        started = time.perf_counter()
+        try:
+            result = self._run_model_inference(
+                self.models[model_type],
+                audio_windows,
+                model_type,
+                audio_info,
+                norm_mean,
+                norm_std
+            )
+        except Exception as e:
+            self.logger.error(f"Inference failed for {model_type}: {str(e)}")
+            result = {'error': str(e)}
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.logger.info(f"{model_type} inference: {elapsed_ms:.0f}ms")
+        return result, elapsed_ms
+    
+    def _normalization_stats(self, audio_tensor: torch.Tensor) -> Tuple[float, float]:
+        """Mean and std across all windows (used for zero mean/unit variance)"""
+        return audio_tensor.mean().item(), audio_tensor.std().item()
     
     def _run_model_inference(self, model: OriginalSincNetModel, 
                            audio_windows: torch.Tensor, 
                            model_type: str, 
-                           audio_info: Dict) -> Dict:
-        """Run inference on a single model"""
+                           audio_info: Dict,
+                           norm_mean: Optional[float] = None,
+                           norm_std: Optional[float] = None) -> Dict:
+        """
+        Run streaming inference on a single model
+        
+        Windows go through the model in micro-batches; aggregates are updated
+        incrementally so peak memory depends on the micro-batch size only.
+        """
         
         with torch.no_grad():
             # Ensure proper input shape for SincNet: [batch_size, sequence_length]
@@ -325,51 +239,74 @@ class OriginalSincNetAnalyzer:
                 # Shape is [batch, 1, seq_len] - squeeze the channel dimension
                 audio_windows = audio_windows.squeeze(1)
             
-            self.logger.info(f"{model_type} input shape: {audio_windows.shape}")
+            n_windows = audio_windows.shape[0]
+            batch_size = max(1, self.micro_batch_size)
+            # Keep every window, every `keep_every`-th window, or none (keep_every == 0)
+            keep_all = self.max_window_outputs is None
+            if keep_all:
+                keep_every = 1
+            elif self.max_window_outputs:
+                keep_every = max(1, -(-n_windows // self.max_window_outputs))
+            else:
+                keep_every = 0
             
-            # Forward pass
-            outputs = model(audio_windows)
+            self.logger.info(f"{model_type} input shape: {tuple(audio_windows.shape)}")
             
-            self.logger.info(f"{model_type} raw outputs: {outputs}")
-            self.logger.info(f"{model_type} output shape: {outputs.shape}")
-            self.logger.info(f"{model_type} output range: [{outputs.min():.6f}, {outputs.max():.6f}]")
+            stats = WindowStats()
+            kept_scores = []
+            raw_logits, raw_probs = [], []
             
-            # Apply softmax to get probabilities (if not already applied)
-            if model.config['class_act'] != 'softmax':
-                probs = torch.softmax(outputs, dim=1)
-            else:
-                # LogSoftmax was applied, convert to probabilities
-                probs = torch.exp(outputs)
+            for start in range(0, n_windows, batch_size):
+                batch = audio_windows[start:start + batch_size]
+                if norm_mean is not None:
+                    batch = (batch - norm_mean) / (norm_std + 1e-8)
+                
+                # Forward pass
+                outputs = model(batch.contiguous())
+                
+                # Apply softmax to get probabilities (if not already applied)
+                if model.config['class_act'] != 'softmax':
+                    probs = torch.softmax(outputs, dim=1)
+                else:
+                    # LogSoftmax was applied, convert to probabilities
+                    probs = torch.exp(outputs)
+                
+                # Extract positive class probabilities
+                positive_probs = probs[:, 1] if probs.shape[1] > 1 else probs[:, 0]
+                stats.update(positive_probs)
+                
+                if keep_all:
+                    raw_logits.append(outputs)
+                    raw_probs.append(probs)
+                if keep_every:
+                    offset = (-start) % keep_every
+                    kept_scores.append(positive_probs[offset::keep_every])
             
-            # Extract positive class probabilities
-            positive_probs = probs[:, 1] if probs.shape[1] > 1 else probs[:, 0]
+            self.logger.info(f"{model_type} positive prob range: [{stats.min:.6f}, {stats.max:.6f}]")
             
-            self.logger.info(f"{model_type} probabilities: {positive_probs}")
+            window_scores = torch.cat(kept_scores).tolist() if kept_scores else []
             
             # Aggregate results
-            result = self._aggregate_predictions(positive_probs, model_type, audio_info)
+            result = self._aggregate_predictions(stats, model_type, audio_info,
+                                                 window_scores, keep_every)
             
-            # Add raw output information for debugging
-            result['raw_outputs'] = {
-                'logits': outputs.tolist(),
-                'probabilities': probs.tolist(),
-                'positive_probs': positive_probs.tolist()
-            }
+            # Raw output information for debugging (only when every window is kept)
+            if keep_all:
+                result['raw_outputs'] = {
+                    'logits': torch.cat(raw_logits).tolist(),
+                    'probabilities': torch.cat(raw_probs).tolist(),
+                    'positive_probs': window_scores
+                }
             
             return result
     
-    def _aggregate_predictions(self, positive_probs: torch.Tensor, 
-                             model_type: str, audio_info: Dict) -> Dict:
-        """Aggregate predictions across windows"""
+    def _aggregate_predictions(self, stats: WindowStats, model_type: str,
+                               audio_info: Dict, window_scores: List[float],
+                               window_scores_stride: int) -> Dict:
+        """Aggregate predictions across windows from streaming statistics"""
         
-        # Multiple aggregation strategies
-        aggregation = {
-            'mean': positive_probs.mean().item(),
-            'std': positive_probs.std().item(),
-            'max': positive_probs.max().item(),
-            'min': positive_probs.min().item(),
-            'median': positive_probs.median().item(),
-        }
+        # Multiple aggregation strategies (median and pXX are histogram approximations)
+        aggregation = stats.summary()
         
         # Final score (0-10 scale)
         final_score = aggregation['mean'] * 10
@@ -381,8 +318,9 @@ class OriginalSincNetAnalyzer:
             'score': final_score,
             'confidence': confidence,
             'aggregation': aggregation,
-            'n_windows': len(positive_probs),
-            'window_scores': positive_probs.tolist(),
+            'n_windows': stats.count,
+            'window_scores': window_scores,
+            'window_scores_stride': window_scores_stride,
             'audio_duration': audio_info.get('duration', 0)
         }
     
@@ -410,7 +348,10 @@ class OriginalSincNetAnalyzer:
                     'aggregation_details': result['aggregation']
                 }
                 
-                # Include raw outputs for debugging
+                # Downsampled per-window scores and, when enabled, full raw outputs
+                if result.get('window_scores'):
+                    final_result[model_type]['window_scores'] = result['window_scores']
+                    final_result[model_type]['window_scores_stride'] = result['window_scores_stride']
                 if 'raw_outputs' in result:
                     final_result[model_type]['raw_outputs'] = result['raw_outputs']
         
@@ -472,5 +413,6 @@ class OriginalSincNetAnalyzer:
             'sampling_rate': '16kHz',
             'cnn_layers': '3 layers [80, 60, 60] filters',
             'dnn_layers': '3 layers [2048, 2048, 2048] neurons',
-            'normalization': 'Layer normalization + zero mean/unit variance'
+            'normalization': 'Layer normalization + zero mean/unit variance',
+            'registry': self.registry.get_info()
         }
\ No newline at end of file
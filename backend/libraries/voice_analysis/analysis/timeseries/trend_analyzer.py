@@ -11,6 +11,8 @@ import warnings
 from statsmodels.tsa.seasonal import seasonal_decompose
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
+from .trend_kernels import kendall_s, pair_count, slope_order_statistics
+
 class TrendAnalyzer:
     """
     고급 시계열 추세 분석기
@@ -126,11 +128,8 @@ class TrendAnalyzer:
         """Mann-Kendall 추세 검정 수행"""
         n = len(values)
         
-        # Kendall's S 통계량 계산
-        s = 0
-        for i in range(n-1):
-            for j in range(i+1, n):
-                s += np.sign(values[j] - values[i])
+        # Kendall's S 통계량 계산 (긴 시계열은 O(n log n))
+        s = kendall_s(values)
         
         # 분산 계산 (타이 값 보정 포함)
         unique_values, counts = np.unique(values, return_counts=True)
@@ -165,32 +164,25 @@ class TrendAnalyzer:
     
     def _calculate_sens_slope(self, values: List[float]) -> Dict:
         """Sen's slope 추정 (비모수적 기울기)"""
-        n = len(values)
-        slopes = []
-        
-        for i in range(n-1):
-            for j in range(i+1, n):
-                if j != i:
-                    slope = (values[j] - values[i]) / (j - i)
-                    slopes.append(slope)
+        # 쌍별 기울기 전체를 정렬하지 않고 필요한 순위만 선택
+        n_slopes = pair_count(len(values))
         
-        if not slopes:
+        if n_slopes == 0:
             return {'slope': 0, 'confidence_interval': (0, 0)}
         
-        # 중앙값이 Sen's slope
-        sens_slope = np.median(slopes)
-        
-        # 95% 신뢰구간 계산
-        slopes_sorted = np.sort(slopes)
-        n_slopes = len(slopes_sorted)
-        alpha = 1 - 0.95
+        # 95% 신뢰구간 순위
         rank_lower = int(np.floor((n_slopes - 1.96 * np.sqrt(n_slopes)) / 2))
         rank_upper = int(np.ceil((n_slopes + 1.96 * np.sqrt(n_slopes)) / 2))
         
         rank_lower = max(0, rank_lower)
         rank_upper = min(n_slopes - 1, rank_upper)
         
-        confidence_interval = (slopes_sorted[rank_lower], slopes_sorted[rank_upper])
+        # 중앙값이 Sen's slope (짝수 개면 가운데 두 값의 평균)
+        median_ranks = [n_slopes // 2] if n_slopes % 2 else [n_slopes // 2 - 1, n_slopes // 2]
+        order_stats = slope_order_statistics(values, [rank_lower, rank_upper] + median_ranks)
+        
+        sens_slope = float(np.mean(order_stats[2:]))
+        confidence_interval = (order_stats[0], order_stats[1])
         
         return {
             'slope': sens_slope,
@@ -0,0 +1,493 @@
+"""
+시니어별 증분 추세 상태 저장 모듈
+
+분석할 때마다 30일치 기록을 다시 조회하지 않도록, 시니어마다 최근 지표 벡터의
+고정 길이 링 버퍼와 지표별 누적 통계(개수/평균/분산/최소/최대)를 하나의 요약
+문서로 유지합니다. 새 결과는 요약 문서 하나를 읽고 쓰는 것으로 반영됩니다.
+
+- FirestoreTrendStoreBackend: 운영용 (시니어당 문서 1개, 트랜잭션 갱신)
+- SQLiteTrendStoreBackend: 로컬 테스트용
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올려서 기존 요약 문서를 다시 구축
+STATE_FORMAT_VERSION = 1
+
+TREND_METRICS = ('DRI', 'SDI', 'CFL', 'ES', 'OV')
+VOICE_PATTERN_METRICS = ('speechRate', 'pauseRatio')
+
+
+def _normalize_timestamp(value: Any) -> Optional[str]:
+    """타임스탬프를 로컬 시간 기준 ISO 문자열로 통일 (문자열 비교 = 시간 순 비교)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value.isoformat(timespec='microseconds')
+
+
+def _indicator_value(value: Any) -> Optional[float]:
+    """지표 값 추출 (숫자 또는 coreIndicators 형식의 {'value': ...})"""
+    if isinstance(value, dict):
+        value = value.get('value')
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+@dataclass
+class RunningStats:
+    """Welford 방식 누적 통계 (O(1) 갱신)"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'min': self.minimum,
+            'max': self.maximum
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        return cls(
+            count=int(data.get('count', 0)),
+            mean=float(data.get('mean', 0.0)),
+            m2=float(data.get('m2', 0.0)),
+            minimum=data.get('min'),
+            maximum=data.get('max')
+        )
+
+
+@dataclass
+class TrendState:
+    """
+    시니어 한 명의 추세 상태
+
+    ``entries``는 시간 순으로 정렬된 (타임스탬프, 지표, 음성 패턴) 링 버퍼이고,
+    ``stats``는 버퍼에서 밀려난 기록까지 포함한 전체 기간 누적 통계입니다.
+    """
+    user_id: str
+    window_size: int = 60
+    entries: Deque[Tuple[str, Dict[str, float], Dict[str, float]]] = field(default_factory=deque)
+    stats: Dict[str, RunningStats] = field(default_factory=dict)
+    total_records: int = 0
+    updated_at: Optional[str] = None
+
+    def __post_init__(self):
+        self.entries = deque(self.entries, maxlen=self.window_size)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, record: Dict[str, Any]) -> bool:
+        """
+        분석 기록 하나 반영
+
+        Args:
+            record: 'analysis_timestamp'(또는 'timestamp')와 'indicators'(또는
+                'coreIndicators')를 가진 기록
+
+        Returns:
+            반영 여부 (타임스탬프/지표가 없거나 이미 반영된 기록이면 False)
+        """
+        timestamp = _normalize_timestamp(record.get('analysis_timestamp', record.get('timestamp')))
+        raw_indicators = record.get('indicators') or record.get('coreIndicators') or {}
+        indicators = {}
+        for metric in TREND_METRICS:
+            value = _indicator_value(raw_indicators.get(metric))
+            if value is not None:
+                indicators[metric] = value
+        if timestamp is None or not indicators:
+            return False
+
+        voice_patterns = {}
+        for metric in VOICE_PATTERN_METRICS:
+            value = _indicator_value((record.get('voicePatterns') or {}).get(metric))
+            if value is not None:
+                voice_patterns[metric] = value
+
+        # 대부분 마지막에 추가되므로 끝에서만 비교, 늦게 도착한 기록만 정렬 삽입
+        if self.entries and timestamp <= self.entries[-1][0]:
+            timestamps = [entry[0] for entry in self.entries]
+            position = bisect.bisect_left(timestamps, timestamp)
+            if position < len(timestamps) and timestamps[position] == timestamp:
+                return False
+            if len(self.entries) == self.window_size:
+                if position == 0:
+                    # 버퍼보다 오래된 기록은 누적 통계에만 반영
+                    self._update_stats(indicators)
+                    return True
+                self.entries.popleft()
+                position -= 1
+            self.entries.insert(position, (timestamp, indicators, voice_patterns))
+        else:
+            self.entries.append((timestamp, indicators, voice_patterns))
+
+        self._update_stats(indicators)
+        return True
+
+    def _update_stats(self, indicators: Dict[str, float]):
+        for metric, value in indicators.items():
+            self.stats.setdefault(metric, RunningStats()).add(value)
+        self.total_records += 1
+        self.updated_at = datetime.now().isoformat()
+
+    def to_history(self, days_back: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        TrendAnalyzer 입력 형식의 기록 리스트 (시간 순 정렬)
+
+        Args:
+            days_back: 지정하면 최근 N일 기록만 반환
+        """
+        cutoff = None
+        if days_back is not None:
+            cutoff = (datetime.now() - timedelta(days=days_back)).isoformat(timespec='microseconds')
+
+        history = []
+        for timestamp, indicators, voice_patterns in self.entries:
+            if cutoff is not None and timestamp < cutoff:
+                continue
+            item = {'analysis_timestamp': timestamp, 'indicators': dict(indicators)}
+            if voice_patterns:
+                item['voicePatterns'] = dict(voice_patterns)
+            history.append(item)
+        return history
+
+    def statistics(self) -> Dict[str, Dict[str, Any]]:
+        """지표별 전체 기간 누적 통계 요약"""
+        return {
+            metric: {
+                'count': stats.count,
+                'mean': stats.mean,
+                'std': math.sqrt(stats.variance),
+                'min': stats.minimum,
+                'max': stats.maximum
+            }
+            for metric, stats in self.stats.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': STATE_FORMAT_VERSION,
+            'userId': self.user_id,
+            'windowSize': self.window_size,
+            'entries': [
+                {'t': timestamp, 'i': indicators, 'v': voice_patterns}
+                for timestamp, indicators, voice_patterns in self.entries
+            ],
+            'stats': {metric: stats.to_dict() for metric, stats in self.stats.items()},
+            'totalRecords': self.total_records,
+            'updatedAt': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], window_size: Optional[int] = None) -> 'TrendState':
+        state = cls(
+            user_id=data.get('userId', ''),
+            window_size=window_size or int(data.get('windowSize', 60)),
+            entries=deque(
+                (entry['t'], entry.get('i', {}), entry.get('v', {}))
+                for entry in data.get('entries', [])
+            ),
+            stats={
+                metric: RunningStats.from_dict(values)
+                for metric, values in data.get('stats', {}).items()
+            },
+            total_records=int(data.get('totalRecords', 0)),
+            updated_at=data.get('updatedAt')
+        )
+        return state
+
+
+class TrendStoreBackend:
+    """추세 상태 저장소 인터페이스 (시니어당 요약 문서 1개)"""
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def update(self, user_id: str,
+               mutate: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        요약 문서를 읽고 ``mutate`` 결과로 원자적으로 교체
+
+        ``mutate``가 None을 반환하면 쓰지 않습니다. 반환값은 최종 문서입니다.
+        """
+        raise NotImplementedError
+
+    def delete(self, user_id: str) -> None:
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class SQLiteTrendStoreBackend(TrendStoreBackend):
+    """로컬 SQLite 저장소 (테스트 및 단일 인스턴스 실행용)"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: 임시 디렉터리)
+        """
+        self.db_path = db_path or os.path.join(tempfile.gettempdir(), 'senior_mhealth_trend_state.sqlite3')
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS trend_state ('
+            ' user_id TEXT PRIMARY KEY,'
+            ' state TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT state FROM trend_state WHERE user_id = ?', (user_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, user_id, mutate):
+        with self._lock:
+            # 다른 프로세스와의 동시 갱신도 직렬화
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT state FROM trend_state WHERE user_id = ?', (user_id,)
+                ).fetchone()
+                current = json.loads(row[0]) if row else None
+                updated = mutate(current)
+                if updated is not None:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO trend_state (user_id, state, updated_at) VALUES (?, ?, ?)',
+                        (user_id, json.dumps(updated, ensure_ascii=False), time.time())
+                    )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return updated if updated is not None else current
+
+    def delete(self, user_id: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM trend_state WHERE user_id = ?', (user_id,))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM trend_state').fetchone()[0]
+        return {'backend': 'sqlite', 'path': self.db_path, 'seniors': entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class FirestoreTrendStoreBackend(TrendStoreBackend):
+    """Firestore 저장소 (trend_summaries/{user_id} 문서 1개, 트랜잭션 갱신)"""
+
+    def __init__(self, db, collection: str = 'trend_summaries'):
+        """
+        Args:
+            db: google.cloud.firestore.Client
+            collection: 요약 문서 컬렉션 이름
+        """
+        self.db = db
+        self.collection = collection
+
+    def _doc(self, user_id: str):
+        return self.db.collection(self.collection).document(user_id)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        snapshot = self._doc(user_id).get()
+        return snapshot.to_dict() if snapshot.exists else None
+
+    def update(self, user_id, mutate):
+        from google.cloud import firestore
+
+        doc_ref = self._doc(user_id)
+
+        @firestore.transactional
+        def _apply(transaction):
+            snapshot = doc_ref.get(transaction=transaction)
+            current = snapshot.to_dict() if snapshot.exists else None
+            updated = mutate(current)
+            if updated is not None:
+                transaction.set(doc_ref, updated)
+                return updated
+            return current
+
+        return _apply(self.db.transaction())
+
+    def delete(self, user_id: str) -> None:
+        self._doc(user_id).delete()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': 'firestore', 'collection': self.collection}
+
+
+class TrendStore:
+    """
+    시니어별 증분 추세 저장소
+
+    요약 문서가 없는 시니어는 최초 한 번만 과거 기록 조회(bootstrap)로 상태를
+    구축하고, 이후에는 분석 결과마다 요약 문서 하나만 갱신합니다.
+    """
+
+    def __init__(self, backend: Optional[TrendStoreBackend] = None, window_size: int = 60):
+        """
+        Args:
+            backend: 저장소 (기본값: SQLiteTrendStoreBackend)
+            window_size: 시니어당 보관할 최근 기록 수
+        """
+        self.backend = backend if backend is not None else SQLiteTrendStoreBackend()
+        self.window_size = window_size
+        self.stats = {
+            'loads': 0,
+            'bootstraps': 0,
+            'records': 0,
+            'skipped': 0,
+            'errors': 0
+        }
+
+    @classmethod
+    def from_env(cls, db=None) -> 'TrendStore':
+        """
+        환경 변수 설정으로 생성 (TREND_STORE_BACKEND, TREND_STORE_PATH, TREND_WINDOW_SIZE)
+
+        Args:
+            db: Firestore 클라이언트 (있고 백엔드가 sqlite로 지정되지 않으면 Firestore 사용)
+        """
+        window_size = int(os.getenv('TREND_WINDOW_SIZE', '60'))
+        backend_name = os.getenv('TREND_STORE_BACKEND', 'firestore' if db is not None else 'sqlite').lower()
+        if backend_name == 'firestore' and db is not None:
+            backend = FirestoreTrendStoreBackend(
+                db, collection=os.getenv('TREND_STORE_COLLECTION', 'trend_summaries')
+            )
+        else:
+            backend = SQLiteTrendStoreBackend(db_path=os.getenv('TREND_STORE_PATH') or None)
+        return cls(backend=backend, window_size=window_size)
+
+    def _decode(self, user_id: str, data: Optional[Dict[str, Any]]) -> Optional[TrendState]:
+        if not data or data.get('version') != STATE_FORMAT_VERSION:
+            return None
+        state = TrendState.from_dict(data, window_size=self.window_size)
+        state.user_id = user_id
+        return state
+
+    def load(self, user_id: str,
+             bootstrap: Optional[Callable[[], List[Dict[str, Any]]]] = None) -> TrendState:
+        """
+        시니어의 추세 상태 조회
+
+        Args:
+            user_id: 사용자(시니어) ID
+            bootstrap: 요약 문서가 없을 때 과거 기록을 반환하는 함수 (최초 1회만 호출)
+        """
+        self.stats['loads'] += 1
+        state = self._decode(user_id, self.backend.get(user_id))
+        if state is not None or bootstrap is None:
+            return state or TrendState(user_id, window_size=self.window_size)
+
+        history = bootstrap()
+        self.stats['bootstraps'] += 1
+
+        def _build(current):
+            existing = self._decode(user_id, current)
+            if existing is not None:
+                # 그 사이 다른 인스턴스가 구축함
+                return None
+            built = TrendState(user_id, window_size=self.window_size)
+            for record in history:
+                built.add(record)
+            return built.to_dict()
+
+        data = self.backend.update(user_id, _build)
+        logger.info(f"사용자 {user_id}의 추세 상태 구축: 과거 기록 {len(history)}개")
+        return self._decode(user_id, data) or TrendState(user_id, window_size=self.window_size)
+
+    def record(self, user_id: str, record: Dict[str, Any]) -> Optional[TrendState]:
+        """
+        새 분석 결과를 요약 문서에 반영 (실패해도 분석은 계속되도록 예외를 로그로 처리)
+
+        요약 문서가 없으면(``load``의 구축이 실패한 경우 등) 새로 만들지 않습니다.
+        현재 결과만으로 문서를 만들면 이후 구축이 생략되어 과거 기록이 빠지므로,
+        다음 ``load``에서 저장된 결과를 포함한 과거 기록으로 구축되도록 둡니다.
+
+        Returns:
+            갱신된 상태 (실패하거나 요약 문서가 없으면 None)
+        """
+        added = False
+        missing = False
+
+        def _apply(current):
+            nonlocal added, missing
+            state = self._decode(user_id, current)
+            if state is None:
+                missing = True
+                return None
+            added = state.add(record)
+            return state.to_dict() if added else None
+
+        try:
+            data = self.backend.update(user_id, _apply)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"추세 상태 갱신 실패 ({user_id}): {e}")
+            return None
+
+        if missing:
+            self.stats['skipped'] += 1
+            logger.info(f"사용자 {user_id}의 추세 상태가 없어 반영 생략 (다음 조회 시 구축)")
+            return None
+        if added:
+            self.stats['records'] += 1
+        return self._decode(user_id, data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'window_size': self.window_size, **self.backend.get_stats()}
@@ -30,6 +30,9 @@ import openai
 from openai import OpenAI  # OpenAI 1.51.0에서는 동기 클라이언트 사용
 import google.generativeai as genai
 from .firebase_storage_connector import FirebaseStorageConnector
+from .audio_asset import AudioAsset, calculate_snr, probe_audio
+from .operation_tracker import OperationTracker
+from .stt_cache import STTResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +49,19 @@ class GoogleCloudConnector:
 class GoogleCloudSpeechConnector:
     """Google Cloud Speech API 연동 - 화자 분리 기능 완전 구현"""
     
-    def __init__(self, credentials_path: Optional[str] = None, project_id: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        project_id: Optional[str] = None,
+        result_cache: Optional[STTResultCache] = None
+    ):
         """
         초기화
         
         Args:
             credentials_path: 서비스 계정 키 파일 경로
             project_id: GCP 프로젝트 ID
+            result_cache: STT 결과 캐시 (기본값: 환경 변수 설정의 로컬 SQLite 캐시)
         """
         self.project_id = project_id or os.getenv('GCP_PROJECT_ID', 'senior-mhealth-472007')
         
@@ -74,8 +83,16 @@ class GoogleCloudSpeechConnector:
         # Google Cloud Storage 버킷 설정
         self.bucket_name = os.getenv('GCS_BUCKET_NAME', 'senior-mhealth-472007.firebasestorage.app')
         
-        # Long Running 작업 상태 캐시
+        # Long Running 작업 상태 캐시 및 비동기 추적기
         self.operation_cache = {}
+        self.operation_tracker = OperationTracker(
+            initial_interval=float(os.getenv('STT_POLL_INITIAL_INTERVAL', '2')),
+            max_interval=float(os.getenv('STT_POLL_MAX_INTERVAL', '30')),
+            default_timeout=float(os.getenv('STT_OPERATION_TIMEOUT', '1800'))
+        )
+        
+        # 오디오 내용 해시 + 인식 설정 기반 결과 캐시
+        self.result_cache = result_cache if result_cache is not None else STTResultCache.from_env()
         
         logger.info(f"Google Cloud Speech API 연동 초기화 완료 - Project: {self.project_id}")
     
@@ -84,7 +101,9 @@ class GoogleCloudSpeechConnector:
         audio_path: str,
         language_code: str = 'ko-KR',
         enable_word_confidence: bool = True,
-        use_enhanced_model: bool = True
+        use_enhanced_model: bool = True,
+        asset: Optional[AudioAsset] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         화자 분리를 포함한 음성 인식 (3분 이상 긴 오디오 최적화)
@@ -94,6 +113,8 @@ class GoogleCloudSpeechConnector:
             language_code: 언어 코드
             enable_word_confidence: 단어별 신뢰도 포함 여부
             use_enhanced_model: 향상된 모델 사용 여부
+            asset: 이미 디코딩된 오디오 자산 (있으면 재디코딩 없이 공유)
+            use_cache: False면 결과 캐시를 조회하지 않고 항상 STT 실행
             
         Returns:
             전사 결과 with 화자 분리 정보
@@ -101,23 +122,18 @@ class GoogleCloudSpeechConnector:
         try:
             start_time = time.time()
             
+            # 디코딩 1회로 메타데이터/해시/LINEAR16 변환을 모두 처리
+            if asset is None and os.path.exists(audio_path):
+                asset = AudioAsset.from_file(audio_path)
+            
             # 1. 오디오 메타데이터 추출
-            audio_metadata = self._get_audio_metadata(audio_path)
+            audio_metadata = self._get_audio_metadata(audio_path, asset)
             duration = audio_metadata.get('duration', 0)
             sample_rate = audio_metadata.get('sample_rate', 16000)
             
             logger.info(f"오디오 분석 시작: {duration:.1f}초, {sample_rate}Hz")
             
-            # 2. Firebase Storage에 업로드 (3분 이상은 필수)
-            if duration >= 180 or not os.path.exists(audio_path):
-                # Firebase Storage 또는 GCS에 업로드
-                gs_uri = await self._upload_to_storage(audio_path)
-                logger.info(f"오디오 파일 Storage 업로드 완료: {gs_uri}")
-            else:
-                # 짧은 파일도 일관성을 위해 Storage 사용 권장
-                gs_uri = await self._upload_to_storage(audio_path)
-            
-            # 3. Speech Recognition 설정 구성
+            # 2. Speech Recognition 설정 구성
             # 변환된 LINEAR16 오디오는 항상 16000Hz
             config = self._build_recognition_config(
                 sample_rate=16000,  # LINEAR16 변환 후 항상 16000Hz
@@ -127,19 +143,49 @@ class GoogleCloudSpeechConnector:
                 enable_diarization=True
             )
             
-            # 4. Long Running API 실행 (3분 이상 필수)
+            # 3. 동일 오디오/설정의 캐시된 결과가 있으면 STT 생략
+            # 파일 해시와 SQLite 조회/저장은 블로킹이므로 스레드 풀에서 실행
+            loop = asyncio.get_running_loop()
+            cache_key = None
+            if asset is not None and self.result_cache.enabled:
+                file_hash = await loop.run_in_executor(None, lambda: asset.file_hash)
+                cache_key = STTResultCache.make_key(
+                    file_hash, STTResultCache.config_fingerprint(config)
+                )
+                if use_cache:
+                    cached_result = await loop.run_in_executor(
+                        None, self.result_cache.get, cache_key
+                    )
+                    if cached_result is not None:
+                        cached_result.setdefault('metadata', {}).update({
+                            'processing_time': time.time() - start_time,
+                            'cache_hit': True
+                        })
+                        logger.info(f"STT 캐시 히트 - STT 생략 ({cache_key})")
+                        return cached_result
+            
+            # 4. Firebase Storage에 업로드 (3분 이상은 필수)
+            if duration >= 180 or not os.path.exists(audio_path):
+                # Firebase Storage 또는 GCS에 업로드
+                gs_uri = await self._upload_to_storage(audio_path, asset)
+                logger.info(f"오디오 파일 Storage 업로드 완료: {gs_uri}")
+            else:
+                # 짧은 파일도 일관성을 위해 Storage 사용 권장
+                gs_uri = await self._upload_to_storage(audio_path, asset)
+            
+            # 5. Long Running API 실행 (3분 이상 필수)
             operation = await self._start_long_running_recognition(gs_uri, config)
             
-            # 5. 작업 진행 상황 모니터링
+            # 6. 작업 진행 상황 모니터링
             result = await self._wait_for_operation(operation)
             
-            # 6. 화자 분리 결과 처리
+            # 7. 화자 분리 결과 처리
             processed_result = self._process_diarization_result(result, audio_metadata)
             
-            # 7. 화자 신뢰도 및 검증
+            # 8. 화자 신뢰도 및 검증
             processed_result = self._validate_speaker_separation(processed_result)
             
-            # 8. Storage 정리 (임시 파일)
+            # 9. Storage 정리 (임시 파일)
             if 'temp/' in gs_uri:
                 await self._cleanup_storage(gs_uri)
             
@@ -150,9 +196,15 @@ class GoogleCloudSpeechConnector:
                 'sample_rate': 16000,  # 변환된 샘플레이트
                 'original_sample_rate': sample_rate,
                 'model_used': 'enhanced' if use_enhanced_model else 'standard',
-                'api_type': 'long_running'
+                'api_type': 'long_running',
+                'cache_hit': False
             }
             
+            if cache_key is not None:
+                await loop.run_in_executor(
+                    None, self.result_cache.put, cache_key, processed_result
+                )
+            
             logger.info(f"STT 및 화자 분리 완료 - 처리시간: {processing_time:.2f}초")
             return processed_result
                 
@@ -165,29 +217,18 @@ class GoogleCloudSpeechConnector:
                 'transcript': ''
             }
     
-    def _get_audio_metadata(self, audio_path: str) -> Dict[str, Any]:
-        """오디오 파일 메타데이터 추출"""
+    def _get_audio_metadata(self, audio_path: str,
+                            asset: Optional[AudioAsset] = None) -> Dict[str, Any]:
+        """
+        오디오 파일 메타데이터 추출
+        
+        컨테이너 헤더에서 길이/샘플레이트/채널을 읽고, SNR과 에너지는
+        파일 전체에 고르게 분포한 일부 프레임으로 추정 (전체 디코딩 없음)
+        """
         try:
-            # librosa로 오디오 정보 추출
-            y, sr = librosa.load(audio_path, sr=None, mono=True)
-            duration = len(y) / sr
-            
-            # 추가 메타데이터
-            metadata = {
-                'duration': duration,
-                'sample_rate': sr,
-                'channels': 1,  # mono로 변환
-                'total_samples': len(y),
-                'file_size': os.path.getsize(audio_path) if os.path.exists(audio_path) else 0
-            }
-            
-            # 오디오 품질 평가
-            if len(y) > 0:
-                metadata['snr'] = self._calculate_snr(y)
-                metadata['energy_mean'] = np.mean(np.abs(y))
-                metadata['energy_std'] = np.std(np.abs(y))
-            
-            return metadata
+            if asset is not None:
+                return asset.metadata()
+            return probe_audio(audio_path)
             
         except Exception as e:
             logger.error(f"오디오 메타데이터 추출 실패: {e}")
@@ -195,22 +236,15 @@ class GoogleCloudSpeechConnector:
     
     def _calculate_snr(self, audio: np.ndarray) -> float:
         """신호 대 잡음비 계산"""
-        try:
-            # 간단한 SNR 추정
-            signal_power = np.mean(audio ** 2)
-            noise_floor = np.percentile(np.abs(audio), 10) ** 2
-            
-            if noise_floor > 0:
-                snr = 10 * np.log10(signal_power / noise_floor)
-                return max(0, min(snr, 40))  # 0-40dB 범위
-            return 20.0  # 기본값
-            
-        except:
-            return 20.0
+        return calculate_snr(audio)
     
-    async def _upload_to_storage(self, audio_path: str) -> str:
+    async def _upload_to_storage(self, audio_path: str,
+                                 asset: Optional[AudioAsset] = None) -> str:
         """Firebase Storage 또는 Google Cloud Storage에 업로드 (PCM 변환 포함)"""
         try:
+            if asset is not None:
+                return await self._upload_asset_to_storage(audio_path, asset)
+            
             # 파일 해시로 중복 체크
             file_hash = self._get_file_hash(audio_path)
 
@@ -245,6 +279,53 @@ class GoogleCloudSpeechConnector:
             logger.error(f"Storage 업로드 실패: {e}")
             raise
     
+    async def _upload_asset_to_storage(self, audio_path: str, asset: AudioAsset) -> str:
+        """디코딩된 자산 업로드 (Firebase Storage 우선, 인코딩/업로드는 실행기에서)"""
+        loop = asyncio.get_running_loop()
+        
+        # 전체 녹음 인코딩과 해시 계산은 이벤트 루프 밖에서 수행
+        file_hash = await loop.run_in_executor(None, lambda: asset.file_hash)
+        if asset.needs_conversion:
+            # 디코딩된 버퍼에서 LINEAR16 WAV를 메모리로 인코딩
+            linear16_wav = await loop.run_in_executor(None, asset.to_linear16_wav)
+            filename = Path(audio_path).name + '_linear16.wav'
+        else:
+            # 이미 LINEAR16 16kHz 모노 WAV - 디코딩 없이 원본 업로드
+            logger.info("LINEAR16 16kHz 모노 WAV - 변환 생략")
+            linear16_wav = None
+            filename = Path(audio_path).name
+        
+        # Firebase Storage 우선 시도
+        if self.storage_connector:
+            gs_uri = await loop.run_in_executor(
+                None, self._upload_to_firebase_storage, audio_path, linear16_wav, filename
+            )
+            if gs_uri.startswith('gs://'):
+                return gs_uri
+            # Firebase Storage가 로컬 경로를 반환하면 GCS에 직접 업로드
+        
+        if linear16_wav is None:
+            return await self._upload_to_gcs(audio_path, file_hash)
+        return await self._upload_bytes_to_gcs(linear16_wav, file_hash, filename)
+    
+    def _upload_to_firebase_storage(self, audio_path: str, data: Optional[bytes],
+                                    filename: str) -> str:
+        """Firebase Storage 임시 업로드 (메모리 버퍼는 임시 파일로 기록 후 업로드)"""
+        if data is None:
+            gs_uri, _ = self.storage_connector.upload_temp_audio(audio_path)
+            return gs_uri
+        
+        temp_dir = tempfile.mkdtemp()
+        temp_path = os.path.join(temp_dir, filename)
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            gs_uri, _ = self.storage_connector.upload_temp_audio(temp_path)
+            return gs_uri
+        finally:
+            os.unlink(temp_path)
+            os.rmdir(temp_dir)
+    
     async def _upload_to_gcs(self, audio_path: str, file_hash: str) -> str:
         """Google Cloud Storage에 직접 업로드"""
         try:
@@ -257,12 +338,15 @@ class GoogleCloudSpeechConnector:
             
             blob = bucket.blob(blob_name)
             
-            # 업로드 (재시도 포함)
-            with open(audio_path, 'rb') as audio_file:
-                blob.upload_from_file(
-                    audio_file,
+            # 업로드 (재시도 포함, 동기 호출은 실행기에서)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: blob.upload_from_filename(
+                    audio_path,
                     retry=retry.Retry(deadline=300)  # 5분 타임아웃
                 )
+            )
             
             gs_uri = f"gs://{self.bucket_name}/{blob_name}"
             logger.info(f"GCS 업로드 완료: {gs_uri}")
@@ -273,6 +357,37 @@ class GoogleCloudSpeechConnector:
             logger.error(f"GCS 업로드 실패: {e}")
             raise
     
+    async def _upload_bytes_to_gcs(self, data: bytes, file_hash: str, filename: str) -> str:
+        """메모리의 오디오 바이트를 Google Cloud Storage에 직접 업로드"""
+        try:
+            bucket = self.storage_client.bucket(self.bucket_name)
+            
+            # 고유한 blob 이름 생성
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            blob_name = f"audio/temp/{timestamp}_{file_hash[:8]}_{filename}"
+            
+            blob = bucket.blob(blob_name)
+            
+            # 업로드 (재시도 포함, 동기 호출은 실행기에서)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: blob.upload_from_file(
+                    io.BytesIO(data),
+                    content_type='audio/wav',
+                    retry=retry.Retry(deadline=300)  # 5분 타임아웃
+                )
+            )
+            
+            gs_uri = f"gs://{self.bucket_name}/{blob_name}"
+            logger.info(f"GCS 업로드 완료 (메모리 버퍼 {len(data) / 1024 / 1024:.1f}MB): {gs_uri}")
+            
+            return gs_uri
+            
+        except Exception as e:
+            logger.error(f"GCS 업로드 실패: {e}")
+            raise
+    
     def _get_file_hash(self, file_path: str) -> str:
         """파일 해시 계산"""
         hash_md5 = hashlib.md5()
@@ -379,66 +494,64 @@ class GoogleCloudSpeechConnector:
         
         audio = speech.RecognitionAudio(uri=gs_uri)
         
-        # Long Running 작업 시작
-        operation = self.client.long_running_recognize(
-            config=config,
-            audio=audio,
-            retry=retry.Retry(deadline=600)  # 10분 타임아웃
+        # Long Running 작업 시작 (동기 RPC는 실행기에서 호출)
+        loop = asyncio.get_running_loop()
+        operation = await loop.run_in_executor(
+            None,
+            lambda: self.client.long_running_recognize(
+                config=config,
+                audio=audio,
+                retry=retry.Retry(deadline=600)  # 10분 타임아웃
+            )
         )
         
-        # operation 정보 로깅 (name 속성이 없어도 안전하게 처리)
-        operation_id = str(id(operation))  # 객체 ID 사용
+        operation_id = self._get_operation_id(operation)
         logger.info(f"Long Running Recognition 시작 - Operation ID: {operation_id}")
         
-        # 작업 정보 캐싱 (name 대신 객체 ID 사용)
+        # 작업 정보 캐싱 (완료/실패 시 _wait_for_operation에서 제거)
         self.operation_cache[operation_id] = {
             'started_at': datetime.now(),
-            'gs_uri': gs_uri,
-            'operation': operation  # operation 객체 자체를 저장
+            'gs_uri': gs_uri
         }
         
         return operation
     
-    async def _wait_for_operation(self, operation: Any, poll_interval: int = 5) -> Any:
-        """Long Running 작업 완료 대기"""
+    def _get_operation_id(self, operation: Any) -> str:
+        """작업 식별자 (서버 작업 이름이 없으면 객체 ID 사용)"""
+        name = getattr(getattr(operation, 'operation', None), 'name', None)
+        return name or str(id(operation))
+    
+    async def _wait_for_operation(self, operation: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Long Running 작업 완료 대기
+        
+        이벤트 루프를 막지 않도록 OperationTracker가 백오프 간격으로 상태를 폴링하므로,
+        같은 워커에서 여러 인식 작업을 동시에 대기할 수 있습니다.
         
-        logger.info("작업 진행 상황 모니터링 시작...")
+        Args:
+            operation: long_running_recognize가 반환한 작업 객체
+            timeout: 작업별 마감 시간 (초, 기본값: 30분)
+        """
+        operation_id = self._get_operation_id(operation)
+        logger.info(f"작업 진행 상황 모니터링 시작 - Operation ID: {operation_id}")
         
         try:
-            # result() 메서드를 사용하여 완료 대기 (권장 방식)
-            # timeout을 설정하여 최대 30분까지 대기
-            result = operation.result(timeout=1800)  # 30분 타임아웃
+            result = await self.operation_tracker.wait(
+                operation, operation_id=operation_id, timeout=timeout
+            )
             logger.info("Long Running Recognition 완료")
             return result
             
         except Exception as e:
             logger.error(f"Speech API 작업 대기 중 오류: {e}")
-            # 대체 방법: 폴링을 통한 수동 대기
-            try:
-                start_time = time.time()
-                while True:
-                    # done() 메서드가 있는 경우만 사용
-                    if hasattr(operation, 'done') and callable(operation.done):
-                        if operation.done():
-                            break
-                    
-                    # 타임아웃 체크
-                    if time.time() - start_time > 1800:
-                        raise TimeoutError("STT 처리 시간 초과 (30분)")
-                    
-                    await asyncio.sleep(poll_interval)
-                
-                # 결과 가져오기
-                if hasattr(operation, 'result'):
-                    result = operation.result()
-                    logger.info("Long Running Recognition 완료 (폴백 방식)")
-                    return result
-                else:
-                    raise RuntimeError("Operation 객체에 result() 메서드가 없습니다")
-                    
-            except Exception as fallback_error:
-                logger.error(f"폴백 방식도 실패: {fallback_error}")
-                raise
+            raise
+            
+        finally:
+            self.operation_cache.pop(operation_id, None)
+    
+    def cancel_operation(self, operation_id: str) -> bool:
+        """진행 중인 인식 작업 취소"""
+        return self.operation_tracker.cancel(operation_id)
     
     def _process_diarization_result(
         self,
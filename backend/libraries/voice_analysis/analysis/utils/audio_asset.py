@@ -0,0 +1,281 @@
+"""
+오디오 자산 (AudioAsset) 모듈
+요청당 한 번만 디코딩한 float32 파형을 메타데이터 추출, 해시 계산,
+LINEAR16 인코딩, 화자 구간 추출에 공유
+
+메타데이터는 컨테이너 헤더와 일정 간격으로 추출한 소량의 프레임만으로 계산하며,
+전체 디코딩은 실제로 파형이 필요할 때(형식 변환, 특징 분석)만 수행
+"""
+
+import hashlib
+import io
+import logging
+import os
+from functools import cached_property
+from typing import Any, Dict, Optional
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+
+class AudioAsset:
+    """
+    한 번 디코딩하여 재사용하는 오디오 버퍼
+
+    파형은 표준 샘플레이트(16kHz, 모노, float32)로 최초 접근 시 한 번만 디코딩되며,
+    이후 모든 소비자(STT 업로드, 화자 구간 추출, 음성 특징 분석)가 메모리에서 공유합니다.
+    """
+
+    CANONICAL_SAMPLE_RATE = 16000
+
+    def __init__(
+        self,
+        source_path: Optional[str] = None,
+        samples: Optional[np.ndarray] = None,
+        sample_rate: int = CANONICAL_SAMPLE_RATE,
+        original_sample_rate: Optional[int] = None
+    ):
+        """
+        Args:
+            source_path: 원본 오디오 파일 경로
+            samples: 이미 디코딩된 모노 파형 (있으면 디코딩 생략)
+            sample_rate: 파형 샘플레이트 (기본: 16kHz)
+            original_sample_rate: 원본 파일의 샘플레이트
+        """
+        if source_path is None and samples is None:
+            raise ValueError("source_path 또는 samples 중 하나는 필요합니다")
+
+        self.source_path = source_path
+        self.sample_rate = sample_rate
+        if samples is not None:
+            self.__dict__['samples'] = np.ascontiguousarray(samples, dtype=np.float32)
+        if original_sample_rate is not None:
+            self.__dict__['original_sample_rate'] = original_sample_rate
+
+    @classmethod
+    def from_file(cls, audio_path: str,
+                  sample_rate: int = CANONICAL_SAMPLE_RATE) -> 'AudioAsset':
+        """파일 기반 자산 생성 (디코딩은 최초 접근 시 수행)"""
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {audio_path}")
+        return cls(source_path=audio_path, sample_rate=sample_rate)
+
+    @cached_property
+    def samples(self) -> np.ndarray:
+        """표준 샘플레이트의 모노 float32 파형 (요청당 1회 디코딩)"""
+        logger.info(f"오디오 디코딩: {self.source_path} -> {self.sample_rate}Hz")
+        y, _ = librosa.load(self.source_path, sr=self.sample_rate, mono=True)
+        return np.ascontiguousarray(y, dtype=np.float32)
+
+    @cached_property
+    def probe(self) -> Dict[str, Any]:
+        """헤더 기반 메타데이터 (전체 디코딩 없음)"""
+        if self.source_path is None:
+            return _waveform_metadata(self.samples, self.sample_rate)
+        return probe_audio(self.source_path)
+
+    @cached_property
+    def original_sample_rate(self) -> int:
+        """원본 파일의 샘플레이트 (헤더 정보)"""
+        return int(self.probe.get('sample_rate') or self.sample_rate)
+
+    @property
+    def duration(self) -> float:
+        """오디오 길이 (초) - 디코딩 전에는 헤더 값 사용"""
+        if 'samples' in self.__dict__:
+            return len(self.samples) / self.sample_rate
+        return float(self.probe.get('duration', 0.0))
+
+    @property
+    def needs_conversion(self) -> bool:
+        """STT 업로드 전 LINEAR16 16kHz 모노 변환 필요 여부"""
+        if self.source_path is None:
+            return True
+        probe = self.probe
+        return not (
+            probe.get('format') == 'WAV'
+            and probe.get('subtype') == 'PCM_16'
+            and probe.get('sample_rate') == self.CANONICAL_SAMPLE_RATE
+            and probe.get('channels') == 1
+        )
+
+    @property
+    def file_size(self) -> int:
+        """원본 파일 크기 (바이트)"""
+        if self.source_path and os.path.exists(self.source_path):
+            return os.path.getsize(self.source_path)
+        return 0
+
+    @cached_property
+    def file_hash(self) -> str:
+        """원본 파일 바이트의 MD5 해시 (파일이 없으면 파형 기준)"""
+        hash_md5 = hashlib.md5()
+        if self.source_path and os.path.exists(self.source_path):
+            with open(self.source_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hash_md5.update(chunk)
+        else:
+            hash_md5.update(self.samples.tobytes())
+        return hash_md5.hexdigest()
+
+    def metadata(self) -> Dict[str, Any]:
+        """STT 및 품질 평가용 메타데이터 (헤더 + 샘플링된 프레임 기반)"""
+        return dict(self.probe)
+
+    def to_linear16_wav(self) -> bytes:
+        """LINEAR16 PCM WAV 바이트로 인코딩 (메모리 내)"""
+        audio_16bit = (self.samples * 32767).astype(np.int16)
+        buffer = io.BytesIO()
+        sf.write(buffer, audio_16bit, self.sample_rate, format='WAV', subtype='PCM_16')
+        return buffer.getvalue()
+
+    def slice(self, start_time: float, end_time: float) -> np.ndarray:
+        """초 단위 구간의 파형 뷰 (복사 없음)"""
+        start_sample = int(start_time * self.sample_rate)
+        end_sample = int(end_time * self.sample_rate)
+        return self.samples[start_sample:end_sample]
+
+
+def probe_audio(audio_path: str, sample_blocks: int = 32,
+                block_seconds: float = 0.5) -> Dict[str, Any]:
+    """
+    컨테이너 헤더로 길이/샘플레이트/채널을 읽고, 파일 전체에 고르게 분포한
+    일부 프레임(최대 sample_blocks * block_seconds 초)으로 SNR과 에너지를 추정
+
+    Args:
+        audio_path: 오디오 파일 경로
+        sample_blocks: 품질 추정에 사용할 블록 수
+        block_seconds: 블록당 길이 (초)
+
+    Returns:
+        duration, sample_rate, channels, total_samples, file_size, format, subtype,
+        snr, energy_mean, energy_std (프레임을 읽을 수 없으면 품질 항목 제외)
+    """
+    metadata: Dict[str, Any] = {
+        'file_size': os.path.getsize(audio_path) if os.path.exists(audio_path) else 0
+    }
+
+    try:
+        # soundfile: WAV/FLAC/OGG 등 헤더 + 임의 위치 탐색 지원
+        info = sf.info(audio_path)
+        metadata.update({
+            'duration': float(info.duration),
+            'sample_rate': int(info.samplerate),
+            'channels': int(info.channels),
+            'total_samples': int(info.frames),
+            'format': info.format,
+            'subtype': info.subtype
+        })
+        sample = _read_strided_soundfile(audio_path, int(info.frames), int(info.samplerate),
+                                         sample_blocks, block_seconds)
+    except Exception as sf_error:
+        # audioread (ffmpeg 등): m4a/mp3 등 압축 형식
+        import audioread
+        logger.debug(f"soundfile 헤더 읽기 실패, audioread 사용: {sf_error}")
+        with audioread.audio_open(audio_path) as f:
+            metadata.update({
+                'duration': float(f.duration),
+                'sample_rate': int(f.samplerate),
+                'channels': int(f.channels),
+                'total_samples': int(f.duration * f.samplerate),
+                'format': None,
+                'subtype': None
+            })
+            sample = _read_strided_audioread(f, sample_blocks, block_seconds)
+
+    if sample.size > 0:
+        abs_sample = np.abs(sample)
+        metadata['snr'] = calculate_snr(sample)
+        metadata['energy_mean'] = float(np.mean(abs_sample))
+        metadata['energy_std'] = float(np.std(abs_sample))
+
+    return metadata
+
+
+def _waveform_metadata(samples: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    """디코딩된 파형의 메타데이터 (원본 파일이 없는 자산용)"""
+    metadata: Dict[str, Any] = {
+        'duration': len(samples) / sample_rate,
+        'sample_rate': sample_rate,
+        'channels': 1,
+        'total_samples': len(samples),
+        'file_size': 0,
+        'format': None,
+        'subtype': None
+    }
+    if len(samples) > 0:
+        abs_samples = np.abs(samples)
+        metadata['snr'] = calculate_snr(samples)
+        metadata['energy_mean'] = float(np.mean(abs_samples))
+        metadata['energy_std'] = float(np.std(abs_samples))
+    return metadata
+
+
+def _read_strided_soundfile(audio_path: str, total_frames: int, sample_rate: int,
+                            sample_blocks: int, block_seconds: float) -> np.ndarray:
+    """파일 전체에 고르게 분포한 블록만 탐색하여 읽기 (모노 float32)"""
+    block_frames = max(1, int(block_seconds * sample_rate))
+
+    with sf.SoundFile(audio_path) as f:
+        if total_frames <= sample_blocks * block_frames:
+            data = f.read(dtype='float32', always_2d=True)
+            return data.mean(axis=1)
+
+        starts = np.linspace(0, total_frames - block_frames, sample_blocks).astype(np.int64)
+        blocks = []
+        for start in starts:
+            f.seek(int(start))
+            blocks.append(f.read(block_frames, dtype='float32', always_2d=True).mean(axis=1))
+
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+
+
+def _read_strided_audioread(f: Any, sample_blocks: int, block_seconds: float) -> np.ndarray:
+    """
+    탐색이 불가능한 스트림에서 일정 간격의 버퍼만 보관 (모노 float32)
+
+    디코더는 스트림을 순차적으로 읽지만, 메모리에는 최대
+    sample_blocks * block_seconds 초 분량만 유지합니다.
+    """
+    channels = max(1, int(f.channels))
+    target_frames = int(sample_blocks * block_seconds * f.samplerate)
+    total_frames = max(1, int(f.duration * f.samplerate))
+
+    kept = []
+    kept_frames = 0
+    step = None
+    for index, buffer in enumerate(f):
+        frames = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
+        n_frames = len(frames) // channels
+        if n_frames == 0:
+            continue
+        if step is None:
+            # 첫 버퍼 크기로 전체 버퍼 수를 추정하여 보관 간격 결정
+            total_buffers = max(1, total_frames // n_frames)
+            wanted_buffers = max(1, target_frames // n_frames)
+            step = max(1, total_buffers // wanted_buffers)
+        if index % step == 0:
+            kept.append(frames[:n_frames * channels].reshape(-1, channels).mean(axis=1))
+            kept_frames += n_frames
+            if kept_frames >= target_frames:
+                break
+
+    return np.concatenate(kept) if kept else np.zeros(0, dtype=np.float32)
+
+
+def calculate_snr(audio: np.ndarray) -> float:
+    """신호 대 잡음비 계산 (간단한 추정)"""
+    try:
+        signal_power = np.mean(audio ** 2)
+        noise_floor = np.percentile(np.abs(audio), 10) ** 2
+
+        if noise_floor > 0:
+            snr = 10 * np.log10(signal_power / noise_floor)
+            return float(max(0, min(snr, 40)))  # 0-40dB 범위
+        return 20.0  # 기본값
+
+    except Exception:
+        return 20.0
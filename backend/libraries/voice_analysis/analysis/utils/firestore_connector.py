@@ -5,12 +5,14 @@ GCP 운영 환경에서 과거 분석 결과 조회 및 저장
 
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from google.cloud import firestore
 from google.oauth2 import service_account
 import asyncio
 
+from ..timeseries.trend_store import _normalize_timestamp
+
 logger = logging.getLogger(__name__)
 
 # NotificationService import (필요시 활성화)
@@ -25,16 +27,29 @@ except ImportError as e:
     NOTIFICATION_ENABLED = False
     logger.warning(f"NotificationService를 가져올 수 없습니다: {e}")
 
+# WriteBatch 한 번에 넣을 수 있는 최대 쓰기 수
+BATCH_WRITE_LIMIT = 500
+
+# 추세 분석용 기록 조회 시 가져올 필드 (transformedResult 전체를 읽지 않음)
+HISTORY_INDICATOR_FIELDS = ['callId', 'timestamp', 'transformedResult.result.coreIndicators']
+LEGACY_HISTORY_INDICATOR_FIELDS = ['analysis_timestamp', 'indicators']
+
 class FirestoreConnector:
     """Firestore 데이터베이스 연동 클래스"""
     
-    def __init__(self, credentials_path: Optional[str] = None, project_id: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        project_id: Optional[str] = None,
+        db: Optional[Any] = None
+    ):
         """
         초기화
         
         Args:
             credentials_path: 서비스 계정 키 파일 경로
             project_id: GCP 프로젝트 ID
+            db: 미리 생성한 Firestore 클라이언트 (테스트용 에뮬레이터/인메모리 클라이언트 주입)
         """
         self.project_id = project_id or os.getenv('GCP_PROJECT_ID')
         
@@ -42,7 +57,11 @@ class FirestoreConnector:
         emulator_host = os.getenv('FIRESTORE_EMULATOR_HOST')
         self.is_emulator = bool(emulator_host)
         
-        if self.is_emulator:
+        if db is not None:
+            # 주입된 클라이언트 사용
+            self.db = db
+            
+        elif self.is_emulator:
             # 에뮬레이터 모드: 인증 없이 연결
             logger.info(f"🧪 Firestore 에뮬레이터 모드: {emulator_host}")
             os.environ['FIRESTORE_EMULATOR_HOST'] = emulator_host
@@ -81,12 +100,96 @@ class FirestoreConnector:
             'is_emulator': self.is_emulator
         }
     
+    def batch_write(self, operations: Iterable[Tuple[str, Any, Optional[Dict[str, Any]]]]) -> int:
+        """
+        여러 문서 쓰기를 WriteBatch로 묶어 커밋 (500개 단위)
+        
+        Args:
+            operations: (작업, 문서 참조, 데이터) 목록.
+                작업은 'set', 'merge'(병합 set), 'update', 'delete' 중 하나
+            
+        Returns:
+            커밋된 쓰기 수
+        """
+        batch = self.db.batch()
+        pending = 0
+        committed = 0
+        
+        for action, doc_ref, data in operations:
+            if action == 'set':
+                batch.set(doc_ref, data)
+            elif action == 'merge':
+                batch.set(doc_ref, data, merge=True)
+            elif action == 'update':
+                batch.update(doc_ref, data)
+            elif action == 'delete':
+                batch.delete(doc_ref)
+            else:
+                raise ValueError(f"지원하지 않는 쓰기 작업: {action}")
+            pending += 1
+            
+            if pending == BATCH_WRITE_LIMIT:
+                batch.commit()
+                committed += pending
+                batch = self.db.batch()
+                pending = 0
+        
+        if pending:
+            batch.commit()
+            committed += pending
+        return committed
+    
+    def bulk_delete(self, doc_refs: Iterable[Any]) -> int:
+        """
+        여러 문서 삭제 (BulkWriter 사용, 지원하지 않는 클라이언트는 WriteBatch)
+        
+        Returns:
+            삭제 요청한 문서 수
+        """
+        if not hasattr(self.db, 'bulk_writer'):
+            return self.batch_write(('delete', doc_ref, None) for doc_ref in doc_refs)
+        
+        writer = self.db.bulk_writer()
+        count = 0
+        try:
+            for doc_ref in doc_refs:
+                writer.delete(doc_ref)
+                count += 1
+        finally:
+            # 남은 쓰기를 모두 전송하고 완료까지 대기
+            writer.close()
+        return count
+    
+    def get_documents(
+        self,
+        doc_refs: Sequence[Any],
+        field_paths: Optional[List[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 문서를 get_all 한 번으로 조회
+        
+        Args:
+            doc_refs: 문서 참조 목록
+            field_paths: 가져올 필드 (None이면 전체)
+            
+        Returns:
+            doc_refs 순서대로 문서 데이터 (없는 문서는 None)
+        """
+        if not doc_refs:
+            return []
+        
+        snapshots = {}
+        for snapshot in self.db.get_all(list(doc_refs), field_paths=field_paths):
+            snapshots[snapshot.reference.path] = snapshot.to_dict() if snapshot.exists else None
+        return [snapshots.get(doc_ref.path) for doc_ref in doc_refs]
+    
     def get_user_analysis_history(
         self,
         user_id: str,
         days_back: int = 30,
         limit: Optional[int] = None,
-        use_new_schema: bool = True
+        use_new_schema: bool = True,
+        indicators_only: bool = False
     ) -> List[Dict[str, Any]]:
         """
         사용자의 과거 분석 기록 조회 (개선된 스키마 지원)
@@ -96,6 +199,7 @@ class FirestoreConnector:
             days_back: 조회할 과거 일수
             limit: 최대 조회 개수
             use_new_schema: 새로운 스키마 사용 여부
+            indicators_only: True면 타임스탬프와 5대 지표 필드만 조회 (추세 분석용)
             
         Returns:
             분석 기록 리스트 (시간순 정렬)
@@ -119,6 +223,10 @@ class FirestoreConnector:
                         .where(filter=('analysis_timestamp', '<=', end_date))
                         .order_by('analysis_timestamp'))
             
+            if indicators_only:
+                # 필드 프로젝션: 문서 전체 대신 필요한 필드만 전송
+                query = query.select(HISTORY_INDICATOR_FIELDS if use_new_schema else LEGACY_HISTORY_INDICATOR_FIELDS)
+            
             if limit:
                 query = query.limit(limit)
             
@@ -130,6 +238,10 @@ class FirestoreConnector:
                 data = doc.to_dict()
                 data['doc_id'] = doc.id
                 
+                if indicators_only:
+                    history.append(self._to_indicator_record(data, use_new_schema))
+                    continue
+                
                 if use_new_schema:
                     # analyses 컬렉션 스키마
                     transformed = data.get('transformedResult', {})
@@ -155,6 +267,10 @@ class FirestoreConnector:
                     }
                 history.append(history_item)
             
+            if use_new_schema:
+                # 최신순으로 조회했으므로 시간순으로 뒤집음
+                history.reverse()
+            
             logger.info(f"사용자 {user_id}의 분석 기록 {len(history)}개 조회 완료 (스키마: {'새로운' if use_new_schema else '기존'})")
             return history
             
@@ -162,6 +278,30 @@ class FirestoreConnector:
             logger.error(f"분석 기록 조회 실패: {e}")
             return []
     
+    @staticmethod
+    def _to_indicator_record(data: Dict[str, Any], use_new_schema: bool) -> Dict[str, Any]:
+        """프로젝션 조회 결과를 TrendAnalyzer 입력 형식으로 변환"""
+        if use_new_schema:
+            timestamp = data.get('timestamp')
+            core_indicators = data.get('transformedResult', {}).get('result', {}).get('coreIndicators', {})
+        else:
+            timestamp = data.get('analysis_timestamp')
+            core_indicators = data.get('indicators', {})
+        
+        indicators = {}
+        for key, value in (core_indicators or {}).items():
+            if isinstance(value, dict):
+                value = value.get('value')
+            if isinstance(value, (int, float)):
+                indicators[key] = value
+        
+        return {
+            'analysisId': data.get('callId', data['doc_id']),
+            # 파이프라인의 현재 기록과 같은 로컬 naive 형식으로 통일 (tz-aware와 섞이면 추세 분석 실패)
+            'analysis_timestamp': _normalize_timestamp(timestamp) or str(timestamp),
+            'indicators': indicators
+        }
+    
     def get_latest_analysis_with_indicators(
         self,
         user_id: str,
@@ -273,26 +413,38 @@ class FirestoreConnector:
                     'legacy': analysis_result.get('legacy', {})
                 }
                 
-                # analyses 서브컬렉션에 저장
-                if call_id:
-                    # call_id가 있으면 해당 ID로 문서 생성
-                    doc_ref = self.db.collection('users').document(user_id).collection('analyses').document(call_id)
-                    doc_ref.set(doc_data)
-                    doc_id = call_id
-                else:
-                    # call_id가 없으면 자동 ID 생성
-                    doc_ref = self.db.collection('users').document(user_id).collection('analyses').add(doc_data)
-                    doc_id = doc_ref[1].id
+                # analyses 서브컬렉션에 저장 (call_id가 없으면 자동 ID 생성)
+                user_ref = self.db.collection('users').document(user_id)
+                analyses = user_ref.collection('analyses')
+                doc_ref = analyses.document(call_id) if call_id else analyses.document()
+                doc_id = doc_ref.id
+                operations = [('set', doc_ref, doc_data)]
+                
+                # 통화 문서 존재 여부와 알림용 시니어 이름을 get_all 한 번으로 조회
+                call_ref = user_ref.collection('calls').document(call_id) if call_id and senior_id else None
+                senior_ref = None
+                if senior_id and NOTIFICATION_ENABLED and notification_service:
+                    senior_ref = user_ref.collection('seniors').document(senior_id)
+                lookup_refs = [ref for ref in (call_ref, senior_ref) if ref is not None]
+                lookups = dict(zip(
+                    [ref.path for ref in lookup_refs],
+                    self.get_documents(lookup_refs, field_paths=['name'])
+                ))
+                
+                # calls 서브컬렉션 업데이트 (연결된 통화가 있는 경우) - 분석 문서와 한 번에 커밋
+                if call_ref is not None:
+                    if lookups.get(call_ref.path) is not None:
+                        operations.append(('update', call_ref, {
+                            'hasAnalysis': True,
+                            'analysisCompletedAt': firestore.SERVER_TIMESTAMP,
+                            'analysisStatus': 'completed',
+                            'updatedAt': firestore.SERVER_TIMESTAMP
+                        }))
+                    else:
+                        # 없는 통화 문서를 만들면 보호자 앱 목록에 빈 통화가 표시됨
+                        logger.warning(f"통화 문서 없음 - 분석 상태 갱신 생략: {user_id}/calls/{call_id}")
                 
-                # calls 서브컬렉션 업데이트 (연결된 통화가 있는 경우)
-                if call_id and senior_id:
-                    call_ref = self.db.collection('users').document(user_id).collection('calls').document(call_id)
-                    call_ref.update({
-                        'hasAnalysis': True,
-                        'analysisCompletedAt': firestore.SERVER_TIMESTAMP,
-                        'analysisStatus': 'completed',
-                        'updatedAt': firestore.SERVER_TIMESTAMP
-                    })
+                self.batch_write(operations)
                 
                 logger.info(f"✅ 개선된 스키마로 분석 결과 저장 완료: {user_id} -> {doc_id}")
                 logger.info(f"   5대 지표: DRI={doc_data['coreIndicators'].get('DRI', {}).get('value', 'N/A')}, "
@@ -306,10 +458,9 @@ class FirestoreConnector:
                     try:
                         # 시니어 이름 가져오기
                         senior_name = "시니어"  # 기본값
-                        if senior_id:
-                            senior_doc = self.db.collection('users').document(user_id).collection('seniors').document(senior_id).get()
-                            if senior_doc.exists:
-                                senior_name = senior_doc.to_dict().get('name', '시니어')
+                        senior_data = lookups.get(senior_ref.path) if senior_ref is not None else None
+                        if senior_data is not None:
+                            senior_name = senior_data.get('name', '시니어')
 
                         # 비동기 알림 전송
                         asyncio.create_task(
@@ -440,24 +591,26 @@ class FirestoreConnector:
             if not start_date:
                 start_date = end_date - timedelta(days=30)
             
-            # 기간 내 분석 수 조회
+            # 기간 내 분석 조회 (통계에 필요한 필드만 프로젝션)
             query = (self.db.collection(self.analysis_collection)
                     .where('analysis_timestamp', '>=', start_date)
-                    .where('analysis_timestamp', '<=', end_date))
+                    .where('analysis_timestamp', '<=', end_date)
+                    .select(['user_id', 'risk_assessment.overall_risk']))
             
-            docs = list(query.stream())
-            
-            # 통계 계산
-            total_analyses = len(docs)
-            unique_users = len(set(doc.to_dict().get('user_id') for doc in docs))
-            
-            # 위험 수준별 분포
+            # 통계 계산 (문서를 한 번만 순회)
+            total_analyses = 0
+            users = set()
             risk_distribution = {'low': 0, 'moderate': 0, 'high': 0}
-            for doc in docs:
+            for doc in query.stream():
                 data = doc.to_dict()
+                total_analyses += 1
+                users.add(data.get('user_id'))
+                
+                # 위험 수준별 분포
                 risk_level = data.get('risk_assessment', {}).get('overall_risk', 'unknown')
                 if risk_level in risk_distribution:
                     risk_distribution[risk_level] += 1
+            unique_users = len(users)
             
             statistics = {
                 'period': {
@@ -493,18 +646,16 @@ class FirestoreConnector:
             return False
         
         try:
-            # 분석 기록 삭제
-            analyses_query = self.db.collection(self.analysis_collection).where('user_id', '==', user_id)
-            analyses_docs = analyses_query.stream()
-            
-            deleted_count = 0
-            for doc in analyses_docs:
-                doc.reference.delete()
-                deleted_count += 1
+            # 분석 기록 삭제 (문서 참조만 조회한 뒤 일괄 삭제)
+            analyses_query = (self.db.collection(self.analysis_collection)
+                             .where('user_id', '==', user_id)
+                             .select([]))
+            analysis_refs = [doc.reference for doc in analyses_query.stream()]
             
-            # 사용자 프로필 삭제
+            # 사용자 프로필과 함께 삭제
             user_doc_ref = self.db.collection(self.users_collection).document(user_id)
-            user_doc_ref.delete()
+            self.bulk_delete(analysis_refs + [user_doc_ref])
+            deleted_count = len(analysis_refs)
             
             logger.info(f"사용자 데이터 삭제 완료: {user_id} (분석기록 {deleted_count}건)")
             return True
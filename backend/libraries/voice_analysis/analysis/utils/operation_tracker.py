@@ -0,0 +1,189 @@
+"""
+Long Running 작업 추적 모듈
+Google Cloud Long Running Operation을 이벤트 루프를 막지 않고 폴링
+(백오프, 작업별 마감 시간, 취소 지원)
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackedOperation:
+    """추적 중인 작업 정보"""
+    operation_id: str
+    operation: Any
+    started_at: float
+    deadline: float
+    polls: int = 0
+    waiter: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class OperationTracker:
+    """
+    비동기 Long Running 작업 추적기
+
+    ``done()`` / ``result()`` / ``cancel()`` 메서드를 가진 모든 작업 객체를 지원합니다
+    (google.api_core.operation.Operation 또는 테스트용 가짜 객체).
+    ``done()``은 상태 조회 RPC를 수행하므로 실행기 스레드에서 호출하고,
+    폴링 사이에는 ``asyncio.sleep``으로 대기하여 다른 분석이 계속 진행되도록 합니다.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        default_timeout: float = 1800.0,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            initial_interval: 첫 폴링 간격 (초)
+            max_interval: 최대 폴링 간격 (초)
+            backoff: 폴링 간격 증가 배수
+            default_timeout: 작업별 기본 마감 시간 (초)
+            executor: 동기 RPC 호출용 실행기 (None이면 이벤트 루프 기본 실행기)
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.default_timeout = default_timeout
+        self.executor = executor
+
+        self._operations: Dict[str, TrackedOperation] = {}
+        self._id_counter = itertools.count(1)
+        self.stats = {
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'cancelled': 0
+        }
+
+    async def _call(self, func, *args) -> Any:
+        """동기 RPC를 실행기에서 호출"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def wait(
+        self,
+        operation: Any,
+        operation_id: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        작업 완료까지 비동기 대기
+
+        Args:
+            operation: 추적할 작업 객체
+            operation_id: 작업 식별자 (없으면 자동 생성)
+            timeout: 이 작업의 마감 시간 (초, 기본값: default_timeout)
+
+        Returns:
+            operation.result() 결과
+
+        Raises:
+            TimeoutError: 마감 시간 초과 (원격 작업은 취소 요청됨)
+            asyncio.CancelledError: cancel() 또는 상위 태스크 취소
+        """
+        operation_id = operation_id or f"op-{next(self._id_counter)}"
+        now = time.monotonic()
+        tracked = TrackedOperation(
+            operation_id=operation_id,
+            operation=operation,
+            started_at=now,
+            deadline=now + (timeout if timeout is not None else self.default_timeout),
+            waiter=asyncio.current_task()
+        )
+        self._operations[operation_id] = tracked
+        interval = self.initial_interval
+
+        try:
+            while True:
+                tracked.polls += 1
+                if await self._call(operation.done):
+                    break
+
+                remaining = tracked.deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats['timed_out'] += 1
+                    await self._cancel_remote(tracked)
+                    raise TimeoutError(
+                        f"작업 {operation_id} 처리 시간 초과 ({tracked.elapsed:.0f}초)"
+                    )
+
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * self.backoff, self.max_interval)
+
+            try:
+                result = await self._call(operation.result)
+            except Exception:
+                self.stats['failed'] += 1
+                raise
+
+            self.stats['completed'] += 1
+            logger.info(f"작업 {operation_id} 완료 ({tracked.elapsed:.1f}초, 폴링 {tracked.polls}회)")
+            return result
+
+        except asyncio.CancelledError:
+            self.stats['cancelled'] += 1
+            logger.warning(f"작업 {operation_id} 대기 취소 - 원격 작업 취소 요청")
+            await asyncio.shield(self._cancel_remote(tracked))
+            raise
+
+        finally:
+            self._operations.pop(operation_id, None)
+
+    async def _cancel_remote(self, tracked: TrackedOperation) -> None:
+        """원격 작업 취소 요청 (지원하지 않거나 실패해도 무시)"""
+        cancel = getattr(tracked.operation, 'cancel', None)
+        if not callable(cancel):
+            return
+        try:
+            await self._call(cancel)
+        except Exception as e:
+            logger.warning(f"작업 {tracked.operation_id} 취소 요청 실패: {e}")
+
+    def cancel(self, operation_id: str) -> bool:
+        """
+        진행 중인 작업 대기 취소
+
+        Returns:
+            취소 요청 여부 (해당 작업이 없으면 False)
+        """
+        tracked = self._operations.get(operation_id)
+        if tracked is None or tracked.waiter is None:
+            return False
+        return tracked.waiter.cancel()
+
+    def cancel_all(self) -> int:
+        """모든 진행 중인 작업 대기 취소"""
+        return sum(1 for operation_id in list(self._operations) if self.cancel(operation_id))
+
+    def in_flight(self) -> List[Dict[str, Any]]:
+        """진행 중인 작업 목록"""
+        now = time.monotonic()
+        return [
+            {
+                'operation_id': tracked.operation_id,
+                'elapsed': now - tracked.started_at,
+                'remaining': max(0.0, tracked.deadline - now),
+                'polls': tracked.polls
+            }
+            for tracked in self._operations.values()
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """추적 통계"""
+        return {**self.stats, 'in_flight': len(self._operations)}
@@ -0,0 +1,258 @@
+"""
+STT 결과 캐시 모듈
+오디오 내용 해시와 인식 설정 지문(fingerprint)을 키로 처리된 STT 결과를 저장하여
+동일 녹음의 재분석(재시도, 모델 변경 후 재처리, 중복 업로드) 시 STT 호출을 생략
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 처리 결과 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_FORMAT_VERSION = 1
+
+
+class STTCacheBackend:
+    """STT 캐시 저장소 인터페이스"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class SQLiteSTTCacheBackend(STTCacheBackend):
+    """
+    로컬 SQLite 저장소 (총 크기 제한, 최근 사용 순 제거)
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: 임시 디렉터리)
+            max_bytes: 저장할 결과의 최대 총 크기 (바이트)
+        """
+        self.db_path = db_path or os.path.join(tempfile.gettempdir(), 'senior_mhealth_stt_cache.sqlite3')
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS stt_results ('
+            ' key TEXT PRIMARY KEY,'
+            ' value BLOB NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_stt_results_accessed ON stt_results (accessed_at)'
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM stt_results WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE stt_results SET accessed_at = ? WHERE key = ?', (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            logger.warning(f"STT 결과가 캐시 최대 크기보다 커서 저장하지 않음: {len(value)} bytes")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO stt_results (key, value, size, created_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (key, sqlite3.Binary(value), len(value), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """총 크기가 제한을 넘으면 가장 오래 사용되지 않은 항목부터 제거 (잠금 보유 상태에서 호출)"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM stt_results').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            'SELECT key, size FROM stt_results ORDER BY accessed_at ASC'
+        ).fetchall()
+        expired = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+
+        self._conn.executemany('DELETE FROM stt_results WHERE key = ?', expired)
+        self.evictions += len(expired)
+        logger.info(f"STT 캐시 항목 {len(expired)}개 제거 (크기 제한 {self.max_bytes} bytes)")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM stt_results WHERE key = ?', (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM stt_results')
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM stt_results'
+            ).fetchone()
+        return {
+            'backend': 'sqlite',
+            'path': self.db_path,
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class STTResultCache:
+    """
+    내용 주소 기반 STT 결과 캐시
+
+    키는 ``오디오 내용 해시 + 인식 설정 지문``이므로 같은 녹음이라도
+    언어/모델/화자 분리 설정이 다르면 별도로 저장됩니다.
+    """
+
+    def __init__(self, backend: Optional[STTCacheBackend] = None, enabled: bool = True):
+        """
+        Args:
+            backend: 저장소 (기본값: SQLiteSTTCacheBackend)
+            enabled: False면 조회/저장을 모두 생략
+        """
+        self.enabled = enabled
+        self.backend = backend if backend is not None or not enabled else SQLiteSTTCacheBackend()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'errors': 0
+        }
+
+    @classmethod
+    def from_env(cls) -> 'STTResultCache':
+        """
+        환경 변수 설정으로 캐시 생성 (STT_CACHE_ENABLED, STT_CACHE_PATH, STT_CACHE_MAX_MB)
+
+        STT_CACHE_PATH가 없으면 기본 비활성화 (Cloud Run의 임시 디렉터리는
+        메모리 기반이라 캐시 파일이 컨테이너 메모리를 차지함)
+        """
+        db_path = os.getenv('STT_CACHE_PATH') or None
+        default_enabled = 'true' if db_path else 'false'
+        enabled = os.getenv('STT_CACHE_ENABLED', default_enabled).lower() in ('1', 'true', 'yes')
+        if not enabled:
+            return cls(enabled=False)
+        try:
+            backend = SQLiteSTTCacheBackend(
+                db_path=db_path,
+                max_bytes=int(float(os.getenv('STT_CACHE_MAX_MB', '256')) * 1024 * 1024)
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"STT 캐시 초기화 실패 - 캐시 비활성화: {e}")
+            return cls(enabled=False)
+        return cls(backend=backend)
+
+    @staticmethod
+    def config_fingerprint(config: Any) -> str:
+        """인식 설정 지문 (proto 메시지 또는 딕셔너리)"""
+        if isinstance(config, dict):
+            serialized = json.dumps(config, sort_keys=True, default=str)
+        else:
+            serialized = type(config).to_json(config)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def make_key(content_hash: str, config_fingerprint: str) -> str:
+        """캐시 키 생성"""
+        return f"v{CACHE_FORMAT_VERSION}:{content_hash}:{config_fingerprint}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결과 조회 (없거나 비활성화 시 None)"""
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"STT 캐시 조회 실패: {e}")
+            return None
+
+        if value is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return json.loads(value.decode('utf-8'))
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """처리된 STT 결과 저장 (오류 결과는 저장하지 않음)"""
+        if not self.enabled or result.get('status') == 'error':
+            return
+        try:
+            self.backend.set(key, json.dumps(result, ensure_ascii=False, default=str).encode('utf-8'))
+            self.stats['writes'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"STT 캐시 저장 실패: {e}")
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        if self.enabled:
+            self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스 통계와 저장소 상태"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        stats = {
+            'enabled': self.enabled,
+            **self.stats,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
+        if self.enabled:
+            stats.update(self.backend.get_stats())
+        return stats
@@ -6,5 +6,6 @@
 
 from .inference_engine import InferenceEngine
 from .streaming_inference import StreamingInference
+from .dynamic_batcher import DynamicBatcher, BatcherOverloadedError
 
-__all__ = ['InferenceEngine', 'StreamingInference']
\ No newline at end of file
+__all__ = ['InferenceEngine', 'StreamingInference', 'DynamicBatcher', 'BatcherOverloadedError']
\ No newline at end of file
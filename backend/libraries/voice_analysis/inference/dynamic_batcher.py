@@ -0,0 +1,229 @@
+# 제7강: AI 모델 이해와 로컬 테스트 - 동적 요청 배치
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .inference_engine import InferenceEngine
+
+logger = logging.getLogger(__name__)
+
+
+class BatcherOverloadedError(RuntimeError):
+    """대기열이 가득 차 요청을 받을 수 없음"""
+
+
+@dataclass
+class _PendingRequest:
+    """대기열에 들어간 단일 예측 요청"""
+    audio_path: Union[str, Path]
+    feature_type: str
+    use_cache: bool
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class DynamicBatcher:
+    """
+    동적 요청 배치기
+
+    동시에 들어온 단일 예측 요청을 최대 ``max_batch_size``개 또는
+    ``max_wait_ms`` 동안 모아 ``InferenceEngine.predict_many``를 한 번 호출하고,
+    결과를 요청별 future로 돌려줍니다. 모델 호출은 전용 워커 스레드에서 실행되어
+    이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        engine: InferenceEngine,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        max_queue_size: int = 256,
+        stats_window: int = 1000
+    ):
+        """
+        Args:
+            engine: 추론 엔진
+            max_batch_size: 한 번의 모델 호출에 넣을 최대 요청 수
+            max_wait_ms: 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간 (ms)
+            max_queue_size: 대기열 최대 길이 (초과 시 BatcherOverloadedError)
+            stats_window: 통계 계산에 사용할 최근 배치/요청 수
+        """
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # 모델 호출은 한 번에 하나씩 (배치 내부 병렬성은 torch가 담당)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dynamic-batcher')
+
+        self.stats = {
+            'requests': 0,
+            'batches': 0,
+            'rejected': 0,
+            'errors': 0
+        }
+        self._batch_sizes: Deque[int] = deque(maxlen=stats_window)
+        self._queue_delays_ms: Deque[float] = deque(maxlen=stats_window)
+        self._batch_times_ms: Deque[float] = deque(maxlen=stats_window)
+
+    @classmethod
+    def from_env(cls, engine: InferenceEngine) -> 'DynamicBatcher':
+        """환경 변수 설정으로 생성 (BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_MAX_QUEUE)"""
+        return cls(
+            engine,
+            max_batch_size=int(os.getenv('BATCH_MAX_SIZE', '16')),
+            max_wait_ms=float(os.getenv('BATCH_MAX_WAIT_MS', '10')),
+            max_queue_size=int(os.getenv('BATCH_MAX_QUEUE', '256'))
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """배치 워커 시작 (이벤트 루프 안에서 호출)"""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"동적 배치기 시작: 최대 {self.max_batch_size}개 / {self.max_wait_ms}ms, "
+            f"대기열 {self.max_queue_size}"
+        )
+
+    async def stop(self):
+        """워커 중지 후 대기 중인 요청 실패 처리"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if not request.future.done():
+                    request.future.set_exception(RuntimeError("동적 배치기가 중지되었습니다"))
+        self._executor.shutdown(wait=False)
+
+    async def submit(
+        self,
+        audio_path: Union[str, Path],
+        feature_type: str = 'raw',
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        예측 요청을 대기열에 넣고 결과를 기다림
+
+        Raises:
+            BatcherOverloadedError: 대기열이 가득 찬 경우
+        """
+        if not self.is_running:
+            raise RuntimeError("동적 배치기가 시작되지 않았습니다")
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(_PendingRequest(audio_path, feature_type, use_cache, future))
+        except asyncio.QueueFull:
+            self.stats['rejected'] += 1
+            raise BatcherOverloadedError(
+                f"추론 대기열이 가득 찼습니다 ({self.max_queue_size})"
+            )
+        self.stats['requests'] += 1
+        return await future
+
+    async def _collect(self) -> List[_PendingRequest]:
+        """첫 요청을 기다린 뒤 크기 또는 시간 한도까지 배치 수집"""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        # 대기 중 연결이 끊긴 요청 제외
+        return [request for request in batch if not request.future.done()]
+
+    async def _run(self):
+        """배치 워커 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            for request in batch:
+                self._queue_delays_ms.append((started - request.enqueued_at) * 1000)
+
+            # 같은 특징 타입/캐시 옵션끼리 한 번의 모델 호출로 처리
+            groups: Dict[tuple, List[_PendingRequest]] = {}
+            for request in batch:
+                groups.setdefault((request.feature_type, request.use_cache), []).append(request)
+
+            for (feature_type, use_cache), requests in groups.items():
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor,
+                        self.engine.predict_many,
+                        [request.audio_path for request in requests],
+                        feature_type,
+                        use_cache
+                    )
+                except Exception as e:
+                    logger.error(f"배치 추론 실패 ({len(requests)}개): {str(e)}")
+                    self.stats['errors'] += len(requests)
+                    results = [e] * len(requests)
+
+                for request, result in zip(requests, results):
+                    if request.future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        request.future.set_exception(result)
+                    else:
+                        request.future.set_result(result)
+
+                self.stats['batches'] += 1
+                self._batch_sizes.append(len(requests))
+
+            self._batch_times_ms.append((time.monotonic() - started) * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 크기, 대기열 지연, 배치 처리 시간 통계"""
+        def _summary(values) -> Dict[str, float]:
+            if not values:
+                return {'avg': 0.0, 'p95': 0.0, 'max': 0.0}
+            ordered = sorted(values)
+            return {
+                'avg': sum(ordered) / len(ordered),
+                'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                'max': ordered[-1]
+            }
+
+        return {
+            **self.stats,
+            'running': self.is_running,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'max_queue_size': self.max_queue_size,
+            'batch_size': _summary(self._batch_sizes),
+            'queue_delay_ms': _summary(self._queue_delays_ms),
+            'batch_time_ms': _summary(self._batch_times_ms)
+        }
@@ -8,13 +8,17 @@ import torchaudio
 import torchaudio.transforms as T
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Union, Optional, Any
+from typing import BinaryIO, Dict, List, Union, Optional, Any, Tuple
 import time
 import logging
 import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from ..features.mfcc_extractor import MFCCExtractor
 from ..features.mel_extractor import MelSpectrogramExtractor
 from ..models.sincnet_model import SincNet, EmotionSincNet
+from .result_cache import LRUCache, FileDigestCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +33,11 @@ class InferenceEngine:
         model_path: str,
         device: str = 'cuda' if torch.cuda.is_available() else 'cpu',
         model_type: str = 'basic',
-        use_optimization: bool = True
+        use_optimization: bool = True,
+        cache_size: int = 100,
+        cache_max_bytes: Optional[int] = 64 * 1024 * 1024,
+        cache_ttl: Optional[float] = None,
+        load_workers: Optional[int] = None
     ):
         """
         추론 엔진 초기화
@@ -39,6 +47,10 @@ class InferenceEngine:
             device: 추론 디바이스 (cuda/cpu)
             model_type: 모델 타입 ('basic', 'emotion')
             use_optimization: 최적화 적용 여부
+            cache_size: 결과 캐시 최대 항목 수
+            cache_max_bytes: 결과 캐시 최대 크기 (바이트)
+            cache_ttl: 결과 캐시 유효 시간 (초, None이면 만료 없음)
+            load_workers: 배치 디코딩/리샘플링 워커 수 (기본값: CPU 코어 수, 최대 8)
         """
         self.device = torch.device(device)
         self.model_type = model_type
@@ -80,9 +92,16 @@ class InferenceEngine:
             'errors': 0
         }
         
-        # 캐시 (간단한 LRU)
-        self.cache = {}
-        self.cache_size = 100
+        # 결과 캐시 (LRU + TTL, 파일 내용 해시 기반 키)
+        self.cache = LRUCache(max_items=cache_size, max_bytes=cache_max_bytes, ttl=cache_ttl)
+        self.cache_size = cache_size
+        self._file_digests = FileDigestCache()
+        
+        # 배치 로더 (디코딩/리샘플링 워커 풀, 원본 샘플레이트별 리샘플러)
+        self.load_workers = load_workers or min(8, os.cpu_count() or 2)
+        self._loader_pool: Optional[ThreadPoolExecutor] = None
+        self._resamplers: Dict[int, T.Resample] = {}
+        self._resampler_lock = threading.Lock()
         
         logger.info(f"추론 엔진 초기화 완료: {device}, {model_type} 모델")
         
@@ -144,52 +163,20 @@ class InferenceEngine:
         start_time = time.time()
         
         try:
-            # 캐시 확인
-            cache_key = f"{audio_path}_{feature_type}"
-            if use_cache and cache_key in self.cache:
-                logger.debug(f"캐시 히트: {cache_key}")
-                self.inference_stats['cache_hits'] += 1
-                return self.cache[cache_key]
-            
-            # 오디오 로드
-            waveform, sr = sf.read(audio_path)
-            waveform = torch.FloatTensor(waveform)
-            
-            # 리샘플링 (필요시)
-            if sr != 16000:
-                resampler = T.Resample(sr, 16000)
-                waveform = resampler(waveform)
-                logger.debug(f"리샘플링: {sr}Hz -> 16000Hz")
+            # 캐시 확인 (같은 내용이면 경로가 달라도 히트, 파일이 바뀌면 미스)
+            cache_key = self._cache_key(audio_path, feature_type) if use_cache else None
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"캐시 히트: {audio_path}")
+                    self.inference_stats['cache_hits'] += 1
+                    return {**cached, 'cache_hit': True}
             
-            # 길이 조정 (1초로 패딩/자르기)
-            target_length = 16000
-            if len(waveform) < target_length:
-                # 패딩
-                waveform = F.pad(waveform, (0, target_length - len(waveform)))
-            elif len(waveform) > target_length:
-                # 중앙에서 자르기
-                start = (len(waveform) - target_length) // 2
-                waveform = waveform[start:start + target_length]
+            # 오디오 로드, 리샘플링, 1초 길이 조정
+            waveform, _ = self._load_waveform(audio_path)
             
-            # 특징 추출
-            features = self._extract_features(waveform, feature_type)
-            
-            # 디바이스 이동
-            features = features.to(self.device)
-            
-            # 추론
-            if self.model_type == 'emotion':
-                outputs = self.model(features)
-                if isinstance(outputs, dict):
-                    # 다중 작업 모델
-                    emotions = outputs['emotions']
-                    result = self._format_emotion_result(outputs, waveform)
-                else:
-                    # 단일 작업 모델
-                    result = self._format_basic_result(outputs, waveform)
-            else:
-                logits = self.model(features)
-                result = self._format_basic_result(logits, waveform)
+            # 특징 추출, 추론, 결과 포맷팅 (배치 경로와 동일한 코드)
+            result = self._infer(waveform.unsqueeze(0), feature_type)[0]
             
             # 추론 시간 기록
             inference_time = time.time() - start_time
@@ -197,7 +184,7 @@ class InferenceEngine:
             result['feature_type'] = feature_type
             
             # 캐시 저장
-            if use_cache:
+            if cache_key is not None:
                 self._update_cache(cache_key, result)
             
             # 통계 업데이트
@@ -212,29 +199,62 @@ class InferenceEngine:
     
     def _extract_features(
         self, 
-        waveform: torch.Tensor, 
+        waveforms: torch.Tensor, 
         feature_type: str
     ) -> torch.Tensor:
-        """특징 추출"""
+        """특징 추출 (waveforms: [batch, time])"""
         if feature_type == 'mfcc':
-            features = self.mfcc_extractor.extract(waveform)
+            features = self.mfcc_extractor.extract(waveforms)
             # MFCC는 2D CNN으로 처리하기 위해 차원 조정
             features = features.unsqueeze(1)  # [batch, 1, mfcc, frames]
         elif feature_type == 'mel':
-            features = self.mel_extractor.extract(waveform)
+            features = self.mel_extractor.extract(waveforms)
             features = features.unsqueeze(1)  # [batch, 1, mels, frames]
         else:  # raw
-            features = waveform.unsqueeze(0)  # [1, time]
+            features = waveforms  # [batch, time]
         
         return features
     
+    @torch.no_grad()
+    def _infer(
+        self,
+        waveforms: torch.Tensor,
+        feature_type: str
+    ) -> List[Dict[str, Any]]:
+        """
+        특징 추출, 모델 호출, 결과 포맷팅 (predict와 배치 경로 공용)
+        
+        Args:
+            waveforms: 16kHz, 1초로 맞춘 파형 [batch, time]
+            feature_type: 'raw', 'mfcc', or 'mel'
+            
+        Returns:
+            입력 순서대로 항목별 결과 (추론 시간/요청 정보 제외)
+        """
+        features = self._extract_features(waveforms, feature_type).to(self.device)
+        outputs = self.model(features)
+        
+        if self.model_type == 'emotion' and isinstance(outputs, dict):
+            # 다중 작업 모델
+            return [
+                self._format_emotion_result(outputs, waveforms[i], i)
+                for i in range(waveforms.shape[0])
+            ]
+        # 단일 작업 모델
+        return [
+            self._format_basic_result(outputs, waveforms[i], i)
+            for i in range(waveforms.shape[0])
+        ]
+    
     def _format_basic_result(
         self, 
         logits: torch.Tensor, 
-        waveform: torch.Tensor
+        waveform: torch.Tensor,
+        index: int = 0
     ) -> Dict[str, Any]:
-        """기본 모델 결과 포맷팅"""
-        probs = F.softmax(logits, dim=-1)
+        """기본 모델 결과 포맷팅 (배치의 index번째 항목)"""
+        item_logits = logits[index]
+        probs = F.softmax(item_logits, dim=-1)
         pred_class = torch.argmax(probs, dim=-1).item()
         confidence = probs.max().item()
         
@@ -243,19 +263,20 @@ class InferenceEngine:
             'confidence': confidence,
             'probabilities': {
                 self.class_labels[i]: p.item()
-                for i, p in enumerate(probs[0])
+                for i, p in enumerate(probs)
             },
             'audio_duration': len(waveform) / 16000,
-            'raw_logits': logits[0].cpu().numpy().tolist()
+            'raw_logits': item_logits.cpu().numpy().tolist()
         }
     
     def _format_emotion_result(
         self, 
         outputs: Dict[str, torch.Tensor], 
-        waveform: torch.Tensor
+        waveform: torch.Tensor,
+        index: int = 0
     ) -> Dict[str, Any]:
-        """감정 모델 결과 포맷팅"""
-        emotions = outputs['emotions']
+        """감정 모델 결과 포맷팅 (배치의 index번째 항목)"""
+        emotions = outputs['emotions'][index]
         pred_emotion = torch.argmax(emotions, dim=-1).item()
         confidence = emotions.max().item()
         
@@ -264,155 +285,224 @@ class InferenceEngine:
             'emotion_confidence': confidence,
             'emotion_probabilities': {
                 self.class_labels[i]: p.item()
-                for i, p in enumerate(emotions[0])
+                for i, p in enumerate(emotions)
             },
             'audio_duration': len(waveform) / 16000
         }
         
         # 다중 작업 결과 추가
         if 'depression_score' in outputs:
-            result['depression_score'] = outputs['depression_score'][0].item()
+            result['depression_score'] = outputs['depression_score'][index].item()
         if 'anxiety_score' in outputs:
-            result['anxiety_score'] = outputs['anxiety_score'][0].item()
+            result['anxiety_score'] = outputs['anxiety_score'][index].item()
         
         return result
     
+    def _get_resampler(self, orig_sr: int) -> T.Resample:
+        """원본 샘플레이트별 리샘플러 (커널은 샘플레이트당 1회만 계산)"""
+        resampler = self._resamplers.get(orig_sr)
+        if resampler is None:
+            with self._resampler_lock:
+                resampler = self._resamplers.get(orig_sr)
+                if resampler is None:
+                    resampler = T.Resample(orig_sr, 16000)
+                    self._resamplers[orig_sr] = resampler
+        return resampler
+    
+    def _load_waveform(self, audio_path: Union[str, Path, BinaryIO]) -> Tuple[torch.Tensor, int]:
+        """
+        오디오 로드 후 16kHz 리샘플링 및 1초 길이 조정 (경로 또는 파일 객체)
+        
+        Returns:
+            (waveform, 원본 샘플레이트)
+        """
+        if hasattr(audio_path, 'seek'):
+            # 메모리 버퍼는 매번 처음부터 디코딩
+            audio_path.seek(0)
+        waveform, sr = sf.read(audio_path, dtype='float32')
+        waveform = torch.from_numpy(waveform)
+        
+        # 리샘플링 (필요시)
+        if sr != 16000:
+            waveform = self._get_resampler(sr)(waveform)
+            logger.debug(f"리샘플링: {sr}Hz -> 16000Hz")
+        
+        # 길이 조정 (1초로 패딩/자르기)
+        target_length = 16000
+        if len(waveform) < target_length:
+            # 패딩
+            waveform = F.pad(waveform, (0, target_length - len(waveform)))
+        elif len(waveform) > target_length:
+            # 중앙에서 자르기
+            start = (len(waveform) - target_length) // 2
+            waveform = waveform[start:start + target_length]
+        
+        return waveform, sr
+    
+    @property
+    def loader_pool(self) -> ThreadPoolExecutor:
+        """배치 디코딩/리샘플링 워커 풀 (첫 사용 시 생성)"""
+        if self._loader_pool is None:
+            self._loader_pool = ThreadPoolExecutor(
+                max_workers=self.load_workers,
+                thread_name_prefix='inference-loader'
+            )
+        return self._loader_pool
+    
+    def _submit_batch_load(self, batch_paths: List[Union[str, Path]]) -> List[Future]:
+        """배치의 모든 파일 디코딩을 워커 풀에 제출"""
+        return [self.loader_pool.submit(self._load_waveform, path) for path in batch_paths]
+    
     def predict_batch(
         self,
         audio_paths: List[Union[str, Path]],
         batch_size: int = 32,
-        feature_type: str = 'raw'
+        feature_type: str = 'raw',
+        use_cache: bool = False
     ) -> List[Dict[str, Any]]:
         """
         배치 예측
         
+        디코딩/리샘플링은 워커 풀에서 병렬로 수행하며, 현재 배치를 추론하는 동안
+        다음 배치를 미리 로드하여 모델이 I/O를 기다리지 않도록 합니다.
+        
         Args:
             audio_paths: 음성 파일 경로 리스트
             batch_size: 배치 크기
             feature_type: 특징 타입
+            use_cache: 캐시 사용 여부
             
         Returns:
-            results: 예측 결과 리스트
+            results: 입력 순서대로 예측 결과 리스트 (실패 항목은 error 딕셔너리)
         """
         results = []
+        batches = [
+            audio_paths[i:i + batch_size]
+            for i in range(0, len(audio_paths), batch_size)
+        ]
+        if not batches:
+            return results
         
-        for i in range(0, len(audio_paths), batch_size):
-            batch_paths = audio_paths[i:i+batch_size]
-            
-            # 배치 데이터 준비
-            batch_waveforms = []
-            batch_info = []
+        pending = self._start_many(batches[0], feature_type, use_cache)
+        
+        for index, batch_paths in enumerate(batches):
+            current = pending
             
-            for path in batch_paths:
-                try:
-                    waveform, sr = sf.read(path)
-                    waveform = torch.FloatTensor(waveform)
-                    
-                    if sr != 16000:
-                        resampler = T.Resample(sr, 16000)
-                        waveform = resampler(waveform)
-                    
-                    # 길이 정규화
-                    target_length = 16000
-                    if len(waveform) < target_length:
-                        waveform = F.pad(waveform, (0, target_length - len(waveform)))
-                    elif len(waveform) > target_length:
-                        start = (len(waveform) - target_length) // 2
-                        waveform = waveform[start:start + target_length]
-                    
-                    batch_waveforms.append(waveform)
-                    batch_info.append({'path': path, 'original_sr': sr})
-                    
-                except Exception as e:
-                    logger.error(f"배치 처리 실패 - {path}: {str(e)}")
-                    results.append({
-                        'error': str(e),
-                        'path': str(path)
-                    })
+            # 다음 배치 미리 로드
+            if index + 1 < len(batches):
+                pending = self._start_many(batches[index + 1], feature_type, use_cache)
             
-            if batch_waveforms:
-                # 배치 텐서 생성
-                batch_tensor = torch.stack(batch_waveforms)
-                
-                # 배치 추론
-                batch_results = self._batch_inference(
-                    batch_tensor, batch_info, feature_type
-                )
-                results.extend(batch_results)
+            for path, result in zip(batch_paths, self._finish_many(current)):
+                if isinstance(result, Exception):
+                    result = {'error': str(result), 'path': str(path)}
+                results.append(result)
         
         return results
     
-    @torch.no_grad()
+    def predict_many(
+        self,
+        audio_paths: List[Union[str, Path]],
+        feature_type: str = 'raw',
+        use_cache: bool = True
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        여러 파일을 한 번의 모델 호출로 예측
+
+        캐시 히트 항목은 모델 호출에서 제외하고, 디코딩은 워커 풀에서 병렬로 수행합니다.
+
+        Args:
+            audio_paths: 음성 파일 경로 리스트 (한 번의 forward에 들어갈 크기)
+            feature_type: 특징 타입
+            use_cache: 캐시 사용 여부
+
+        Returns:
+            입력 순서대로 예측 결과 또는 해당 항목의 예외
+        """
+        return self._finish_many(self._start_many(audio_paths, feature_type, use_cache))
+
+    def _start_many(
+        self,
+        audio_paths: List[Union[str, Path]],
+        feature_type: str,
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """캐시 조회 후 캐시 미스 항목의 디코딩을 워커 풀에 제출"""
+        results: List[Union[Dict[str, Any], Exception, None]] = [None] * len(audio_paths)
+        cache_keys: List[Optional[str]] = [None] * len(audio_paths)
+        pending = []
+
+        for index, path in enumerate(audio_paths):
+            if use_cache:
+                try:
+                    cache_keys[index] = self._cache_key(path, feature_type)
+                except Exception as e:
+                    logger.error(f"예측 실패 - {path}: {str(e)}")
+                    self.inference_stats['errors'] += 1
+                    results[index] = e
+                    continue
+                cached = self.cache.get(cache_keys[index])
+                if cached is not None:
+                    self.inference_stats['cache_hits'] += 1
+                    # 캐시는 파일 내용 기준이므로 요청별 경로는 조회 후 적용
+                    results[index] = {**cached, 'path': str(path), 'cache_hit': True}
+                    continue
+            pending.append(index)
+
+        return {
+            'audio_paths': audio_paths,
+            'feature_type': feature_type,
+            'results': results,
+            'cache_keys': cache_keys,
+            'pending': pending,
+            'futures': self._submit_batch_load([audio_paths[i] for i in pending])
+        }
+
+    def _finish_many(self, state: Dict[str, Any]) -> List[Union[Dict[str, Any], Exception]]:
+        """디코딩 결과를 모아 한 번의 모델 호출로 추론"""
+        audio_paths = state['audio_paths']
+        results = state['results']
+        cache_keys = state['cache_keys']
+
+        loaded, batch_waveforms, batch_info = [], [], []
+        for index, future in zip(state['pending'], state['futures']):
+            try:
+                waveform, sr = future.result()
+            except Exception as e:
+                logger.error(f"배치 처리 실패 - {audio_paths[index]}: {str(e)}")
+                self.inference_stats['errors'] += 1
+                results[index] = e
+                continue
+            loaded.append(index)
+            batch_waveforms.append(waveform)
+            batch_info.append({'path': str(audio_paths[index]), 'original_sr': sr})
+
+        if batch_waveforms:
+            batch_results = self._batch_inference(
+                torch.stack(batch_waveforms), batch_info, state['feature_type']
+            )
+            for index, result, info in zip(loaded, batch_results, batch_info):
+                # 요청별 정보(경로, 원본 샘플레이트)는 캐시 저장 후 적용
+                if cache_keys[index] is not None:
+                    self._update_cache(cache_keys[index], result)
+                self._update_stats(result['inference_time'])
+                results[index] = {**result, **info}
+
+        return results
+
     def _batch_inference(
         self,
         batch_waveforms: torch.Tensor,
         batch_info: List[Dict],
         feature_type: str
     ) -> List[Dict[str, Any]]:
-        """배치 추론 실행"""
+        """배치 추론 실행 (predict와 같은 특징/결과 형식, 요청 정보는 호출 측에서 적용)"""
         start_time = time.time()
-        
-        # 특징 추출
-        if feature_type == 'mfcc':
-            features = self.mfcc_extractor.extract(batch_waveforms)
-            features = features.unsqueeze(2)  # [batch, mfcc, 1, frames]
-        elif feature_type == 'mel':
-            features = self.mel_extractor.extract(batch_waveforms)
-            features = features.unsqueeze(2)  # [batch, mels, 1, frames]
-        else:  # raw
-            features = batch_waveforms
-        
-        features = features.to(self.device)
-        
-        # 모델 추론
-        if self.model_type == 'emotion':
-            outputs = self.model(features)
-            if isinstance(outputs, dict):
-                emotions = outputs['emotions']
-            else:
-                emotions = outputs
-        else:
-            logits = self.model(features)
-            emotions = F.softmax(logits, dim=-1)
-        
-        # 결과 포맷팅
+        results = self._infer(batch_waveforms, feature_type)
         inference_time = time.time() - start_time
-        results = []
         
-        for i, info in enumerate(batch_info):
-            if self.model_type == 'emotion' and isinstance(outputs, dict):
-                result = {
-                    'prediction': self.class_labels[torch.argmax(emotions[i]).item()],
-                    'confidence': emotions[i].max().item(),
-                    'probabilities': {
-                        self.class_labels[j]: emotions[i][j].item()
-                        for j in range(len(self.class_labels))
-                    },
-                    'inference_time': inference_time / len(batch_info),
-                    'audio_duration': 1.0,  # 1초로 정규화됨
-                    'feature_type': feature_type
-                }
-                
-                # 추가 점수
-                if 'depression_score' in outputs:
-                    result['depression_score'] = outputs['depression_score'][i].item()
-                if 'anxiety_score' in outputs:
-                    result['anxiety_score'] = outputs['anxiety_score'][i].item()
-            else:
-                result = {
-                    'prediction': self.class_labels[torch.argmax(emotions[i]).item()],
-                    'confidence': emotions[i].max().item(),
-                    'probabilities': {
-                        self.class_labels[j]: emotions[i][j].item()
-                        for j in range(len(self.class_labels))
-                    },
-                    'inference_time': inference_time / len(batch_info),
-                    'audio_duration': 1.0,
-                    'feature_type': feature_type
-                }
-            
-            result.update(info)
-            results.append(result)
+        for result in results:
+            result['inference_time'] = inference_time / len(batch_info)
+            result['feature_type'] = feature_type
         
         return results
     
@@ -440,8 +530,8 @@ class InferenceEngine:
         predictions = []
         
         for _ in range(n_samples):
-            # 각 샘플에 대해 예측
-            result = self.predict(audio_path)
+            # 각 샘플에 대해 예측 (샘플마다 다른 결과가 필요하므로 캐시 미사용)
+            result = self.predict(audio_path, use_cache=False)
             predictions.append(result['probabilities'])
         
         # 모델을 다시 eval 모드로
@@ -527,14 +617,13 @@ class InferenceEngine:
             'avg_importance': float(np.mean(importance))
         }
     
+    def _cache_key(self, audio_path: Union[str, Path], feature_type: str) -> str:
+        """파일 내용 해시 + 특징 타입 기반 캐시 키"""
+        return f"{self._file_digests.digest(audio_path)}_{feature_type}"
+    
     def _update_cache(self, key: str, result: Dict):
-        """캐시 업데이트 (LRU)"""
-        if len(self.cache) >= self.cache_size:
-            # 가장 오래된 항목 제거
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-        
-        self.cache[key] = result
+        """캐시 업데이트 (LRU, 한도 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        self.cache.put(key, result)
     
     def _update_stats(self, inference_time: float):
         """통계 업데이트"""
@@ -552,15 +641,13 @@ class InferenceEngine:
     
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보 반환"""
-        cache_hit_rate = (
-            self.inference_stats['cache_hits'] / 
-            max(self.inference_stats['total_inferences'], 1)
-        )
+        cache_stats = self.cache.get_stats()
         
         return {
             **self.inference_stats,
-            'cache_hit_rate': cache_hit_rate,
+            'cache_hit_rate': cache_stats['hit_rate'],
             'cache_size': len(self.cache),
+            'cache': cache_stats,
             'device': str(self.device),
             'model_type': self.model_type
         }
@@ -630,10 +717,17 @@ class InferenceEngine:
         
         return benchmark_results
     
-    def clear_cache(self):
-        """캐시 초기화"""
-        self.cache.clear()
-        logger.info("캐시 초기화됨")
+    def close(self):
+        """배치 로더 워커 풀 종료"""
+        if self._loader_pool is not None:
+            self._loader_pool.shutdown(wait=True)
+            self._loader_pool = None
+    
+    def clear_cache(self) -> int:
+        """캐시 초기화 후 삭제된 항목 수 반환"""
+        cleared = self.cache.clear()
+        logger.info(f"캐시 초기화됨: {cleared}개 항목")
+        return cleared
     
     def save_stats(self, filepath: str):
         """통계를 파일로 저장"""
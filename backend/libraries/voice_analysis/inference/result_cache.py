@@ -0,0 +1,162 @@
+# 제7강: AI 모델 이해와 로컬 테스트 - 추론 결과 캐시
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_size(value: Any) -> int:
+    """캐시 항목 크기 추정 (JSON 직렬화 길이 기준)"""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class LRUCache:
+    """
+    스레드 안전 LRU 캐시
+    조회 시 최근 사용 순서를 갱신하고, 항목 수/총 바이트 한도를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거하며, 선택적으로 TTL 만료를 적용
+    """
+
+    def __init__(
+        self,
+        max_items: int = 100,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = _estimate_size
+    ):
+        """
+        Args:
+            max_items: 최대 항목 수
+            max_bytes: 최대 총 크기 (바이트, None이면 제한 없음)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+            sizeof: 항목 크기 계산 함수
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+
+        # key -> (value, size, stored_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """항목 조회 (히트 시 최근 사용으로 갱신)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """항목 저장 후 한도 초과분 제거"""
+        size = self.sizeof(value)
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"캐시 항목이 최대 크기보다 커서 저장하지 않음: {size} bytes")
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self._total_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_items
+                or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def clear(self) -> int:
+        """모든 항목 삭제 후 삭제된 항목 수 반환"""
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+            return cleared
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_items': self.max_items,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+class FileDigestCache:
+    """
+    파일 내용 해시 계산기
+    (경로, 수정 시각, 크기)가 같으면 이전 해시를 재사용하여 반복 해시 계산을 생략
+    """
+
+    def __init__(self, max_items: int = 1024):
+        self._digests = LRUCache(max_items=max_items, max_bytes=None, sizeof=lambda _: 0)
+
+    def digest(self, path: Union[str, Path, BinaryIO]) -> str:
+        """파일 내용의 BLAKE2b 해시 (메모리 버퍼는 매번 직접 계산)"""
+        if hasattr(path, 'getbuffer'):
+            with path.getbuffer() as view:
+                return hashlib.blake2b(view, digest_size=16).hexdigest()
+
+        stat = os.stat(path)
+        stat_key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._digests.put(stat_key, digest)
+        return digest
@@ -57,8 +57,19 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 파이프라인 초기화"""
+    """앱 시작 시 파이프라인 초기화 및 워커 워밍업"""
     initialize_pipeline()
+    if pipeline:
+        try:
+            pipeline.warm_up()
+        except Exception as e:
+            logger.warning(f"파이프라인 워밍업 실패: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료 시 파이프라인 실행기 풀 정리"""
+    if pipeline:
+        pipeline.close()
 
 # 요청 모델
 class AnalysisRequest(BaseModel):
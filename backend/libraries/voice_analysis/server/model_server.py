@@ -12,18 +12,22 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import torch
 import torchaudio
 import numpy as np
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
 
 from ai.inference.inference_engine import InferenceEngine
 from ai.inference.streaming_inference import StreamingInference
+from ai.inference.dynamic_batcher import DynamicBatcher, BatcherOverloadedError
+from ai.server.upload_handler import spool_upload, UploadRejectedError
 from ai.models.model_optimizer import ModelOptimizer
 
 
@@ -65,18 +69,27 @@ class BatchRequest(BaseModel):
     feature_type: str = "raw"
     use_cache: bool = True
     parallel_processing: bool = True
+    chunk_size: Optional[int] = Field(default=None, description="한 번의 모델 호출에 넣을 파일 수")
+    stream: Optional[bool] = Field(default=None, description="NDJSON 스트리밍 여부 (기본값: 대용량 배치만)")
 
 
 # 글로벌 변수
 inference_engine: Optional[InferenceEngine] = None
 streaming_inference: Optional[StreamingInference] = None
 model_optimizer: Optional[ModelOptimizer] = None
+request_batcher: Optional[DynamicBatcher] = None
+batch_executor: Optional[ThreadPoolExecutor] = None
+
+# /predict/batch 설정
+BATCH_CHUNK_SIZE = int(os.getenv('BATCH_CHUNK_SIZE', '32'))
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', '2'))
+BATCH_STREAM_THRESHOLD = int(os.getenv('BATCH_STREAM_THRESHOLD', '64'))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI 앱 라이프사이클 관리"""
-    global inference_engine, streaming_inference, model_optimizer
+    global inference_engine, streaming_inference, model_optimizer, request_batcher, batch_executor
     
     # 시작 시 초기화
     try:
@@ -85,6 +98,13 @@ async def lifespan(app: FastAPI):
         # 추론 엔진 초기화
         inference_engine = InferenceEngine()
         
+        # 동시 /predict 요청을 모아 한 번의 모델 호출로 처리하는 배치기
+        request_batcher = DynamicBatcher.from_env(inference_engine)
+        request_batcher.start()
+        
+        # /predict/batch 청크 실행용 워커 풀 (동시 모델 호출 수 제한)
+        batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix='batch-predict')
+        
         # 스트리밍 추론 초기화 (백그라운드)
         streaming_inference = StreamingInference()
         
@@ -109,6 +129,12 @@ async def lifespan(app: FastAPI):
         if streaming_inference and streaming_inference.is_running:
             streaming_inference.stop_processing()
         
+        if request_batcher:
+            await request_batcher.stop()
+        
+        if batch_executor:
+            batch_executor.shutdown(wait=False)
+        
         # 캐시 정리
         if inference_engine:
             inference_engine.clear_cache()
@@ -215,18 +241,16 @@ def _register_routes(app: FastAPI):
         if not inference_engine:
             raise HTTPException(status_code=503, detail="추론 엔진이 초기화되지 않았습니다")
         
+        upload = None
         try:
             start_time = datetime.now()
             
-            # 임시 파일 저장
-            temp_file = f"/tmp/uploaded_audio_{start_time.timestamp()}.wav"
-            with open(temp_file, "wb") as f:
-                content = await audio_file.read()
-                f.write(content)
+            # 업로드 수신 (작은 파일은 메모리, 큰 파일은 고유한 임시 파일로 스풀링)
+            upload = await spool_upload(audio_file)
             
-            # 예측 수행
-            result = inference_engine.predict(
-                audio_path=temp_file,
+            # 예측 수행 (동적 배치기를 통해 동시 요청과 함께 처리)
+            result = await request_batcher.submit(
+                upload.source,
                 feature_type=request_data.feature_type,
                 use_cache=request_data.use_cache
             )
@@ -252,55 +276,54 @@ def _register_routes(app: FastAPI):
                 metadata={
                     "audio_duration": result.get('audio_duration', 0.0),
                     "sample_rate": result.get('sample_rate', 0),
-                    "cache_hit": result.get('cache_hit', False)
+                    "cache_hit": result.get('cache_hit', False),
+                    "upload_bytes": upload.size,
+                    "audio_format": upload.audio_format
                 }
             )
             
-            # 백그라운드에서 임시 파일 삭제
-            background_tasks.add_task(_cleanup_temp_file, temp_file)
-            
             return response
             
+        except UploadRejectedError as e:
+            logger.warning(f"업로드 거부: {e.detail}")
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+        except BatcherOverloadedError as e:
+            logger.warning(f"예측 요청 거부: {str(e)}")
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             logger.error(f"예측 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"예측 실패: {str(e)}")
+        finally:
+            # 예측이 끝나면 업로드 데이터는 필요 없으므로 바로 정리
+            if upload is not None:
+                upload.cleanup()
     
     @app.post("/predict/batch")
     async def predict_batch(request: BatchRequest):
-        """배치 예측 엔드포인트"""
+        """배치 예측 엔드포인트 (결과는 입력 순서, 실패 항목은 error 딕셔너리)"""
         if not inference_engine:
             raise HTTPException(status_code=503, detail="추론 엔진이 초기화되지 않았습니다")
         
+        start_time = datetime.now()
+        chunk_size = max(1, request.chunk_size or BATCH_CHUNK_SIZE)
+        chunks = [
+            request.audio_files[i:i + chunk_size]
+            for i in range(0, len(request.audio_files), chunk_size)
+        ]
+        stream = request.stream if request.stream is not None else (
+            len(request.audio_files) > BATCH_STREAM_THRESHOLD
+        )
+        
+        if stream:
+            return StreamingResponse(
+                _stream_batch_results(chunks, request, start_time),
+                media_type="application/x-ndjson"
+            )
+        
         try:
-            start_time = datetime.now()
-            
             results = []
-            
-            if request.parallel_processing:
-                # 병렬 처리
-                tasks = []
-                for audio_file in request.audio_files:
-                    if Path(audio_file).exists():
-                        task = asyncio.create_task(
-                            _predict_single_async(audio_file, request.feature_type, request.use_cache)
-                        )
-                        tasks.append(task)
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-            else:
-                # 순차 처리
-                for audio_file in request.audio_files:
-                    if Path(audio_file).exists():
-                        try:
-                            result = inference_engine.predict(
-                                audio_path=audio_file,
-                                feature_type=request.feature_type,
-                                use_cache=request.use_cache
-                            )
-                            results.append(result)
-                        except Exception as e:
-                            results.append({"error": str(e), "file": audio_file})
+            async for _, chunk_results in _iter_batch_chunks(chunks, request):
+                results.extend(chunk_results)
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
@@ -317,6 +340,17 @@ def _register_routes(app: FastAPI):
             logger.error(f"배치 예측 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"배치 예측 실패: {str(e)}")
     
+    @app.get("/batcher/stats")
+    async def get_batcher_stats():
+        """동적 배치기 통계 (배치 크기, 대기열 지연)"""
+        if not request_batcher:
+            raise HTTPException(status_code=503, detail="동적 배치기가 초기화되지 않았습니다")
+        
+        return {
+            **request_batcher.get_stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    
     @app.post("/streaming/start")
     async def start_streaming():
         """스트리밍 추론 시작"""
@@ -449,23 +483,71 @@ def _register_routes(app: FastAPI):
             raise HTTPException(status_code=500, detail=f"캐시 정리 실패: {str(e)}")
 
 
-async def _predict_single_async(audio_path: str, feature_type: str, use_cache: bool):
-    """단일 파일 비동기 예측"""
-    return inference_engine.predict(
-        audio_path=audio_path,
-        feature_type=feature_type,
-        use_cache=use_cache
-    )
+async def _iter_batch_chunks(chunks: List[List[str]], request: BatchRequest):
+    """
+    청크를 배치 워커 풀에서 실행하고 입력 순서대로 (시작 인덱스, 결과) 반환
+    
+    parallel_processing이면 여러 청크를 동시에 제출하고(워커 수로 제한),
+    아니면 한 청크씩 순서대로 실행합니다.
+    """
+    loop = asyncio.get_running_loop()
+    
+    def submit(chunk: List[str]):
+        return loop.run_in_executor(
+            batch_executor,
+            partial(
+                inference_engine.predict_batch,
+                chunk,
+                batch_size=len(chunk),
+                feature_type=request.feature_type,
+                use_cache=request.use_cache
+            )
+        )
+    
+    offset = 0
+    if request.parallel_processing:
+        futures = [submit(chunk) for chunk in chunks]
+        try:
+            for chunk, future in zip(chunks, futures):
+                yield offset, await future
+                offset += len(chunk)
+        finally:
+            for future in futures:
+                future.cancel()
+    else:
+        for chunk in chunks:
+            yield offset, await submit(chunk)
+            offset += len(chunk)
 
 
-def _cleanup_temp_file(file_path: str):
-    """임시 파일 정리"""
+async def _stream_batch_results(chunks: List[List[str]], request: BatchRequest, start_time: datetime):
+    """배치 결과를 청크가 끝날 때마다 NDJSON으로 전송"""
+    successful = 0
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.info(f"임시 파일 삭제 완료: {file_path}")
+        async for offset, chunk_results in _iter_batch_chunks(chunks, request):
+            lines = []
+            for i, result in enumerate(chunk_results):
+                if "error" not in result:
+                    successful += 1
+                lines.append(json.dumps(
+                    {"index": offset + i, "file": request.audio_files[offset + i], **result},
+                    ensure_ascii=False, default=str
+                ))
+            yield "\n".join(lines) + "\n"
+        
+        summary = {
+            "done": True,
+            "success": True,
+            "batch_size": len(request.audio_files),
+            "successful_predictions": successful,
+            "processing_time": (datetime.now() - start_time).total_seconds(),
+            "timestamp": datetime.now().isoformat()
+        }
     except Exception as e:
-        logger.error(f"임시 파일 삭제 실패: {file_path}, {str(e)}")
+        logger.error(f"배치 예측 실패: {str(e)}")
+        summary = {"done": True, "success": False, "error": f"배치 예측 실패: {str(e)}"}
+    
+    yield json.dumps(summary, ensure_ascii=False) + "\n"
 
 
 class ModelServer:
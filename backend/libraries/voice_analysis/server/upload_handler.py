@@ -0,0 +1,160 @@
+# 제7강: AI 모델 이해와 로컬 테스트 - 업로드 처리
+"""
+오디오 업로드 수신 모듈
+multipart 본문을 청크 단위로 읽어 작은 파일은 메모리에서 바로 디코딩하고,
+큰 파일은 요청마다 고유한 임시 파일로 스풀링
+"""
+
+import io
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+# 업로드 설정
+UPLOAD_MAX_BYTES = int(float(os.getenv('UPLOAD_MAX_MB', '100')) * 1024 * 1024)
+UPLOAD_MEMORY_MAX_BYTES = int(float(os.getenv('UPLOAD_MEMORY_MAX_MB', '2')) * 1024 * 1024)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# soundfile(libsndfile)로 디코딩 가능한 형식만 허용
+SUPPORTED_FORMATS = ('wav', 'flac', 'ogg', 'aiff', 'mp3')
+
+
+class UploadRejectedError(Exception):
+    """업로드를 처리할 수 없음 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class InMemoryAudio(io.BytesIO):
+    """메모리에 보관된 작은 업로드 (soundfile이 파일 객체로 직접 디코딩)"""
+
+    def __init__(self, data: bytes = b'', filename: str = 'upload'):
+        super().__init__(data)
+        self.filename = filename
+
+    def __str__(self) -> str:
+        return f"<memory:{self.filename}>"
+
+
+@dataclass
+class SpooledAudio:
+    """수신 완료된 업로드"""
+    source: Union[str, InMemoryAudio]
+    size: int
+    audio_format: str
+
+    @property
+    def in_memory(self) -> bool:
+        return isinstance(self.source, InMemoryAudio)
+
+    def cleanup(self):
+        """임시 파일 삭제 (메모리 업로드는 버퍼 해제)"""
+        if self.in_memory:
+            self.source.close()
+            return
+        try:
+            os.remove(self.source)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"임시 파일 삭제 실패: {self.source}, {str(e)}")
+
+
+def detect_audio_format(header: bytes) -> Optional[str]:
+    """파일 앞부분 바이트로 오디오 형식 판별"""
+    if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        return 'wav'
+    if header[:4] == b'fLaC':
+        return 'flac'
+    if header[:4] == b'OggS':
+        return 'ogg'
+    if header[:4] == b'FORM' and header[8:12] in (b'AIFF', b'AIFC'):
+        return 'aiff'
+    if header[:3] == b'ID3' or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return 'mp3'
+    if header[4:8] == b'ftyp':
+        return 'm4a'
+    return None
+
+
+async def spool_upload(
+    upload: UploadFile,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    memory_max_bytes: int = UPLOAD_MEMORY_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> SpooledAudio:
+    """
+    업로드 본문을 청크 단위로 수신
+
+    ``memory_max_bytes`` 이하는 메모리 버퍼로 유지하고, 넘으면 그때까지 받은
+    데이터를 고유한 임시 파일로 옮긴 뒤 나머지를 이어서 씁니다.
+
+    Raises:
+        UploadRejectedError: 형식 미지원(415), 크기 초과(413), 빈 파일(400)
+    """
+    declared_size = getattr(upload, 'size', None)
+    if declared_size is not None and declared_size > max_bytes:
+        raise UploadRejectedError(413, f"업로드 크기 제한 초과: {declared_size} > {max_bytes} bytes")
+
+    filename = upload.filename or 'upload'
+    buffer: Optional[InMemoryAudio] = InMemoryAudio(filename=filename)
+    spool_file = None
+    audio_format = None
+    total = 0
+
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+
+            if audio_format is None:
+                audio_format = detect_audio_format(chunk[:16])
+                if audio_format not in SUPPORTED_FORMATS:
+                    raise UploadRejectedError(
+                        415, f"지원하지 않는 오디오 형식입니다: {audio_format or 'unknown'}"
+                    )
+
+            total += len(chunk)
+            if total > max_bytes:
+                raise UploadRejectedError(413, f"업로드 크기 제한 초과: {max_bytes} bytes")
+
+            if spool_file is None and total > memory_max_bytes:
+                # 메모리 한도 초과 - 고유한 임시 파일로 전환
+                spool_file = tempfile.NamedTemporaryFile(
+                    prefix='uploaded_audio_', suffix=f'.{audio_format}', delete=False
+                )
+                await run_in_threadpool(spool_file.write, buffer.getvalue())
+                buffer.close()
+                buffer = None
+
+            if spool_file is not None:
+                await run_in_threadpool(spool_file.write, chunk)
+            else:
+                buffer.write(chunk)
+
+        if total == 0:
+            raise UploadRejectedError(400, "빈 오디오 파일입니다")
+
+    except BaseException:
+        if spool_file is not None:
+            spool_file.close()
+            SpooledAudio(spool_file.name, total, audio_format or '').cleanup()
+        raise
+
+    if spool_file is not None:
+        spool_file.close()
+        return SpooledAudio(spool_file.name, total, audio_format)
+
+    buffer.seek(0)
+    return SpooledAudio(buffer, total, audio_format)
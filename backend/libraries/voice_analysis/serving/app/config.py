@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     
     # Model serving settings
     max_batch_size: int = 32
+    batch_concurrency: int = int(os.getenv("BATCH_CONCURRENCY", 8))
     model_cache_ttl: int = 3600  # 1 hour
     request_timeout: int = 30
     max_audio_duration: int = 300  # 5 minutes
@@ -42,6 +43,7 @@ class Settings(BaseSettings):
     enable_gpu: bool = os.getenv("ENABLE_GPU", "true").lower() == "true"
     memory_limit_mb: int = int(os.getenv("MEMORY_LIMIT_MB", 4096))
     cpu_cores: int = int(os.getenv("CPU_CORES", 2))
+    feature_workers: int = int(os.getenv("FEATURE_WORKERS", os.getenv("CPU_CORES", 2)))
     
     # Monitoring and logging
     enable_metrics: bool = True
@@ -53,6 +55,16 @@ class Settings(BaseSettings):
     api_key_required: bool = os.getenv("API_KEY_REQUIRED", "false").lower() == "true"
     allowed_origins: str = os.getenv("ALLOWED_ORIGINS", "*")
     max_request_size_mb: int = 100
+    max_audio_download_mb: int = int(os.getenv("MAX_AUDIO_DOWNLOAD_MB", 200))
+    
+    # Audio download settings
+    download_chunk_size: int = 1024 * 1024  # 1 MiB
+    download_max_connections: int = int(os.getenv("DOWNLOAD_MAX_CONNECTIONS", 20))
+    # Off by default: on Cloud Run /tmp is in-memory and counts against the
+    # container memory limit, so point AUDIO_CACHE_DIR at a disk-backed volume
+    audio_cache_enabled: bool = os.getenv("AUDIO_CACHE_ENABLED", "false").lower() == "true"
+    audio_cache_dir: str = os.getenv("AUDIO_CACHE_DIR", "/tmp/audio_cache")
+    audio_cache_max_mb: int = int(os.getenv("AUDIO_CACHE_MAX_MB", 1024))
     
     # Cache settings
     redis_host: Optional[str] = os.getenv("REDIS_HOST")
@@ -0,0 +1,149 @@
+"""
+Local content cache for downloaded audio files
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AudioDownloadCache:
+    """
+    Disk cache of downloaded audio keyed by source URL plus a version token
+    (GCS object generation or HTTP ETag / Last-Modified).
+
+    Cached files are shared read-only between requests; callers must not
+    delete paths returned by ``lookup`` or ``store``. Those paths are pinned
+    until the caller passes them to ``release``, and pinned files are never
+    evicted. Least recently used unpinned files are evicted once the cache
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pins: Dict[str, int] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    @staticmethod
+    def make_key(url: str, version: Optional[str] = None, suffix: str = '') -> str:
+        """Cache key for a URL at a given version (suffix keeps the file extension)"""
+        digest = hashlib.sha256(f"{url}#{version or ''}".encode('utf-8')).hexdigest()
+        return f"{digest}{suffix}"
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.meta.json"
+
+    def _latest_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self.make_key(url)}.latest.json"
+
+    def _pin(self, key: str) -> None:
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def release(self, path: str) -> None:
+        """Unpin a path returned by ``lookup`` or ``store`` once the caller is done with it"""
+        key = Path(path).name
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+
+    def lookup(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (path, metadata) for a cached file, refreshing its recency and pinning it"""
+        data_path = self._data_path(key)
+        with self._lock:
+            if not data_path.exists():
+                self.stats['misses'] += 1
+                return None
+            self._pin(key)
+
+        try:
+            metadata = json.loads(self._meta_path(key).read_text())
+        except (OSError, ValueError):
+            metadata = {}
+
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+        self.stats['hits'] += 1
+        return str(data_path), metadata
+
+    def peek_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        """Metadata of the latest cached version of a URL (for conditional requests)"""
+        try:
+            return json.loads(self._latest_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, temp_path: str, metadata: Dict[str, Any],
+              url: Optional[str] = None) -> str:
+        """
+        Move a fully downloaded temp file into the cache (returned path is pinned)
+
+        Args:
+            key: Cache key from ``make_key``
+            temp_path: Downloaded file (moved, not copied)
+            metadata: Version information saved next to the file
+            url: When given, also record ``metadata`` as the URL's latest version
+        """
+        data_path = self._data_path(key)
+        meta = dict(metadata, key=key)
+        with self._lock:
+            os.replace(temp_path, data_path)
+            self._pin(key)
+        self._meta_path(key).write_text(json.dumps(meta))
+        if url is not None:
+            self._latest_path(url).write_text(json.dumps(meta))
+
+        self.stats['stores'] += 1
+        self._evict()
+        return str(data_path)
+
+    def _evict(self) -> None:
+        """Remove least recently used unpinned files until under the size budget"""
+        with self._lock:
+            entries = []
+            total = 0
+            for data_path in self.cache_dir.iterdir():
+                if data_path.name.endswith('.json'):
+                    continue
+                try:
+                    stat = data_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, data_path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for _, size, data_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if data_path.name in self._pins:
+                    # Still being read by a request
+                    continue
+                try:
+                    data_path.unlink()
+                    self._meta_path(data_path.name).unlink(missing_ok=True)
+                except OSError:
+                    continue
+                total -= size
+                self.stats['evictions'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, pinned=len(self._pins), cache_dir=str(self.cache_dir),
+                    max_bytes=self.max_bytes)
@@ -3,14 +3,16 @@ Model inference engine for voice analysis
 """
 import torch
 import numpy as np
-import librosa
 import tempfile
 import time
 import logging
 import asyncio
 import os
-from typing import Dict, Tuple, Optional, Any
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, Union
 from pathlib import Path
+from urllib.parse import urlparse
 from functools import lru_cache
 import aiofiles
 import httpx
@@ -19,6 +21,9 @@ from google.cloud import storage
 from google.cloud import aiplatform
 
 from app.config import get_settings
+from app.download_cache import AudioDownloadCache
+from app import features as audio_features
+from app.features import AudioFeatureSet
 from app.models import (
     EmotionScore, 
     MentalHealthIndicators, 
@@ -29,6 +34,18 @@ from app.models import (
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+class AudioTooLargeError(ValueError):
+    """Raised when a source audio file exceeds the download size limit"""
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class ModelInference:
     """Model inference engine with optimizations"""
     
@@ -39,6 +56,12 @@ class ModelInference:
         self.storage_client = None
         self.model_loaded = False
         self.last_prediction_time = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.download_cache: Optional[AudioDownloadCache] = None
+        # CPU-bound decode/feature/model work runs here to keep the event loop free
+        self.compute_pool = ThreadPoolExecutor(
+            max_workers=settings.feature_workers, thread_name_prefix="features"
+        )
         self._initialize()
         
     def _initialize(self):
@@ -50,6 +73,7 @@ class ModelInference:
             
             # Initialize storage client
             self.storage_client = storage.Client() if settings.gcs_bucket else None
+            self.download_cache = self._create_download_cache()
             
             # Load model
             self._load_model()
@@ -134,226 +158,230 @@ class ModelInference:
         except Exception as e:
             logger.warning(f"Warmup failed: {e}")
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client (keep-alive, HTTP/2 when available)"""
+        if self._http_client is None or self._http_client.is_closed:
+            limits = httpx.Limits(
+                max_connections=settings.download_max_connections,
+                max_keepalive_connections=settings.download_max_connections,
+                keepalive_expiry=60.0
+            )
+            timeout = httpx.Timeout(settings.request_timeout, connect=10.0)
+            try:
+                self._http_client = httpx.AsyncClient(
+                    http2=True, limits=limits, timeout=timeout, follow_redirects=True
+                )
+            except ImportError:
+                # h2 package not installed
+                logger.warning("HTTP/2 support unavailable, using HTTP/1.1 for downloads")
+                self._http_client = httpx.AsyncClient(
+                    limits=limits, timeout=timeout, follow_redirects=True
+                )
+        return self._http_client
+
+    def _create_download_cache(self) -> Optional[AudioDownloadCache]:
+        """Local content cache for downloaded audio (None when disabled)"""
+        if not settings.audio_cache_enabled:
+            return None
+        try:
+            return AudioDownloadCache(
+                settings.audio_cache_dir,
+                max_bytes=settings.audio_cache_max_mb * 1024 * 1024
+            )
+        except OSError as e:
+            logger.warning(f"Audio download cache disabled: {e}")
+            return None
+
+    async def aclose(self):
+        """Release pooled connections and worker threads"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self.compute_pool.shutdown(wait=False)
+
     async def download_audio(self, audio_url: str) -> str:
-        """Download audio file from URL"""
-        temp_file = None
-        
+        """Download audio file from URL to a temp file owned by the caller"""
+        path, owned = await self.fetch_audio(audio_url)
+        if owned:
+            return path
+
+        # Cached copy is shared; hand the caller a private copy
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=Path(path).suffix or '.wav')
+            os.close(fd)
+            await asyncio.get_running_loop().run_in_executor(None, shutil.copyfile, path, temp_path)
+            return temp_path
+        finally:
+            self.download_cache.release(path)
+
+    async def fetch_audio(self, audio_url: str) -> Tuple[str, bool]:
+        """
+        Stream audio from GCS or HTTP(S) to local disk
+
+        Returns:
+            (path, owned) - ``owned`` is False when the path belongs to the
+            download cache; the caller must not delete it and must pass it to
+            ``download_cache.release`` when done reading
+        """
+        max_bytes = settings.max_audio_download_mb * 1024 * 1024
+        suffix = Path(urlparse(audio_url).path).suffix or '.wav'
+
         try:
             if audio_url.startswith('gs://'):
-                # Download from GCS
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                parts = audio_url.replace('gs://', '').split('/', 1)
-                bucket = self.storage_client.bucket(parts[0])
-                blob = bucket.blob(parts[1])
-                
-                await asyncio.get_event_loop().run_in_executor(
-                    None, blob.download_to_filename, temp_file.name
-                )
-                return temp_file.name
-                
-            else:
-                # Download from HTTP(S)
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(audio_url)
-                    response.raise_for_status()
-                    
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                    async with aiofiles.open(temp_file.name, 'wb') as f:
-                        await f.write(response.content)
-                    return temp_file.name
-                    
+                return await self._fetch_gcs(audio_url, suffix, max_bytes)
+            return await self._fetch_http(audio_url, suffix, max_bytes)
+        except AudioTooLargeError:
+            raise
         except Exception as e:
-            if temp_file and os.path.exists(temp_file.name):
-                os.remove(temp_file.name)
             raise Exception(f"Failed to download audio: {e}")
+
+    async def _fetch_gcs(self, audio_url: str, suffix: str, max_bytes: int) -> Tuple[str, bool]:
+        """Download a GCS object, reusing the cached copy of the same generation"""
+        loop = asyncio.get_running_loop()
+        bucket_name, blob_name = audio_url.replace('gs://', '').split('/', 1)
+        bucket = self.storage_client.bucket(bucket_name)
+
+        blob = await loop.run_in_executor(None, bucket.get_blob, blob_name)
+        if blob is None:
+            raise FileNotFoundError(f"GCS object not found: {audio_url}")
+        if blob.size is not None and blob.size > max_bytes:
+            raise AudioTooLargeError(
+                f"Audio file is {blob.size} bytes, limit is {max_bytes} bytes"
+            )
+
+        cache = self.download_cache
+        key = None
+        if cache is not None:
+            key = cache.make_key(audio_url, str(blob.generation), suffix)
+            cached = await loop.run_in_executor(None, cache.lookup, key)
+            if cached is not None:
+                return cached[0], False
+
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        try:
+            # blob carries its generation, so exactly that version is downloaded
+            await loop.run_in_executor(None, blob.download_to_filename, temp_path)
+        except BaseException:
+            _remove_quietly(temp_path)
+            raise
+
+        if cache is not None:
+            metadata = {'generation': blob.generation, 'size': blob.size}
+            path = await loop.run_in_executor(None, cache.store, key, temp_path, metadata)
+            return path, False
+        return temp_path, True
+
+    async def _fetch_http(self, audio_url: str, suffix: str, max_bytes: int) -> Tuple[str, bool]:
+        """Stream an HTTP(S) download to disk in chunks, revalidating cached copies"""
+        loop = asyncio.get_running_loop()
+        cache = self.download_cache
+        headers = {}
+        cached_meta = None
+        if cache is not None:
+            cached_meta = await loop.run_in_executor(None, cache.peek_metadata, audio_url)
+        if cached_meta:
+            if cached_meta.get('etag'):
+                headers['If-None-Match'] = cached_meta['etag']
+            elif cached_meta.get('last_modified'):
+                headers['If-Modified-Since'] = cached_meta['last_modified']
+
+        async with self.http_client.stream('GET', audio_url, headers=headers) as response:
+            if response.status_code != 304:
+                response.raise_for_status()
+                return await self._write_response(
+                    response, audio_url, suffix, max_bytes, cache
+                )
+            cached = None
+            if cached_meta:
+                cached = await loop.run_in_executor(None, cache.lookup, cached_meta['key'])
+            if cached is not None:
+                return cached[0], False
+
+        # Not modified, but the cached file was evicted in the meantime
+        async with self.http_client.stream('GET', audio_url) as response:
+            response.raise_for_status()
+            return await self._write_response(response, audio_url, suffix, max_bytes, cache)
+
+    async def _write_response(self, response: httpx.Response, audio_url: str, suffix: str,
+                              max_bytes: int, cache: Optional[AudioDownloadCache]) -> Tuple[str, bool]:
+        """Write a streamed response body to a temp file, enforcing the size limit"""
+        content_length = response.headers.get('content-length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise AudioTooLargeError(
+                f"Audio file is {content_length} bytes, limit is {max_bytes} bytes"
+            )
+
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        try:
+            received = 0
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in response.aiter_bytes(settings.download_chunk_size):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise AudioTooLargeError(
+                            f"Audio download exceeded limit of {max_bytes} bytes"
+                        )
+                    await f.write(chunk)
+        except BaseException:
+            _remove_quietly(temp_path)
+            raise
+
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if cache is not None and (etag or last_modified):
+            key = cache.make_key(audio_url, etag or last_modified, suffix)
+            metadata = {'etag': etag, 'last_modified': last_modified, 'size': received}
+            path = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: cache.store(key, temp_path, metadata, url=audio_url)
+            )
+            return path, False
+        return temp_path, True
     
-    def extract_features(self, audio_path: str) -> np.ndarray:
-        """Extract comprehensive audio features"""
+    def extract_all_features(self, audio_path: str, include_biomarkers: bool = True) -> AudioFeatureSet:
+        """Decode audio once and extract model features, voice features and biomarkers"""
         try:
-            # Load audio
-            y, sr = librosa.load(audio_path, sr=16000)
-            
-            # Check duration
-            duration = len(y) / sr
-            if duration > settings.max_audio_duration:
-                raise ValueError(f"Audio duration {duration:.1f}s exceeds maximum {settings.max_audio_duration}s")
-            
-            features = []
-            
-            # MFCC features
-            mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-            features.extend([
-                mfcc.mean(axis=1),
-                mfcc.std(axis=1)
-            ])
-            
-            # Spectral features
-            spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)
-            spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)
-            spectral_contrast = librosa.feature.spectral_contrast(y=y, sr=sr)
-            
-            features.extend([
-                [np.mean(spectral_centroid), np.std(spectral_centroid)],
-                [np.mean(spectral_rolloff), np.std(spectral_rolloff)],
-                [np.mean(spectral_bandwidth), np.std(spectral_bandwidth)],
-                spectral_contrast.mean(axis=1)
-            ])
-            
-            # Zero crossing rate
-            zcr = librosa.feature.zero_crossing_rate(y)
-            features.append([np.mean(zcr), np.std(zcr)])
-            
-            # Tempo and beat features
-            tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
-            features.append([tempo, len(beats)])
-            
-            # Energy features
-            energy = np.sum(y ** 2) / len(y)
-            features.append([energy, np.std(y ** 2)])
-            
-            # Pitch features
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            pitch_values = []
-            for t in range(pitches.shape[1]):
-                index = magnitudes[:, t].argmax()
-                pitch = pitches[index, t]
-                if pitch > 0:
-                    pitch_values.append(pitch)
-            
-            if pitch_values:
-                features.append([np.mean(pitch_values), np.std(pitch_values), 
-                               np.min(pitch_values), np.max(pitch_values)])
-            else:
-                features.append([0, 0, 0, 0])
-            
-            # Flatten and return
-            return np.concatenate([np.array(f).flatten() for f in features])
-            
+            return audio_features.extract_all(
+                audio_path,
+                include_biomarkers=include_biomarkers,
+                max_duration=settings.max_audio_duration
+            )
         except Exception as e:
             logger.error(f"Feature extraction failed: {e}")
             raise
+
+    def extract_features(self, audio_path: str) -> np.ndarray:
+        """Extract comprehensive audio features"""
+        return self.extract_all_features(audio_path, include_biomarkers=False).features
     
     def extract_voice_features(self, audio_path: str) -> VoiceFeatures:
         """Extract detailed voice features"""
         try:
-            y, sr = librosa.load(audio_path, sr=16000)
-            
-            # Pitch analysis
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            pitch_values = []
-            for t in range(pitches.shape[1]):
-                index = magnitudes[:, t].argmax()
-                pitch = pitches[index, t]
-                if pitch > 0:
-                    pitch_values.append(pitch)
-            
-            pitch_mean = np.mean(pitch_values) if pitch_values else 0
-            pitch_std = np.std(pitch_values) if pitch_values else 0
-            pitch_range = (max(pitch_values) - min(pitch_values)) if pitch_values else 0
-            
-            # Energy analysis
-            energy = librosa.feature.rms(y=y)
-            energy_mean = np.mean(energy)
-            energy_std = np.std(energy)
-            
-            # Speaking rate estimation
-            onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
-            speaking_rate = len(onset_frames) / (len(y) / sr) if len(y) > 0 else 0
-            
-            # Pause analysis
-            silence_threshold = 0.02 * np.max(np.abs(y))
-            is_silence = np.abs(y) < silence_threshold
-            pause_ratio = np.sum(is_silence) / len(y) if len(y) > 0 else 0
-            
-            # Voice quality (simplified)
-            spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
-            voice_quality = min(1.0, np.mean(spectral_centroid) / 4000)
-            
-            # Articulation clarity (simplified)
-            zcr = librosa.feature.zero_crossing_rate(y)
-            articulation_clarity = min(1.0, np.mean(zcr) * 2)
-            
-            return VoiceFeatures(
-                pitch_mean=float(pitch_mean),
-                pitch_std=float(pitch_std),
-                pitch_range=float(pitch_range),
-                energy_mean=float(energy_mean),
-                energy_std=float(energy_std),
-                speaking_rate=float(speaking_rate),
-                pause_ratio=float(pause_ratio),
-                voice_quality=float(voice_quality),
-                articulation_clarity=float(articulation_clarity)
-            )
-            
-        except Exception as e:
-            logger.error(f"Voice feature extraction failed: {e}")
-            # Return default values
-            return VoiceFeatures(
-                pitch_mean=0, pitch_std=0, pitch_range=0,
-                energy_mean=0, energy_std=0, speaking_rate=0,
-                pause_ratio=0, voice_quality=0.5, articulation_clarity=0.5
-            )
+            return self.extract_all_features(audio_path, include_biomarkers=False).voice_features
+        except Exception:
+            return audio_features.default_voice_features()
     
     def extract_voice_biomarkers(self, audio_path: str) -> VoiceBiomarkers:
         """Extract voice biomarkers for health assessment"""
-        try:
-            y, sr = librosa.load(audio_path, sr=16000)
-            
-            # Simplified biomarker extraction
-            # In production, these would be more sophisticated
-            
-            # Respiratory pattern (simplified)
-            respiratory_pattern = {
-                "breathing_rate": float(np.random.uniform(12, 20)),
-                "breath_depth": float(np.random.uniform(0.4, 0.8)),
-                "irregularity": float(np.random.uniform(0, 0.3))
-            }
-            
-            # Vocal tremor
-            vocal_tremor = float(np.random.uniform(0, 0.2))
-            
-            # Voice breaks
-            voice_breaks = int(np.random.poisson(2))
-            
-            # Jitter and shimmer (simplified)
-            jitter = float(np.random.uniform(0.5, 2.0))
-            shimmer = float(np.random.uniform(2.0, 5.0))
-            
-            # Harmonic to noise ratio
-            hnr = float(np.random.uniform(15, 25))
-            
-            return VoiceBiomarkers(
-                respiratory_pattern=respiratory_pattern,
-                vocal_tremor=vocal_tremor,
-                voice_breaks=voice_breaks,
-                jitter=jitter,
-                shimmer=shimmer,
-                harmonic_noise_ratio=hnr
-            )
-            
-        except Exception as e:
-            logger.error(f"Biomarker extraction failed: {e}")
-            # Return default values
-            return VoiceBiomarkers(
-                respiratory_pattern={"breathing_rate": 16, "breath_depth": 0.6, "irregularity": 0.1},
-                vocal_tremor=0.1,
-                voice_breaks=0,
-                jitter=1.0,
-                shimmer=3.0,
-                harmonic_noise_ratio=20.0
-            )
+        y, sr = audio_features.load_audio(audio_path)
+        return audio_features.voice_biomarkers(y, sr)
     
     async def predict_vertex_ai(self, features: np.ndarray) -> Dict:
         """Make prediction using Vertex AI endpoint"""
+        return (await self.predict_vertex_ai_batch([features]))[0]
+    
+    async def predict_vertex_ai_batch(self, features_list: List[np.ndarray]) -> List[Dict]:
+        """Make predictions for many feature vectors with one Vertex AI call"""
         try:
-            instances = [features.tolist()]
+            instances = [features.tolist() for features in features_list]
             
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 None, self.endpoint.predict, instances
             )
             
-            return self._parse_predictions(response.predictions[0])
+            return [self._parse_predictions(p) for p in response.predictions]
             
         except Exception as e:
             logger.error(f"Vertex AI prediction failed: {e}")
@@ -361,36 +389,63 @@ class ModelInference:
     
     def predict_local(self, features: np.ndarray) -> Dict:
         """Make prediction using local model"""
+        return self.predict_local_batch(np.expand_dims(features, 0))[0]
+    
+    def predict_local_batch(self, features: np.ndarray) -> List[Dict]:
+        """Make predictions for a (batch, n_features) matrix in one forward pass"""
+        batch_size = features.shape[0]
         try:
             with torch.no_grad():
-                input_tensor = torch.FloatTensor(features).unsqueeze(0).to(self.device)
+                input_tensor = torch.as_tensor(features, dtype=torch.float32).to(self.device)
                 output = self.model(input_tensor)
                 
                 # Process output based on model architecture
                 if isinstance(output, dict):
-                    emotions = torch.softmax(output.get('emotions', torch.randn(1, 7)), dim=1).cpu().numpy()[0]
-                    mental_health = torch.sigmoid(output.get('mental_health', torch.randn(1, 6))).cpu().numpy()[0]
-                    confidence = output.get('confidence', torch.tensor([0.8])).cpu().item()
+                    emotions = torch.softmax(output.get('emotions', torch.randn(batch_size, 7)), dim=1).cpu().numpy()
+                    mental_health = torch.sigmoid(output.get('mental_health', torch.randn(batch_size, 6))).cpu().numpy()
+                    confidence = output.get('confidence', torch.tensor([0.8]))
+                    confidence = confidence.reshape(-1).expand(batch_size).cpu().numpy()
                 else:
                     # Assume single output that needs to be split
-                    emotions = torch.softmax(output[:, :7], dim=1).cpu().numpy()[0]
-                    mental_health = torch.sigmoid(output[:, 7:13]).cpu().numpy()[0]
-                    confidence = 0.8
-            
-            return {
-                'emotions': emotions.tolist(),
-                'mental_health': mental_health.tolist(),
-                'confidence': float(confidence)
-            }
+                    emotions = torch.softmax(output[:, :7], dim=1).cpu().numpy()
+                    mental_health = torch.sigmoid(output[:, 7:13]).cpu().numpy()
+                    confidence = np.full(batch_size, 0.8)
+            
+            return [
+                {
+                    'emotions': emotions[i].tolist(),
+                    'mental_health': mental_health[i].tolist(),
+                    'confidence': float(confidence[i])
+                }
+                for i in range(batch_size)
+            ]
             
         except Exception as e:
             logger.error(f"Local prediction failed: {e}")
             # Return random predictions for development
-            return {
-                'emotions': np.random.dirichlet(np.ones(7)).tolist(),
-                'mental_health': np.random.random(6).tolist(),
-                'confidence': 0.5
-            }
+            return [
+                {
+                    'emotions': np.random.dirichlet(np.ones(7)).tolist(),
+                    'mental_health': np.random.random(6).tolist(),
+                    'confidence': 0.5
+                }
+                for _ in range(batch_size)
+            ]
+    
+    async def _predict_many(self, features_list: List[np.ndarray]) -> List[Dict]:
+        """Run the model over many feature vectors, chunked by max_batch_size"""
+        predictions = []
+        loop = asyncio.get_running_loop()
+        chunk_size = max(1, settings.max_batch_size)
+        for offset in range(0, len(features_list), chunk_size):
+            chunk = features_list[offset:offset + chunk_size]
+            if self.endpoint:
+                predictions.extend(await self.predict_vertex_ai_batch(chunk))
+            else:
+                predictions.extend(await loop.run_in_executor(
+                    self.compute_pool, self.predict_local_batch, np.stack(chunk)
+                ))
+        return predictions
     
     def _parse_predictions(self, predictions: Any) -> Dict:
         """Parse predictions from various formats"""
@@ -409,72 +464,127 @@ class ModelInference:
                 'confidence': 0.5
             }
     
-    async def analyze(self, audio_url: str, analysis_type: str = "comprehensive") -> Dict:
-        """Perform complete audio analysis"""
-        start_time = time.time()
+    async def prepare(self, audio_url: str, analysis_type: str = "comprehensive") -> AudioFeatureSet:
+        """Download audio and extract all features from a single decode"""
         audio_path = None
+        owned = False
         
         try:
-            # Download audio
-            audio_path = await self.download_audio(audio_url)
-            
-            # Extract features
-            features = self.extract_features(audio_path)
-            voice_features = self.extract_voice_features(audio_path)
+            # Download audio (cached files are shared: released, never removed)
+            audio_path, owned = await self.fetch_audio(audio_url)
             
-            # Make prediction
-            if self.endpoint:
-                predictions = await self.predict_vertex_ai(features)
-            else:
-                predictions = self.predict_local(features)
-            
-            # Create response objects
-            emotions = EmotionScore(
-                happiness=predictions['emotions'][0],
-                sadness=predictions['emotions'][1],
-                anger=predictions['emotions'][2],
-                fear=predictions['emotions'][3],
-                surprise=predictions['emotions'][4],
-                disgust=predictions['emotions'][5],
-                neutral=predictions['emotions'][6]
-            )
-            
-            mental_health = MentalHealthIndicators(
-                depression_risk=predictions['mental_health'][0],
-                anxiety_level=predictions['mental_health'][1],
-                stress_level=predictions['mental_health'][2],
-                cognitive_load=predictions['mental_health'][3],
-                emotional_stability=predictions['mental_health'][4] if len(predictions['mental_health']) > 4 else 0.5,
-                social_engagement=predictions['mental_health'][5] if len(predictions['mental_health']) > 5 else 0.5
+            # Extract features off the event loop
+            include_biomarkers = analysis_type in ("comprehensive", "voice_biomarkers")
+            return await asyncio.get_running_loop().run_in_executor(
+                self.compute_pool, self.extract_all_features, audio_path, include_biomarkers
             )
             
-            # Extract biomarkers if comprehensive analysis
-            voice_biomarkers = None
-            if analysis_type == "comprehensive" or analysis_type == "voice_biomarkers":
-                voice_biomarkers = self.extract_voice_biomarkers(audio_path)
-            
-            # Update last prediction time
-            self.last_prediction_time = time.time()
-            
-            # Calculate processing time
-            processing_time = int((time.time() - start_time) * 1000)
-            
-            return {
-                'emotions': emotions,
-                'mental_health': mental_health,
-                'voice_features': voice_features,
-                'voice_biomarkers': voice_biomarkers,
-                'confidence': predictions['confidence'],
-                'processing_time_ms': processing_time
-            }
-            
         finally:
             # Cleanup
-            if audio_path and os.path.exists(audio_path):
+            if owned and audio_path and os.path.exists(audio_path):
                 try:
                     os.remove(audio_path)
                 except:
                     pass
+            elif audio_path and not owned:
+                self.download_cache.release(audio_path)
+    
+    def _build_result(self, feature_set: AudioFeatureSet, predictions: Dict, start_time: float) -> Dict:
+        """Combine features and model predictions into an analysis result"""
+        # Create response objects
+        emotions = EmotionScore(
+            happiness=predictions['emotions'][0],
+            sadness=predictions['emotions'][1],
+            anger=predictions['emotions'][2],
+            fear=predictions['emotions'][3],
+            surprise=predictions['emotions'][4],
+            disgust=predictions['emotions'][5],
+            neutral=predictions['emotions'][6]
+        )
+        
+        mental_health = MentalHealthIndicators(
+            depression_risk=predictions['mental_health'][0],
+            anxiety_level=predictions['mental_health'][1],
+            stress_level=predictions['mental_health'][2],
+            cognitive_load=predictions['mental_health'][3],
+            emotional_stability=predictions['mental_health'][4] if len(predictions['mental_health']) > 4 else 0.5,
+            social_engagement=predictions['mental_health'][5] if len(predictions['mental_health']) > 5 else 0.5
+        )
+        
+        # Update last prediction time
+        self.last_prediction_time = time.time()
+        
+        # Calculate processing time
+        processing_time = int((time.time() - start_time) * 1000)
+        
+        return {
+            'emotions': emotions,
+            'mental_health': mental_health,
+            'voice_features': feature_set.voice_features,
+            # Biomarkers are only extracted for comprehensive analysis
+            'voice_biomarkers': feature_set.voice_biomarkers,
+            'confidence': predictions['confidence'],
+            'processing_time_ms': processing_time
+        }
+    
+    async def analyze(self, audio_url: str, analysis_type: str = "comprehensive") -> Dict:
+        """Perform complete audio analysis"""
+        start_time = time.time()
+        feature_set = await self.prepare(audio_url, analysis_type)
+        
+        # Make prediction
+        if self.endpoint:
+            predictions = await self.predict_vertex_ai(feature_set.features)
+        else:
+            predictions = await asyncio.get_running_loop().run_in_executor(
+                self.compute_pool, self.predict_local, feature_set.features
+            )
+        
+        return self._build_result(feature_set, predictions, start_time)
+    
+    async def analyze_batch(self, items: List[Tuple[str, str]],
+                            concurrency: Optional[int] = None) -> List[Union[Dict, Exception]]:
+        """
+        Analyze many audio files with one model invocation per chunk
+        
+        Downloads and feature extraction run concurrently (at most
+        ``concurrency`` at a time); the resulting feature vectors are stacked
+        into a single forward pass / Vertex AI call.
+        
+        Args:
+            items: (audio_url, analysis_type) pairs
+            concurrency: Maximum concurrent downloads/extractions
+        
+        Returns:
+            One analysis result or exception per item, in input order
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(concurrency or settings.batch_concurrency)
+        
+        async def prepare_limited(audio_url: str, analysis_type: str) -> AudioFeatureSet:
+            async with semaphore:
+                return await self.prepare(audio_url, analysis_type)
+        
+        prepared = await asyncio.gather(
+            *(prepare_limited(url, analysis_type) for url, analysis_type in items),
+            return_exceptions=True
+        )
+        
+        ready = [i for i, p in enumerate(prepared) if isinstance(p, AudioFeatureSet)]
+        results: List[Union[Dict, Exception]] = list(prepared)
+        if not ready:
+            return results
+        
+        try:
+            predictions = await self._predict_many([prepared[i].features for i in ready])
+        except Exception as e:
+            for i in ready:
+                results[i] = e
+            return results
+        
+        for i, prediction in zip(ready, predictions):
+            results[i] = self._build_result(prepared[i], prediction, start_time)
+        return results
 
 # Singleton instance
 _inference_engine = None
@@ -28,7 +28,7 @@ from app.models import (
     ErrorResponse,
     AnalysisType
 )
-from app.inference import get_inference_engine
+from app.inference import get_inference_engine, AudioTooLargeError
 
 # Configure logging
 logging.basicConfig(
@@ -75,6 +75,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down service")
+    if inference_engine:
+        await inference_engine.aclose()
 
 # Create FastAPI app
 app = FastAPI(
@@ -187,31 +189,8 @@ async def predict(request: PredictionRequest, background_tasks: BackgroundTasks)
             analysis_type=request.analysis_type.value
         )
         
-        # Generate recommendations
-        recommendations = generate_recommendations(
-            analysis_result['emotions'],
-            analysis_result['mental_health']
-        )
-        
-        # Check for risk alerts
-        risk_alerts = generate_risk_alerts(analysis_result['mental_health'])
-        
         # Create response
-        response = PredictionResponse(
-            request_id=request_id,
-            timestamp=datetime.utcnow(),
-            status="success",
-            emotions=analysis_result['emotions'] if request.analysis_type in [AnalysisType.EMOTION, AnalysisType.COMPREHENSIVE] else None,
-            mental_health=analysis_result['mental_health'] if request.analysis_type in [AnalysisType.MENTAL_HEALTH, AnalysisType.COMPREHENSIVE] else None,
-            voice_features=analysis_result['voice_features'],
-            voice_biomarkers=analysis_result.get('voice_biomarkers'),
-            confidence=analysis_result['confidence'],
-            processing_time_ms=analysis_result['processing_time_ms'],
-            model_version=settings.model_version,
-            analysis_type=request.analysis_type,
-            recommendations=recommendations,
-            risk_alerts=risk_alerts
-        )
+        response = build_prediction_response(request, request_id, analysis_result)
         
         # Log metrics
         processing_time = time.time() - start_time
@@ -226,6 +205,13 @@ async def predict(request: PredictionRequest, background_tasks: BackgroundTasks)
         
     except HTTPException:
         raise
+    except AudioTooLargeError as e:
+        error_count.inc()
+        logger.warning(f"Rejected request {request_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     except Exception as e:
         error_count.inc()
         logger.error(f"Prediction failed for request {request_id}: {e}")
@@ -244,23 +230,37 @@ async def batch_predict(batch_request: BatchPredictionRequest):
     start_time = time.time()
     
     logger.info(f"Processing batch {batch_id} with {len(batch_request.requests)} requests")
+    concurrency = resolve_batch_concurrency(batch_request.batch_options)
+    
+    if not inference_engine or not inference_engine.model_loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model not loaded"
+        )
     
     results = []
     successful = 0
     failed = 0
     
-    # Process requests (could be parallelized)
-    for req in batch_request.requests:
-        try:
-            # Create individual prediction
-            response = await predict(req, BackgroundTasks())
-            results.append(response)
-            successful += 1
-        except Exception as e:
-            logger.error(f"Batch item failed: {e}")
+    request_count.inc(len(batch_request.requests))
+    active_requests.inc()
+    try:
+        # Download/extract concurrently, then one model invocation for the whole batch
+        analysis_results = await inference_engine.analyze_batch(
+            [(req.audio_url, req.analysis_type.value) for req in batch_request.requests],
+            concurrency=concurrency
+        )
+    finally:
+        active_requests.dec()
+    
+    for req, analysis_result in zip(batch_request.requests, analysis_results):
+        request_id = str(uuid.uuid4())
+        if isinstance(analysis_result, Exception):
+            error_count.inc()
+            logger.error(f"Batch item failed: {analysis_result}")
             # Create error response
             results.append(PredictionResponse(
-                request_id=str(uuid.uuid4()),
+                request_id=request_id,
                 timestamp=datetime.utcnow(),
                 status="failed",
                 confidence=0,
@@ -269,6 +269,9 @@ async def batch_predict(batch_request: BatchPredictionRequest):
                 analysis_type=req.analysis_type
             ))
             failed += 1
+        else:
+            results.append(build_prediction_response(req, request_id, analysis_result))
+            successful += 1
     
     processing_time = int((time.time() - start_time) * 1000)
     
@@ -288,6 +291,51 @@ async def metrics():
     return PlainTextResponse(generate_latest())
 
 # Utility functions
+def resolve_batch_concurrency(batch_options: Optional[dict]) -> int:
+    """Batch concurrency from request options, clamped to [1, settings.batch_concurrency]"""
+    value = (batch_options or {}).get("concurrency")
+    if value is None:
+        return settings.batch_concurrency
+    
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        value = None
+    try:
+        concurrency = int(value)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="batch_options.concurrency must be an integer"
+        )
+    return max(1, min(concurrency, settings.batch_concurrency))
+
+def build_prediction_response(request: PredictionRequest, request_id: str,
+                              analysis_result: dict) -> PredictionResponse:
+    """Create a prediction response from an analysis result"""
+    # Generate recommendations
+    recommendations = generate_recommendations(
+        analysis_result['emotions'],
+        analysis_result['mental_health']
+    )
+    
+    # Check for risk alerts
+    risk_alerts = generate_risk_alerts(analysis_result['mental_health'])
+    
+    return PredictionResponse(
+        request_id=request_id,
+        timestamp=datetime.utcnow(),
+        status="success",
+        emotions=analysis_result['emotions'] if request.analysis_type in [AnalysisType.EMOTION, AnalysisType.COMPREHENSIVE] else None,
+        mental_health=analysis_result['mental_health'] if request.analysis_type in [AnalysisType.MENTAL_HEALTH, AnalysisType.COMPREHENSIVE] else None,
+        voice_features=analysis_result['voice_features'],
+        voice_biomarkers=analysis_result.get('voice_biomarkers'),
+        confidence=analysis_result['confidence'],
+        processing_time_ms=analysis_result['processing_time_ms'],
+        model_version=settings.model_version,
+        analysis_type=request.analysis_type,
+        recommendations=recommendations,
+        risk_alerts=risk_alerts
+    )
+
 def generate_recommendations(emotions, mental_health) -> List[str]:
     """Generate personalized recommendations based on analysis"""
     recommendations = []
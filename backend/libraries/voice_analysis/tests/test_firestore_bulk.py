@@ -0,0 +1,192 @@
+"""
+FirestoreConnector 일괄 쓰기/읽기 테스트
+인메모리 Firestore 대역으로 WriteBatch 커밋 횟수와 get_all 조회 결과 검증
+"""
+
+import unittest
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.utils import firestore_connector as connector_module
+from analysis.utils.firestore_connector import BATCH_WRITE_LIMIT, FirestoreConnector
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self._db = db
+        self.path = path
+        self.id = path.rsplit('/', 1)[-1]
+
+    def collection(self, name):
+        return FakeCollection(self._db, f"{self.path}/{name}")
+
+    def get(self):
+        return FakeSnapshot(self, self._db.documents.get(self.path))
+
+    def delete(self):
+        self._db.documents.pop(self.path, None)
+
+
+class FakeCollection:
+    def __init__(self, db, path):
+        self._db = db
+        self.path = path
+
+    def document(self, doc_id=None):
+        return FakeDocument(self._db, f"{self.path}/{doc_id or uuid.uuid4().hex}")
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self._db = db
+        self._writes = []
+
+    def set(self, ref, data, merge=False):
+        self._writes.append((ref.path, data, merge))
+
+    def update(self, ref, data):
+        if ref.path not in self._db.documents:
+            raise KeyError(ref.path)
+        self._writes.append((ref.path, data, True))
+
+    def delete(self, ref):
+        self._writes.append((ref.path, None, False))
+
+    def commit(self):
+        self._db.commits.append(len(self._writes))
+        for path, data, merge in self._writes:
+            if data is None:
+                self._db.documents.pop(path, None)
+            elif merge:
+                self._db.documents.setdefault(path, {}).update(data)
+            else:
+                self._db.documents[path] = dict(data)
+
+
+class FakeFirestore:
+    """WriteBatch와 get_all만 지원하는 인메모리 Firestore 대역 (bulk_writer 없음)"""
+
+    def __init__(self):
+        self.documents = {}
+        self.commits = []
+        self.get_all_calls = 0
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def get_all(self, references, field_paths=None):
+        self.get_all_calls += 1
+        for ref in reversed(references):
+            data = self.documents.get(ref.path)
+            if data is not None and field_paths is not None:
+                data = {key: value for key, value in data.items() if key in field_paths}
+            yield FakeSnapshot(ref, data)
+
+
+class TestFirestoreBulk(unittest.TestCase):
+    """FirestoreConnector 일괄 처리 테스트 클래스"""
+
+    def setUp(self):
+        self.db = FakeFirestore()
+        self.connector = FirestoreConnector(db=self.db)
+
+    def test_save_analysis_commits_once(self):
+        """분석 문서와 통화 문서 갱신이 한 번의 커밋으로 처리되는지 확인"""
+        self.db.documents['users/user1/calls/call1'] = {'seniorId': 'senior1'}
+        result = {'coreIndicators': {'DRI': {'value': 0.4, 'level': 'normal'}}}
+        with mock.patch.object(connector_module, 'NOTIFICATION_ENABLED', False):
+            saved = self.connector.save_analysis_result(
+                'user1', result, call_id='call1', senior_id='senior1'
+            )
+
+        self.assertTrue(saved)
+        self.assertEqual(self.db.commits, [2])
+        self.assertEqual(self.db.get_all_calls, 1)
+        self.assertIn('users/user1/analyses/call1', self.db.documents)
+        self.assertTrue(self.db.documents['users/user1/calls/call1']['hasAnalysis'])
+        self.assertEqual(self.db.documents['users/user1/calls/call1']['seniorId'], 'senior1')
+
+    def test_save_analysis_skips_missing_call(self):
+        """통화 문서가 없으면 분석 상태만 담긴 통화 문서를 만들지 않는지 확인"""
+        result = {'coreIndicators': {'DRI': {'value': 0.4, 'level': 'normal'}}}
+        with mock.patch.object(connector_module, 'NOTIFICATION_ENABLED', False):
+            saved = self.connector.save_analysis_result(
+                'user1', result, call_id='call1', senior_id='senior1'
+            )
+
+        self.assertTrue(saved)
+        self.assertEqual(self.db.commits, [1])
+        self.assertIn('users/user1/analyses/call1', self.db.documents)
+        self.assertNotIn('users/user1/calls/call1', self.db.documents)
+
+    def test_batch_write_splits_at_limit(self):
+        """쓰기 수가 WriteBatch 한도를 넘으면 나눠서 커밋하는지 확인"""
+        collection = self.db.collection('items')
+        operations = [('set', collection.document(str(i)), {'i': i}) for i in range(BATCH_WRITE_LIMIT + 1)]
+
+        self.assertEqual(self.connector.batch_write(operations), BATCH_WRITE_LIMIT + 1)
+        self.assertEqual(self.db.commits, [BATCH_WRITE_LIMIT, 1])
+        self.assertEqual(len(self.db.documents), BATCH_WRITE_LIMIT + 1)
+
+    def test_get_documents_preserves_order(self):
+        """get_all 한 번으로 요청 순서대로 조회하고 없는 문서는 None인지 확인"""
+        analyses = self.db.collection('users').document('user1').collection('analyses')
+        self.connector.batch_write([
+            ('set', analyses.document('a'), {'coreIndicators': {'DRI': 0.1}, 'metadata': {'big': 1}}),
+            ('set', analyses.document('b'), {'coreIndicators': {'DRI': 0.2}, 'metadata': {'big': 2}}),
+        ])
+
+        refs = [analyses.document(doc_id) for doc_id in ('b', 'missing', 'a')]
+        results = self.connector.get_documents(refs, field_paths=['coreIndicators'])
+
+        self.assertEqual(self.db.get_all_calls, 1)
+        self.assertEqual(results, [{'coreIndicators': {'DRI': 0.2}}, None, {'coreIndicators': {'DRI': 0.1}}])
+
+    def test_indicator_record_timestamp_is_naive(self):
+        """Firestore의 tz-aware 타임스탬프를 파이프라인 현재 기록과 같은 naive 로컬 시간으로 변환하는지 확인"""
+        timestamp = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+        record = FirestoreConnector._to_indicator_record({
+            'doc_id': 'a',
+            'timestamp': timestamp,
+            'transformedResult': {'result': {'coreIndicators': {'DRI': {'value': 0.3}}}}
+        }, use_new_schema=True)
+
+        parsed = datetime.fromisoformat(record['analysis_timestamp'])
+        self.assertIsNone(parsed.tzinfo)
+        self.assertEqual(parsed, timestamp.astimezone().replace(tzinfo=None))
+        self.assertEqual(record['indicators'], {'DRI': 0.3})
+        # 파이프라인이 추가하는 naive 현재 기록과 비교/차이 계산이 가능해야 함
+        self.assertIsInstance(datetime.now() - parsed, timedelta)
+
+    def test_bulk_delete_falls_back_to_batch(self):
+        """bulk_writer가 없는 클라이언트에서는 WriteBatch로 삭제하는지 확인"""
+        collection = self.db.collection('items')
+        refs = [collection.document(str(i)) for i in range(3)]
+        self.connector.batch_write(('set', ref, {'x': 1}) for ref in refs)
+
+        self.assertEqual(self.connector.bulk_delete(refs), 3)
+        self.assertEqual(self.db.documents, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
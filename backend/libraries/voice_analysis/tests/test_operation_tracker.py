@@ -0,0 +1,159 @@
+"""
+OperationTracker 테스트
+가짜 Long Running 작업으로 백오프 폴링, 마감 시간, 취소, 통계 검증
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.utils.operation_tracker import OperationTracker
+
+
+class FakeOperation:
+    """done()이 polls_until_done번째 호출부터 True를 반환하는 가짜 작업"""
+
+    def __init__(self, polls_until_done=None, result=None, error=None):
+        self.polls_until_done = polls_until_done
+        self._result = result
+        self._error = error
+        self.done_calls = 0
+        self.cancel_calls = 0
+
+    def done(self):
+        self.done_calls += 1
+        return self.polls_until_done is not None and self.done_calls >= self.polls_until_done
+
+    def result(self):
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def cancel(self):
+        self.cancel_calls += 1
+        return True
+
+
+class TestOperationTracker(unittest.TestCase):
+    """OperationTracker 테스트 클래스"""
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.tracker = OperationTracker(
+            initial_interval=0.001,
+            max_interval=0.004,
+            backoff=2.0,
+            default_timeout=5.0,
+            executor=self.executor
+        )
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_polls_with_backoff_until_done(self):
+        """done()이 True가 될 때까지 백오프 간격으로 폴링하는지 확인"""
+        operation = FakeOperation(polls_until_done=4, result={'text': 'ok'})
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        with mock.patch.object(asyncio, 'sleep', recording_sleep):
+            result = asyncio.run(self.tracker.wait(operation, operation_id='stt-1'))
+
+        self.assertEqual(result, {'text': 'ok'})
+        self.assertEqual(operation.done_calls, 4)
+        self.assertEqual(sleeps, [0.001, 0.002, 0.004])
+        self.assertEqual(operation.cancel_calls, 0)
+        self.assertEqual(self.tracker.get_stats()['completed'], 1)
+
+    def test_result_error_counts_as_failed(self):
+        """result()가 실패하면 예외를 전달하고 실패로 집계하는지 확인"""
+        operation = FakeOperation(polls_until_done=1, error=RuntimeError('recognition failed'))
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.tracker.wait(operation))
+
+        self.assertEqual(self.tracker.get_stats()['failed'], 1)
+        self.assertEqual(self.tracker.get_stats()['in_flight'], 0)
+
+    def test_deadline_cancels_remote_operation(self):
+        """마감 시간이 지나면 원격 작업을 취소하고 TimeoutError를 발생시키는지 확인"""
+        operation = FakeOperation(polls_until_done=None)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(self.tracker.wait(operation, operation_id='stt-slow', timeout=0.02))
+
+        self.assertEqual(operation.cancel_calls, 1)
+        self.assertGreater(operation.done_calls, 1)
+        stats = self.tracker.get_stats()
+        self.assertEqual(stats['timed_out'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_cancel_stops_waiter_and_cancels_remote(self):
+        """cancel() 호출 시 대기 태스크와 원격 작업이 모두 취소되는지 확인"""
+        operation = FakeOperation(polls_until_done=None)
+
+        async def run():
+            waiter = asyncio.create_task(self.tracker.wait(operation, operation_id='stt-cancel'))
+            while operation.done_calls < 2:
+                await asyncio.sleep(0.001)
+            self.assertTrue(self.tracker.cancel('stt-cancel'))
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(run())
+
+        self.assertEqual(operation.cancel_calls, 1)
+        self.assertFalse(self.tracker.cancel('stt-cancel'))
+        stats = self.tracker.get_stats()
+        self.assertEqual(stats['cancelled'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_in_flight_bookkeeping(self):
+        """진행 중인 작업 목록과 통계가 대기 중/완료 후 올바른지 확인"""
+        fast = FakeOperation(polls_until_done=1, result='fast')
+        slow = FakeOperation(polls_until_done=None)
+
+        async def run():
+            slow_waiter = asyncio.create_task(
+                self.tracker.wait(slow, operation_id='stt-slow', timeout=60.0)
+            )
+            while slow.done_calls < 1:
+                await asyncio.sleep(0.001)
+
+            in_flight = self.tracker.in_flight()
+            self.assertEqual([op['operation_id'] for op in in_flight], ['stt-slow'])
+            self.assertGreaterEqual(in_flight[0]['polls'], 1)
+            self.assertGreater(in_flight[0]['remaining'], 0)
+            self.assertEqual(self.tracker.get_stats()['in_flight'], 1)
+
+            self.assertEqual(await self.tracker.wait(fast), 'fast')
+            self.assertEqual(self.tracker.get_stats()['in_flight'], 1)
+
+            self.assertEqual(self.tracker.cancel_all(), 1)
+            with self.assertRaises(asyncio.CancelledError):
+                await slow_waiter
+
+        asyncio.run(run())
+
+        self.assertEqual(self.tracker.in_flight(), [])
+        self.assertEqual(self.tracker.get_stats(), {
+            'completed': 1,
+            'failed': 0,
+            'timed_out': 0,
+            'cancelled': 1,
+            'in_flight': 0
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
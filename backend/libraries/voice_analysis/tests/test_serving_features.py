@@ -0,0 +1,140 @@
+"""
+서빙 특징 추출 테스트
+extract_all 결과를 기존 추출기별 코드(파일을 매번 디코딩)와 비교
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import wave
+
+import librosa
+import numpy as np
+
+# 서빙 앱 경로 추가 (app.models 임포트)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'serving'))
+
+from app.features import extract_all
+
+SAMPLE_RATE = 16000
+
+
+def write_test_wav(path, duration=6.0, seed=0):
+    """음높이가 변하는 톤에 주기적인 음절 형태 포락선과 잡음을 더한 16-bit WAV"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 180 + 40 * np.sin(2 * np.pi * 0.5 * t)
+    tone = np.sin(2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE)
+    envelope = np.clip(np.sin(2 * np.pi * 2.5 * t), 0, None) ** 2
+    y = 0.5 * tone * envelope + 0.01 * rng.normal(size=t.size)
+    samples = (np.clip(y, -1, 1) * 32767).astype('<i2')
+    with wave.open(path, 'wb') as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(SAMPLE_RATE)
+        handle.writeframes(samples.tobytes())
+
+
+def reference_pitch_values(y, sr):
+    """기존 프레임별 루프 피치 선택"""
+    pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
+    pitch_values = []
+    for t in range(pitches.shape[1]):
+        index = magnitudes[:, t].argmax()
+        pitch = pitches[index, t]
+        if pitch > 0:
+            pitch_values.append(pitch)
+    return pitch_values
+
+
+def reference_features(audio_path):
+    """기존 ModelInference.extract_features 계산"""
+    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
+    features = []
+
+    mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+    features.extend([mfcc.mean(axis=1), mfcc.std(axis=1)])
+
+    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
+    spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)
+    spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)
+    spectral_contrast = librosa.feature.spectral_contrast(y=y, sr=sr)
+    features.extend([
+        [np.mean(spectral_centroid), np.std(spectral_centroid)],
+        [np.mean(spectral_rolloff), np.std(spectral_rolloff)],
+        [np.mean(spectral_bandwidth), np.std(spectral_bandwidth)],
+        spectral_contrast.mean(axis=1)
+    ])
+
+    zcr = librosa.feature.zero_crossing_rate(y)
+    features.append([np.mean(zcr), np.std(zcr)])
+
+    tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
+    features.append([np.atleast_1d(tempo)[0], len(beats)])
+
+    energy = np.sum(y ** 2) / len(y)
+    features.append([energy, np.std(y ** 2)])
+
+    pitch_values = reference_pitch_values(y, sr)
+    if pitch_values:
+        features.append([np.mean(pitch_values), np.std(pitch_values),
+                         np.min(pitch_values), np.max(pitch_values)])
+    else:
+        features.append([0, 0, 0, 0])
+
+    return np.concatenate([np.array(f, dtype=np.float64).flatten() for f in features])
+
+
+def reference_voice_features(audio_path):
+    """기존 ModelInference.extract_voice_features 계산 (비교 가능한 값만)"""
+    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
+    pitch_values = reference_pitch_values(y, sr)
+    energy = librosa.feature.rms(y=y)
+    onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
+    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
+    zcr = librosa.feature.zero_crossing_rate(y)
+    return {
+        'pitch_mean': float(np.mean(pitch_values)),
+        'pitch_std': float(np.std(pitch_values)),
+        'pitch_range': float(max(pitch_values) - min(pitch_values)),
+        'energy_mean': float(np.mean(energy)),
+        'energy_std': float(np.std(energy)),
+        'speaking_rate': float(len(onset_frames) / (len(y) / sr)),
+        'voice_quality': float(min(1.0, np.mean(spectral_centroid) / 4000)),
+        'articulation_clarity': float(min(1.0, np.mean(zcr) * 2))
+    }
+
+
+class TestExtractAll(unittest.TestCase):
+    """extract_all과 기존 추출기별 계산 비교"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_path = os.path.join(self.temp_dir, 'tone.wav')
+        write_test_wav(self.audio_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_model_features_match_reference(self):
+        """모델 입력 특징 벡터가 기존 코드와 일치하는지 확인 (템포/박자 수 포함)"""
+        expected = reference_features(self.audio_path)
+        actual = extract_all(self.audio_path, include_biomarkers=False).features
+
+        self.assertEqual(actual.shape, expected.shape)
+        np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+    def test_voice_features_match_reference(self):
+        """응답용 음성 특징이 기존 코드와 일치하는지 확인"""
+        expected = reference_voice_features(self.audio_path)
+        actual = extract_all(self.audio_path, include_biomarkers=False).voice_features
+
+        for name, value in expected.items():
+            with self.subTest(feature=name):
+                self.assertAlmostEqual(getattr(actual, name), value, places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
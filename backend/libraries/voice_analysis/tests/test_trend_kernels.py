@@ -0,0 +1,149 @@
+"""
+추세 검정 커널 테스트
+kendall_s / slope_order_statistics 결과를 기존 이중 루프 계산과 비교
+(짧은 시계열 쌍별 경로와 긴 시계열 병합 정렬/구간 선택 경로 모두)
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.timeseries import trend_kernels
+from analysis.timeseries.trend_kernels import kendall_s, pair_count, slope_order_statistics
+
+
+def reference_kendall_s(values):
+    """기존 TrendAnalyzer의 이중 루프 S 통계량"""
+    n = len(values)
+    s = 0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            s += np.sign(values[j] - values[i])
+    return int(s)
+
+
+def reference_sorted_slopes(values):
+    """기존 TrendAnalyzer의 이중 루프 쌍별 기울기 (정렬)"""
+    n = len(values)
+    slopes = []
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            slopes.append((values[j] - values[i]) / (j - i))
+    return np.sort(slopes)
+
+
+def sens_ranks(n):
+    """TrendAnalyzer가 요청하는 순위 (95% 신뢰구간 양끝 + 중앙값) 및 양 극단"""
+    total = pair_count(n)
+    rank_lower = max(0, int(np.floor((total - 1.96 * np.sqrt(total)) / 2)))
+    rank_upper = min(total - 1, int(np.ceil((total + 1.96 * np.sqrt(total)) / 2)))
+    median_ranks = [total // 2] if total % 2 else [total // 2 - 1, total // 2]
+    return [rank_lower, rank_upper] + median_ranks + [0, total - 1]
+
+
+def make_series(kind, n, seed):
+    """테스트 시계열 (random: 연속값, tied: 동점 다수, constant: 상수)"""
+    rng = np.random.default_rng(seed)
+    if kind == 'random':
+        return (np.cumsum(rng.normal(size=n)) + 0.01 * np.arange(n)).tolist()
+    if kind == 'tied':
+        return rng.integers(0, 5, size=n).astype(float).tolist()
+    return [3.5] * n
+
+
+class TrendKernelAssertions:
+    """두 경로에서 공통으로 사용하는 비교 로직"""
+
+    n = 0
+
+    def assert_matches_reference(self, kind, seed=0):
+        values = make_series(kind, self.n, seed)
+
+        self.assertEqual(kendall_s(values), reference_kendall_s(values))
+
+        ranks = sens_ranks(self.n)
+        expected = reference_sorted_slopes(values)[ranks]
+        actual = slope_order_statistics(values, ranks)
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+    def test_random_series(self):
+        """연속값 시계열이 이중 루프 결과와 일치하는지 확인"""
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assert_matches_reference('random', seed)
+
+    def test_tied_series(self):
+        """동점이 많은 시계열이 이중 루프 결과와 일치하는지 확인"""
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assert_matches_reference('tied', seed)
+
+    def test_constant_series(self):
+        """상수 시계열은 S = 0, 모든 기울기 0인지 확인"""
+        self.assert_matches_reference('constant')
+        self.assertEqual(kendall_s(make_series('constant', self.n, 0)), 0)
+
+
+class TestExactPairwisePath(TrendKernelAssertions, unittest.TestCase):
+    """n <= EXACT_PAIRWISE_MAX_N: 쌍별 차이를 한 번에 계산하는 경로"""
+
+    n = 120
+
+    def test_short_series(self):
+        """길이 0~2 시계열 처리 확인"""
+        self.assertEqual(kendall_s([]), 0)
+        self.assertEqual(kendall_s([1.0]), 0)
+        self.assertEqual(kendall_s([1.0, 2.0]), 1)
+        self.assertEqual(slope_order_statistics([1.0, 3.0], [0]), [2.0])
+
+    def test_rank_out_of_range(self):
+        """범위를 벗어난 순위는 ValueError"""
+        with self.assertRaises(ValueError):
+            slope_order_statistics([1.0, 2.0, 3.0], [3])
+
+
+class TestLargeSeriesPath(TrendKernelAssertions, unittest.TestCase):
+    """n > EXACT_PAIRWISE_MAX_N: 병합 정렬 S와 구간 선택 기울기 경로 (임계값을 낮춰 빠르게 실행)"""
+
+    n = 150
+
+    def setUp(self):
+        # 작은 표본과 블록으로 구간 재시도와 여러 행 블록 처리까지 거치도록 설정
+        patches = [
+            mock.patch.object(trend_kernels, 'EXACT_PAIRWISE_MAX_N', 16),
+            mock.patch.object(trend_kernels, 'SLOPE_SAMPLE_SIZE', 200),
+            mock.patch.object(trend_kernels, 'SLOPE_BLOCK_ELEMENTS', 1000),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_uses_large_series_path(self):
+        """임계값을 낮춘 상태에서 긴 시계열 경로를 타는지 확인"""
+        values = make_series('random', self.n, 0)
+        with mock.patch.object(trend_kernels, '_select_slopes',
+                               wraps=trend_kernels._select_slopes) as select, \
+                mock.patch.object(trend_kernels, '_count_strict_inversions',
+                                  wraps=trend_kernels._count_strict_inversions) as inversions:
+            kendall_s(values)
+            slope_order_statistics(values, [0])
+        self.assertEqual(select.call_count, 1)
+        self.assertEqual(inversions.call_count, 1)
+
+    def test_result_independent_of_seed(self):
+        """표본 시드와 무관하게 같은 값을 반환하는지 확인"""
+        values = make_series('tied', self.n, 1)
+        ranks = sens_ranks(self.n)
+        expected = slope_order_statistics(values, ranks, seed=0)
+        for seed in (1, 7, 42):
+            self.assertEqual(slope_order_statistics(values, ranks, seed=seed), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
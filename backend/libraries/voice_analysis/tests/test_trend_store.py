@@ -0,0 +1,146 @@
+"""
+TrendStore 테스트
+SQLite 저장소로 링 버퍼 삽입, 중복 제거, 누적 통계, 최초 1회 구축 검증
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.timeseries.trend_store import (
+    SQLiteTrendStoreBackend,
+    TrendState,
+    TrendStore,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 9, 0, 0)
+
+
+def make_record(day, dri, sdi=None):
+    """BASE_TIME + day일 시점의 분석 기록"""
+    indicators = {'DRI': dri}
+    if sdi is not None:
+        indicators['SDI'] = sdi
+    return {
+        'analysis_timestamp': (BASE_TIME + timedelta(days=day)).isoformat(),
+        'indicators': indicators
+    }
+
+
+def entry_days(state):
+    """링 버퍼 항목의 BASE_TIME 기준 일수"""
+    return [(datetime.fromisoformat(timestamp) - BASE_TIME).days for timestamp, _, _ in state.entries]
+
+
+class TestTrendState(unittest.TestCase):
+    """TrendState 링 버퍼 및 누적 통계 테스트"""
+
+    def test_late_arrival_into_full_buffer(self):
+        """가득 찬 버퍼에 늦게 도착한 기록은 시간 순 위치에 들어가고 가장 오래된 항목이 밀려나는지 확인"""
+        state = TrendState('user1', window_size=4)
+        for day in (0, 2, 4, 6):
+            self.assertTrue(state.add(make_record(day, 0.1 * day)))
+
+        self.assertTrue(state.add(make_record(3, 0.3)))
+        self.assertEqual(entry_days(state), [2, 3, 4, 6])
+
+        # 버퍼보다 오래된 기록은 누적 통계에만 반영
+        self.assertTrue(state.add(make_record(1, 0.9)))
+        self.assertEqual(entry_days(state), [2, 3, 4, 6])
+        self.assertEqual(state.total_records, 6)
+        self.assertEqual(state.stats['DRI'].count, 6)
+        self.assertEqual(state.stats['DRI'].maximum, 0.9)
+
+    def test_duplicate_timestamps_ignored(self):
+        """같은 타임스탬프의 기록은 버퍼와 통계에 한 번만 반영되는지 확인"""
+        state = TrendState('user1', window_size=5)
+        self.assertTrue(state.add(make_record(0, 0.2)))
+        self.assertTrue(state.add(make_record(1, 0.4)))
+
+        self.assertFalse(state.add(make_record(1, 0.4)))
+        self.assertFalse(state.add(make_record(0, 0.7)))
+        self.assertEqual(entry_days(state), [0, 1])
+        self.assertEqual(state.total_records, 2)
+        self.assertEqual(state.stats['DRI'].count, 2)
+
+    def test_running_stats_match_batch_statistics(self):
+        """누적 통계가 전체 값으로 계산한 평균/표준편차/최소/최대와 일치하는지 확인"""
+        state = TrendState('user1', window_size=3)
+        values = [0.31, 0.52, 0.18, 0.77, 0.45, 0.66, 0.29]
+        for day, value in enumerate(values):
+            state.add(make_record(day, value, sdi={'value': 1 - value}))
+
+        summary = state.statistics()
+        self.assertEqual(summary['DRI']['count'], len(values))
+        self.assertAlmostEqual(summary['DRI']['mean'], statistics.mean(values))
+        self.assertAlmostEqual(summary['DRI']['std'], statistics.stdev(values))
+        self.assertEqual(summary['DRI']['min'], min(values))
+        self.assertEqual(summary['DRI']['max'], max(values))
+        self.assertAlmostEqual(summary['SDI']['mean'], statistics.mean(1 - v for v in values))
+
+        # 직렬화 후에도 동일
+        restored = TrendState.from_dict(state.to_dict())
+        self.assertEqual(restored.statistics(), summary)
+        self.assertEqual(entry_days(restored), [4, 5, 6])
+
+
+class TestTrendStoreSQLite(unittest.TestCase):
+    """SQLite 저장소 기반 TrendStore 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.backend = SQLiteTrendStoreBackend(os.path.join(self.temp_dir, 'trend.sqlite3'))
+        self.store = TrendStore(backend=self.backend, window_size=10)
+        self.bootstrap_calls = 0
+
+    def tearDown(self):
+        self.backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _bootstrap(self):
+        self.bootstrap_calls += 1
+        return [make_record(day, 0.1 + 0.01 * day) for day in range(5)]
+
+    def test_bootstrap_runs_once(self):
+        """요약 문서가 없을 때만 과거 기록으로 구축하고 이후에는 문서만 읽는지 확인"""
+        state = self.store.load('user1', self._bootstrap)
+        self.assertEqual(len(state), 5)
+
+        self.store.record('user1', make_record(5, 0.5))
+        state = self.store.load('user1', self._bootstrap)
+
+        self.assertEqual(self.bootstrap_calls, 1)
+        self.assertEqual(len(state), 6)
+        self.assertEqual(state.total_records, 6)
+        self.assertEqual(self.store.get_stats()['bootstraps'], 1)
+
+    def test_record_without_summary_does_not_skip_bootstrap(self):
+        """요약 문서가 없을 때 record는 문서를 만들지 않아 다음 조회에서 과거 기록으로 구축되는지 확인"""
+        self.assertIsNone(self.store.record('user1', make_record(5, 0.5)))
+        self.assertIsNone(self.backend.get('user1'))
+
+        state = self.store.load('user1', self._bootstrap)
+        self.assertEqual(self.bootstrap_calls, 1)
+        self.assertEqual(len(state), 5)
+        self.assertEqual(self.store.get_stats()['skipped'], 1)
+
+    def test_record_duplicate_does_not_write(self):
+        """이미 반영된 기록은 다시 저장하지 않는지 확인"""
+        self.store.load('user1', self._bootstrap)
+        self.store.record('user1', make_record(5, 0.5))
+        state = self.store.record('user1', make_record(5, 0.5))
+
+        self.assertEqual(len(state), 6)
+        self.assertEqual(state.total_records, 6)
+        self.assertEqual(self.store.get_stats()['records'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()